@@ -0,0 +1,30 @@
+def percentile(values, percent):
+    """Gets a percentile of a list of values using the nearest-rank method.
+
+    Args:
+        values (list[float]): The values.
+        percent (float): The percentile to get, between 0 and 100.
+
+    Returns:
+        (float) The value at that percentile, or 0 if there are no values.
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(percent / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(label, values):
+    """Prints a one-line summary of a list of measurements.
+
+    Args:
+        label (str): What was measured.
+        values (list[float]): The measurements.
+    """
+    if not values:
+        print('{0}: no samples'.format(label))
+        return
+    print('{0}: n={1} min={2:.2f} p50={3:.2f} p95={4:.2f} p99={5:.2f} max={6:.2f}'.format(
+        label, len(values), min(values), percentile(values, 50), percentile(values, 95), percentile(values, 99),
+        max(values)))
@@ -0,0 +1,156 @@
+"""Compares the size and the encode and decode time of the callbacks sent for one step, using the current callback
+schema and the schema it replaced (callback names as strings, names of every sender in full, the inputs of the step
+in every Step callback, and a new batch for every frame).
+
+Run from the root of the repository:
+
+    python -m benchmarks.callback_schema -n 10000
+"""
+import argparse
+import time
+
+from core.loadbalancer import NameInterner, fill_protobuf_message
+from core.protobuf.build import data_pb2
+from benchmarks import summarize
+
+# The callbacks sent by a step of a workflow with one next step and one flag, and whether each carries data
+STEP_CALLBACKS = (('Step', 'Step Started', False),
+                  ('Step', 'Function Execution Success', True),
+                  ('Workflow', 'Step Execution Success', True),
+                  ('Flag', 'Flag Success', False),
+                  ('NextStep', 'Next Step Taken', False),
+                  ('Step', 'Conditionals Executed', False),
+                  ('Workflow', 'Next Step Found', False))
+
+RESULT = '{"name": "step_one", "result": "REPEATING: Hello World", "status": "Success"}'
+
+
+def cmd_line():
+    parser = argparse.ArgumentParser("Callback schema benchmark")
+    parser.add_argument('-n', '--iterations', type=int, default=10000, help='Number of steps to encode')
+    return parser.parse_args()
+
+
+class MockStep(object):
+    def __init__(self):
+        self.name = 'repeat_back_to_me_step'
+        self.uid = 'a6fb2a3e4f2b4ce8a2a4b38f6b0f0d1c'
+        self.app = 'HelloWorld'
+        self.action = 'repeatBackToMe'
+        self.inputs = {'call': 'Hello World', 'count': 3}
+
+    def get_execution_uid(self):
+        return 'c5b3f6a27b6d4b1c9a6f4e9d2e8a7b10'
+
+
+class MockWorkflow(object):
+    def __init__(self):
+        self.name = 'helloWorldWorkflow'
+        self.uid = 'f1e2d3c4b5a697887766554433221100'
+
+
+class MockElement(object):
+    def __init__(self):
+        self.uid = '0f9e8d7c6b5a49382716051423324150'
+        self.app = 'HelloWorld'
+
+
+SENDERS = {'Step': MockStep(), 'Workflow': MockWorkflow(), 'Flag': MockElement(), 'NextStep': MockElement()}
+
+
+def fill_legacy_message(packet, sender, workflow_execution_uid, object_type, callback_name, data=None):
+    """Fills in a message the way workers did before the callback IDs, name interning and selective inputs.
+    """
+    if object_type == 'Workflow':
+        if data is not None:
+            packet.type = data_pb2.Message.WORKFLOWPACKETDATA
+            wf_packet = packet.workflow_packet_data
+            wf_packet.additional_data = data
+        else:
+            packet.type = data_pb2.Message.WORKFLOWPACKET
+            wf_packet = packet.workflow_packet
+        wf_packet.sender.name = sender.name
+        wf_packet.sender.uid = sender.uid
+        wf_packet.sender.workflow_execution_uid = workflow_execution_uid
+        wf_packet.callback_name = callback_name
+    elif object_type == 'Step':
+        if data is not None:
+            packet.type = data_pb2.Message.STEPPACKETDATA
+            step_packet = packet.step_packet_data
+            step_packet.additional_data = data
+        else:
+            packet.type = data_pb2.Message.STEPPACKET
+            step_packet = packet.step_packet
+        step_packet.sender.name = sender.name
+        step_packet.sender.uid = sender.uid
+        step_packet.sender.workflow_execution_uid = workflow_execution_uid
+        step_packet.sender.execution_uid = sender.get_execution_uid()
+        step_packet.sender.app = sender.app
+        step_packet.sender.action = sender.action
+        for key, value in sender.inputs.items():
+            step_packet.sender.input[key] = str(value)
+        step_packet.callback_name = callback_name
+    else:
+        packet.type = data_pb2.Message.GENERALPACKET
+        general_packet = packet.general_packet
+        general_packet.sender.uid = sender.uid
+        general_packet.sender.workflow_execution_uid = workflow_execution_uid
+        general_packet.sender.app = sender.app
+        general_packet.callback_name = callback_name
+
+
+def encode_legacy_step(execution_uid):
+    batch = data_pb2.MessageBatch()
+    for object_type, callback_name, has_data in STEP_CALLBACKS:
+        fill_legacy_message(batch.messages.add(), SENDERS[object_type], execution_uid, object_type, callback_name,
+                            data=RESULT if has_data else None)
+    return batch.SerializeToString()
+
+
+def encode_current_step(batch, execution_uid, names):
+    for object_type, callback_name, has_data in STEP_CALLBACKS:
+        kwargs = {'object_type': object_type, 'callback_name': callback_name}
+        if has_data:
+            kwargs['data'] = RESULT
+        fill_protobuf_message(batch.messages.add(), SENDERS[object_type], execution_uid, names=names, **kwargs)
+    names.declare(batch)
+    packet_bytes = batch.SerializeToString()
+    batch.Clear()
+    return packet_bytes
+
+
+def decode_step(packet_bytes):
+    batch = data_pb2.MessageBatch()
+    batch.ParseFromString(packet_bytes)
+    return batch
+
+
+def measure(label, encode, iterations):
+    execution_uid = 'e0d1c2b3a4958677685940312a1b2c3d'
+    sizes = []
+    encode_times = []
+    decode_times = []
+    for _ in range(iterations):
+        start = time.time()
+        packet_bytes = encode(execution_uid)
+        encode_times.append((time.time() - start) * 1000000)
+        start = time.time()
+        decode_step(packet_bytes)
+        decode_times.append((time.time() - start) * 1000000)
+        sizes.append(len(packet_bytes))
+    summarize('{0} bytes per step'.format(label), sizes)
+    summarize('{0} encode per step (us)'.format(label), encode_times)
+    summarize('{0} decode per step (us)'.format(label), decode_times)
+
+
+def run(iterations):
+    measure('legacy', encode_legacy_step, iterations)
+    # The first step of a session also carries the declarations of its names, which later steps only refer to
+    batch = data_pb2.MessageBatch()
+    names = NameInterner()
+    measure('current', lambda execution_uid: encode_current_step(batch, execution_uid, names), iterations)
+
+
+if __name__ == '__main__':
+    args = cmd_line()
+    run(args.iterations)
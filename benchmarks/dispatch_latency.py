@@ -0,0 +1,75 @@
+"""Measures the time from Controller.execute_workflow to the first callback received from the worker.
+
+Run from the root of the repository (certificates must already be generated):
+
+    python -m benchmarks.dispatch_latency -n 50
+"""
+import argparse
+import threading
+import time
+
+import apps
+import core.config.config
+from core.case.callbacks import WorkflowExecutionStart, WorkflowShutdown
+from core.controller import Controller
+from core.helpers import import_all_flags, import_all_filters
+from tests import config
+from tests.util.thread_control import modified_setup_worker_env
+from benchmarks import summarize
+
+
+def cmd_line():
+    parser = argparse.ArgumentParser("Dispatch latency benchmark")
+    parser.add_argument('-n', '--iterations', type=int, default=50, help='Number of workflows to execute')
+    parser.add_argument('-p', '--processes', type=int, default=2, help='Number of worker processes')
+    return parser.parse_args()
+
+
+def setup_environment(num_processes):
+    apps.cache_apps(config.test_apps_path)
+    core.config.config.load_app_apis(apps_path=config.test_apps_path)
+    core.config.config.flags = import_all_flags('tests.util.flagsfilters')
+    core.config.config.filters = import_all_filters('tests.util.flagsfilters')
+    core.config.config.load_flagfilter_apis(path=config.function_api_path)
+    core.config.config.num_processes = num_processes
+
+
+def run(iterations, num_processes):
+    setup_environment(num_processes)
+    controller = Controller()
+    controller.load_playbook(resource=config.test_workflows_path + 'basicWorkflowTest.playbook')
+    controller.initialize_threading(worker_environment_setup=modified_setup_worker_env)
+
+    started = {}
+    first_callback = {}
+    done = threading.Event()
+
+    def on_start(sender, **kwargs):
+        first_callback[sender.workflow_execution_uid] = time.time()
+
+    def on_shutdown(sender, **kwargs):
+        done.set()
+
+    WorkflowExecutionStart.connect(on_start)
+    WorkflowShutdown.connect(on_shutdown)
+
+    # Warm up the workers so that process start-up is not measured
+    done.clear()
+    controller.execute_workflow('basicWorkflowTest', 'helloWorldWorkflow')
+    done.wait(timeout=30)
+
+    for _ in range(iterations):
+        done.clear()
+        start = time.time()
+        uid = controller.execute_workflow('basicWorkflowTest', 'helloWorldWorkflow')
+        started[uid] = start
+        done.wait(timeout=30)
+
+    controller.shutdown_pool()
+    latencies = [(first_callback[uid] - start) * 1000 for uid, start in started.items() if uid in first_callback]
+    summarize('dispatch-to-first-callback (ms)', latencies)
+
+
+if __name__ == '__main__':
+    args = cmd_line()
+    run(args.iterations, args.processes)
@@ -0,0 +1,86 @@
+import logging
+import math
+import threading
+
+import core.config.config
+
+logger = logging.getLogger(__name__)
+
+
+class Autoscaler(object):
+    def __init__(self, executor):
+        """Initializes an Autoscaler, which grows and shrinks the worker pool of a MultiprocessedExecutor to match
+        the number of queued workflows and how busy the workers are.
+
+        Args:
+            executor (MultiprocessedExecutor): The executor whose worker pool will be scaled.
+        """
+        self.executor = executor
+        self.min_processes = max(1, core.config.config.min_processes)
+        self.max_processes = max(self.min_processes, core.config.config.max_processes)
+        self.interval = core.config.config.autoscale_interval
+        self.wait_threshold = core.config.config.autoscale_wait_threshold
+        self.idle_timeout = core.config.config.worker_idle_timeout
+        self.worker_capacity = max(1, core.config.config.worker_concurrency)
+        self.__exit = threading.Event()
+
+    def run(self):
+        """Re-evaluates the size of the worker pool every autoscale_interval seconds until shut down.
+        """
+        while not self.__exit.wait(self.interval):
+            try:
+                self.scale()
+            except Exception:
+                logger.exception('Error while scaling the worker pool')
+
+    def shutdown(self):
+        """Stops the run loop.
+        """
+        self.__exit.set()
+
+    def scale(self):
+        """Spawns or retires workers according to the current state of the worker pool.
+        """
+        stats = self.executor.manager.get_pool_stats()
+        num_workers = self.executor.count_workers() - stats['retiring']
+        to_spawn, to_retire = self.plan(stats, num_workers)
+        if to_spawn:
+            logger.info('Scaling up worker pool by {0} workers'.format(to_spawn))
+        for _ in range(to_spawn):
+            self.executor.spawn_worker()
+        if to_retire:
+            logger.info('Scaling down worker pool by {0} workers'.format(to_retire))
+        for _ in range(to_retire):
+            self.executor.retire_worker()
+
+    def plan(self, stats, num_workers):
+        """Decides how many workers should be spawned or retired.
+
+        Args:
+            stats (dict): The state of the worker pool, as returned by LoadBalancer.get_pool_stats.
+            num_workers (int): The number of running worker processes started by the pool which are not being
+                retired, including those which have not yet registered with the LoadBalancer.
+
+        Returns:
+            (tuple(int, int)) The number of workers to spawn and the number of workers to retire.
+        """
+        if num_workers < self.min_processes:
+            return self.min_processes - num_workers, 0
+
+        if stats['queued']:
+            starting = num_workers - (stats['workers'] - stats['standalone_workers'])
+            if starting > 0 or num_workers >= self.max_processes:
+                return 0, 0
+            if self.__estimate_wait(stats) <= self.wait_threshold:
+                return 0, 0
+            needed = int(math.ceil(float(stats['queued']) / self.worker_capacity))
+            return min(needed, self.max_processes - num_workers), 0
+
+        idle = sum(1 for idle_time in stats['idle_workers'] if idle_time >= self.idle_timeout)
+        return 0, max(0, min(idle, num_workers - self.min_processes))
+
+    @staticmethod
+    def __estimate_wait(stats):
+        if stats['average_execution_time'] is None or not stats['total_slots']:
+            return float('inf')
+        return stats['queued'] * stats['average_execution_time'] / stats['total_slots']
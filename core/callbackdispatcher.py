@@ -0,0 +1,214 @@
+import logging
+import threading
+import time
+from collections import deque
+
+import core.config.config
+from core.case import callbacks
+from core.instrumentation import Histogram, Gauge
+
+logger = logging.getLogger(__name__)
+
+SINK_OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_newest')
+
+SINKS = ('cases', 'results', 'metrics', 'streams', 'default')
+
+# The sink which the receivers defined in each module are dispatched to. The case logging callbacks are dispatched to
+# the 'cases' sink, and receivers from any other module, such as the executor, to the 'default' sink.
+SINK_MODULES = {'server.workflowresults': 'results',
+                'server.metrics': 'metrics',
+                'server.blueprints.events': 'streams',
+                'server.blueprints.workflowresult': 'streams'}
+
+
+class CallbackSink(object):
+    def __init__(self, name, max_size=None, overflow_policy=None):
+        """Initializes a CallbackSink, which hands callbacks to its receivers in its own thread, in the order in which
+        they were received.
+
+        Args:
+            name (str): The name of the sink.
+            max_size (int, optional): The maximum number of callbacks waiting to be handled, or 0 for no limit.
+                Defaults to the callback_sink_queue_size in the config.
+            overflow_policy (str, optional): What happens to a callback when the queue is full. 'block' waits for
+                room, 'drop_oldest' drops the oldest waiting callback, and 'drop_newest' drops the new callback.
+                Defaults to 'block'.
+
+        Raises:
+            ValueError: If the overflow policy is not one of the supported policies.
+        """
+        self.name = name
+        self.max_size = max(0, max_size if max_size is not None else core.config.config.callback_sink_queue_size)
+        self.overflow_policy = overflow_policy if overflow_policy is not None else 'block'
+        if self.overflow_policy not in SINK_OVERFLOW_POLICIES:
+            raise ValueError('Unknown callback sink overflow policy {0}'.format(self.overflow_policy))
+        # Seconds between a callback being received and being handed to the receivers, and the number waiting
+        self.lag = Histogram()
+        self.depth = Gauge()
+        self.handled = 0
+        self.dropped = 0
+        self.thread = None
+
+        self.__callbacks = deque()
+        self.__stopping = False
+        self.__lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+
+    def start(self):
+        """Starts handing callbacks to the receivers.
+        """
+        self.__stopping = False
+        self.thread = threading.Thread(target=self.run, name='CallbackSink-{0}'.format(self.name))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def put(self, receivers, sender, kwargs):
+        """Queues a callback to be handed to some of the receivers of its signal.
+
+        Args:
+            receivers (list[func]): The receivers of the signal which belong to this sink.
+            sender (object): The sender of the callback.
+            kwargs (dict): The keyword arguments to call the receivers with.
+
+        Returns:
+            (bool) True if the callback was queued, False if it was dropped.
+        """
+        with self.__lock:
+            if self.max_size and len(self.__callbacks) >= self.max_size:
+                if self.overflow_policy == 'drop_newest':
+                    self.dropped += 1
+                    return False
+                elif self.overflow_policy == 'drop_oldest':
+                    self.__callbacks.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self.__callbacks) >= self.max_size and not self.__stopping:
+                        self.__not_full.wait()
+            self.__callbacks.append((receivers, sender, kwargs, time.time()))
+            self.depth.set(len(self.__callbacks))
+            self.__not_empty.notify()
+            return True
+
+    def run(self):
+        """Hands the queued callbacks to their receivers until the sink is stopped and every queued callback has been
+        handled.
+        """
+        while True:
+            with self.__lock:
+                while not self.__callbacks and not self.__stopping:
+                    self.__not_empty.wait()
+                if not self.__callbacks:
+                    return
+                receivers, sender, kwargs, queued_at = self.__callbacks.popleft()
+                self.depth.set(len(self.__callbacks))
+                self.__not_full.notify()
+            self.lag.observe(time.time() - queued_at)
+            for receiver in receivers:
+                try:
+                    receiver(sender, **kwargs)
+                except Exception:
+                    logger.exception('Error in {0} callback receiver {1}'.format(self.name, receiver))
+            self.handled += 1
+
+    def stop(self, timeout=None):
+        """Stops the sink once every queued callback has been handled.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait for the queued callbacks to be handled.
+                Defaults to None, which waits until they have been.
+        """
+        with self.__lock:
+            self.__stopping = True
+            self.__not_empty.notify_all()
+            self.__not_full.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=timeout)
+
+    def get_metrics(self):
+        """Gets how far behind the sink is.
+
+        Returns:
+            (dict) The overflow policy, the maximum number of waiting callbacks, the current and highest number of
+                waiting callbacks, a histogram of the seconds callbacks waited before being handled, and the number of
+                callbacks handled and dropped.
+        """
+        return {'policy': self.overflow_policy,
+                'max_queued': self.max_size,
+                'queued': self.depth.as_json(),
+                'lag': self.lag.as_json(),
+                'handled': self.handled,
+                'dropped': self.dropped}
+
+
+class CallbackDispatcher(object):
+    def __init__(self, max_size=None, overflow_policies=None):
+        """Initializes a CallbackDispatcher, which hands the callbacks received from the workers to the receivers of
+        their signals through one CallbackSink for each kind of receiver, so that a slow receiver only delays the
+        receivers of its own sink. Callbacks are handled in the order they were received within each sink.
+
+        Args:
+            max_size (int, optional): The maximum number of callbacks waiting in each sink. Defaults to the
+                callback_sink_queue_size in the config.
+            overflow_policies (dict{str: str}, optional): The overflow policy of each sink. Defaults to the
+                callback_sink_overflow_policies in the config. Sinks without a policy block.
+        """
+        overflow_policies = (overflow_policies if overflow_policies is not None
+                             else core.config.config.callback_sink_overflow_policies)
+        self.sinks = {name: CallbackSink(name, max_size=max_size, overflow_policy=overflow_policies.get(name, None))
+                      for name in SINKS}
+
+    @staticmethod
+    def get_sink(callback, receiver):
+        """Gets the sink that a receiver of a signal belongs to.
+
+        Args:
+            callback (Signal): The signal.
+            receiver (func): The receiver.
+
+        Returns:
+            (str) The name of the sink.
+        """
+        if receiver is callbacks.case_loggers.get(callback, None):
+            return 'cases'
+        return SINK_MODULES.get(getattr(receiver, '__module__', None), 'default')
+
+    def start(self):
+        """Starts every sink.
+        """
+        for sink in self.sinks.values():
+            sink.start()
+
+    def dispatch(self, callback, sender, data):
+        """Queues a callback for each sink which has receivers for it.
+
+        Args:
+            callback (Signal): The signal of the callback.
+            sender (object): The sender of the callback.
+            data (dict): The data of the callback, if any.
+        """
+        kwargs = {'data': data} if data else {}
+        sink_receivers = {}
+        for receiver in callback.receivers_for(sender):
+            sink_receivers.setdefault(self.get_sink(callback, receiver), []).append(receiver)
+        for sink, receivers in sink_receivers.items():
+            self.sinks[sink].put(receivers, sender, kwargs)
+
+    def stop(self, timeout=None):
+        """Stops every sink once its queued callbacks have been handled.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait for all of the sinks. Defaults to None,
+                which waits until every queued callback has been handled.
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        for sink in self.sinks.values():
+            sink.stop(timeout=max(0, deadline - time.time()) if deadline is not None else None)
+
+    def get_metrics(self):
+        """Gets how far behind each sink is.
+
+        Returns:
+            (dict{str: dict}) The metrics of each sink by its name.
+        """
+        return {name: sink.get_metrics() for name, sink in self.sinks.items()}
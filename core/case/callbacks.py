@@ -12,6 +12,9 @@ import core.case.subscription as case_subscription
 from core.case import database
 from core.case.database import Event
 
+# The callback of each signal which logs its events to the cases subscribed to them
+case_loggers = {}
+
 
 def __add_entry_to_case_wrapper(sender, data, event_type, entry_message, message_name):
     if isinstance(sender, dict):
@@ -53,9 +56,36 @@ def __construct_logging_signal(event_type, message_name, entry_message):
                               entry_message=entry_message,
                               message_name=message_name)
     signal.connect(signal_callback)
+    case_loggers[signal] = signal_callback
     return signal, signal_callback  # need to return a tuple and save it to avoid weak reference
 
 
+def has_listeners(signal):
+    """Checks whether anything other than the case logging callback of a signal is connected to it.
+
+    Args:
+        signal (Signal): The signal to check.
+
+    Returns:
+        (bool) True if the signal has other receivers, False otherwise.
+    """
+    case_logger = case_loggers.get(signal, None)
+    return any(receiver_id != id(case_logger) for receiver_id in list(signal.receivers))
+
+
+def get_message_name(signal):
+    """Gets the name under which cases subscribe to the events of a signal.
+
+    Args:
+        signal (Signal): The signal.
+
+    Returns:
+        (str) The name of the message, or None if the events of the signal are not logged to cases.
+    """
+    case_logger = case_loggers.get(signal, None)
+    return case_logger.keywords['message_name'] if case_logger is not None else None
+
+
 # Controller callbacks
 SchedulerStart, __scheduler_start_callback = __construct_logging_signal('System',
                                                                         EVENT_SCHEDULER_START,
@@ -150,6 +180,10 @@ FilterError, __filter_error_callback = __construct_logging_signal('Filter', 'Fil
 
 # Load Balancer callbacks
 data_sent = Signal('sent')
+# Worker pool callbacks
+WorkerSpawned, __worker_spawned_callback = __construct_logging_signal('System', 'Worker Spawned', 'Worker spawned')
+WorkerRetired, __worker_retired_callback = __construct_logging_signal('System', 'Worker Retired', 'Worker retired')
+WorkerCrashed, __worker_crashed_callback = __construct_logging_signal('System', 'Worker Crashed', 'Worker crashed')
 
 # Trigger Step callbacks
 TriggerStepAwaitingData, __trigger_step_awaiting_data = __construct_logging_signal('Trigger',
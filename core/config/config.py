@@ -40,7 +40,16 @@ def write_values_to_file(keys=None):
         keys = ['apps_path', 'workflows_path', 'templates_path', 'db_path', 'case_db_path', 'certificate_path',
                 'private_key_path', 'default_appdevice_export_path', 'default_case_export_path', 'keywords_path',
                 'logging_config_path', 'notifications', 'reinitialize_case_db_on_startup', 'tls_version', 'https',
-                'host', 'port', 'walkoff_db_type', 'case_db_type', 'num_threads', 'debug', 'default_server']
+                'host', 'port', 'walkoff_db_type', 'case_db_type', 'num_threads', 'debug', 'default_server',
+                'min_processes', 'max_processes', 'autoscale_interval', 'autoscale_wait_threshold',
+                'worker_idle_timeout', 'workflow_priority_weights', 'default_workflow_priority', 'playbook_weights',
+                'worker_concurrency', 'workflow_cache_size', 'callback_batch_size', 'callback_batch_window',
+                'max_queued_workflows', 'queue_overflow_policy', 'queue_block_timeout', 'queue_retry_after',
+                'request_socket_hwm', 'comm_socket_hwm', 'results_socket_hwm', 'worker_heartbeat_interval',
+                'worker_heartbeat_timeout', 'worker_failure_policy', 'max_workflow_requeues', 'zmq_requests_address',
+                'zmq_results_address', 'zmq_communication_address', 'zmq_allowed_addresses',
+                'filter_unused_callbacks', 'callback_sink_queue_size', 'callback_sink_overflow_policies',
+                'callback_sink_drain_timeout']
     self = sys.modules[__name__]
 
     output = {}
@@ -76,6 +85,81 @@ JINJA_GLOBALS = {splitext(fn)[0]: getattr(importlib.import_module("core.keywords
 
 num_processes = 5
 
+# Addresses that the server binds the sockets which workers connect to. Workers started with startWorker.py on other
+# hosts connect to the same ports on the server's host. Workers are only accepted from zmq_allowed_addresses, or from
+# any address if it is empty, and must hold the client certificate in the private keys directory.
+zmq_requests_address = 'tcp://127.0.0.1:5555'
+zmq_results_address = 'tcp://127.0.0.1:5556'
+zmq_communication_address = 'tcp://127.0.0.1:5557'
+zmq_allowed_addresses = ['127.0.0.1']
+
+# The worker pool starts with num_processes workers and is scaled between min_processes and max_processes. Workers are
+# added when the estimated time to drain the queued workflows exceeds autoscale_wait_threshold seconds, and workers which
+# have been idle for worker_idle_timeout seconds are retired. The pool is re-evaluated every autoscale_interval seconds.
+min_processes = 1
+max_processes = 10
+autoscale_interval = 1.0
+autoscale_wait_threshold = 1.0
+worker_idle_timeout = 60
+
+# Queued workflows are dispatched by priority class, each class getting a share of the dispatches proportional to its
+# weight. Within a class, workflows are shared between playbooks in proportion to playbook_weights, where playbooks which
+# are not listed have a weight of 1.
+workflow_priority_weights = {'high': 16, 'normal': 4, 'low': 1}
+default_workflow_priority = 'normal'
+playbook_weights = {}
+
+# At most max_queued_workflows workflows wait for a worker, 0 meaning no limit. When the queue is full, a new workflow is
+# rejected ('reject'), replaces the oldest queued workflow ('drop_oldest'), or waits up to queue_block_timeout seconds
+# for room in the queue before being rejected ('block'). Rejected submissions are told to retry after the estimated
+# time to drain the queue, or after queue_retry_after seconds if no workflow has finished yet.
+max_queued_workflows = 0
+queue_overflow_policy = 'reject'
+queue_block_timeout = 5.0
+queue_retry_after = 5
+
+# Maximum number of messages buffered on each ZMQ socket between the server and the workers. When the results socket is
+# full, workers wait before sending more callbacks.
+request_socket_hwm = 1000
+comm_socket_hwm = 1000
+results_socket_hwm = 1000
+
+# Number of workflows each worker process executes concurrently, each in its own greenlet
+worker_concurrency = 1
+
+# Workers send a heartbeat every worker_heartbeat_interval seconds. A worker which has not been heard from for
+# worker_heartbeat_timeout seconds, or whose process has died, is replaced. The workflows it was executing are requeued
+# up to max_workflow_requeues times or failed, according to worker_failure_policy ('requeue' or 'fail'), which can be
+# overridden when a workflow is executed.
+worker_heartbeat_interval = 1.0
+worker_heartbeat_timeout = 30.0
+worker_failure_policy = 'requeue'
+max_workflow_requeues = 1
+
+# Number of constructed workflows each worker keeps to copy for later executions. Executions of a cached workflow are
+# dispatched without its definition. A size of 0 disables the cache.
+workflow_cache_size = 64
+
+# Callbacks sent from a worker are batched into a single frame which is sent when it holds callback_batch_size
+# callbacks, when callback_batch_window seconds have passed since the first callback was batched, or when the workflow
+# finishes, pauses or waits for trigger data. A batch size of 1 sends every callback immediately.
+callback_batch_size = 32
+callback_batch_window = 0.05
+
+# Workers only send the callbacks which are consumed on the server, by a case subscription, the metrics, the workflow
+# results, a connected event stream or any other listener. The server tells the workers whenever this changes.
+filter_unused_callbacks = True
+
+# Received callbacks are handed to the receivers of each sink (case events, workflow results, metrics, event streams
+# and any other receivers) in a separate thread, through a queue holding at most callback_sink_queue_size callbacks
+# (0 for no limit). When the queue of a sink is full, its overflow policy either holds up the receipt of callbacks until
+# there is room ('block'), drops the oldest queued callback ('drop_oldest') or drops the new one ('drop_newest'). On
+# shutdown, the sinks are given callback_sink_drain_timeout seconds to handle the callbacks already received.
+callback_sink_queue_size = 10000
+callback_sink_overflow_policies = {'cases': 'block', 'results': 'block', 'metrics': 'drop_oldest',
+                                   'streams': 'drop_oldest', 'default': 'block'}
+callback_sink_drain_timeout = 10
+
 # Function Dict Paths/Initialization
 
 app_apis = {}
@@ -136,10 +220,16 @@ def load_flagfilter_apis(path=None):
 
 
 def initialize():
+    load_config()
+    load_execution_environment()
+
+
+def load_execution_environment():
+    """Loads the apps and their APIs, and the flags and filters, which workflows need to be executed.
+    """
     global filters
     global flags
 
-    load_config()
     from core.helpers import import_all_filters, import_all_flags
     from apps import cache_apps
     cache_apps(core.config.paths.apps_path)
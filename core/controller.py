@@ -215,7 +215,8 @@ class Controller(object):
         """
         self.playbook_store.update_playbook_name(old_playbook, new_playbook)
 
-    def execute_workflow(self, playbook_name, workflow_name, start=None, start_input=None):
+    def execute_workflow(self, playbook_name, workflow_name, start=None, start_input=None, priority=None,
+                         failure_policy=None):
         """Executes a workflow.
 
         Args:
@@ -223,13 +224,23 @@ class Controller(object):
             workflow_name (str): Workflow to execute.
             start (str, optional): The name of the first, or starting step. Defaults to None.
             start_input (dict, optional): The input to the starting step of the workflow. Defaults to None.
+            priority (str, optional): The priority class of the workflow while it waits for a worker. Defaults to the
+                default_workflow_priority in the config.
+            failure_policy (str, optional): Whether the workflow is requeued ('requeue') or failed ('fail') if its
+                worker crashes. Defaults to the worker_failure_policy in the config.
 
         Returns:
             The execution UID if successful, None otherwise.
+
+        Raises:
+            UnknownPriority: If the priority class is not configured.
+            QueueFull: If too many workflows are waiting for a worker and the workflow was rejected.
+            ValueError: If the failure policy is not one of the supported policies.
         """
         if self.playbook_store.is_workflow_registered(playbook_name, workflow_name):
             workflow = self.playbook_store.get_workflow(playbook_name, workflow_name)
-            return self.executor.execute_workflow(workflow, start, start_input)
+            return self.executor.execute_workflow(workflow, start, start_input, priority=priority,
+                                                  playbook_name=playbook_name, failure_policy=failure_policy)
         else:
             logger.error('Attempted to execute playbook which does not exist in controller')
             return None, 'Attempted to execute playbook which does not exist in controller'
@@ -237,6 +248,44 @@ class Controller(object):
     def get_waiting_workflows(self):
         return self.executor.get_waiting_workflows()
 
+    def get_queue_position(self, execution_uid):
+        """Gets the position of a workflow which is waiting for a worker.
+
+        Args:
+            execution_uid (str): The execution UID of the workflow.
+
+        Returns:
+            (int) The number of workflows which will be dispatched before it, or None if it is not queued.
+        """
+        return self.executor.get_queue_position(execution_uid)
+
+    def get_queue_stats(self):
+        """Gets the number of queued workflows and their wait times for each priority class.
+
+        Returns:
+            (dict{str: dict}) The statistics of each priority class.
+        """
+        return self.executor.get_queue_stats()
+
+    def get_admission_stats(self):
+        """Gets the depth and limit of the workflow queue and how often workflows were turned away because it was full.
+
+        Returns:
+            (dict) The number of queued workflows, the maximum number of queued workflows, the overflow policy, and
+                the number of rejected, dropped and blocked workflows.
+        """
+        return self.executor.get_admission_stats()
+
+    def get_dispatch_metrics(self):
+        """Gets the time workflows spend being queued and dispatched, the depth of the workflow queue, and the
+        utilization of each worker.
+
+        Returns:
+            (dict) Histograms of the queue wait and dispatch latency in seconds, the current and highest depth of the
+                queue, and the number of workflows executed and the seconds spent busy and idle by each worker.
+        """
+        return self.executor.get_dispatch_metrics()
+
     def get_workflow(self, playbook_name, workflow_name):
         """Get a workflow object.
         
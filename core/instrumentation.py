@@ -0,0 +1,139 @@
+import threading
+from bisect import bisect_left
+
+# Upper bounds in seconds of the buckets of a histogram, covering dispatches measured in milliseconds through
+# workflows which wait minutes for a worker
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class Histogram(object):
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """Initializes a Histogram, which counts observed values in fixed buckets. Safe to use from any thread.
+
+        Args:
+            buckets (iterable(float), optional): The upper bounds of the buckets. Values larger than the last bound are
+                counted as overflow. Defaults to DEFAULT_BUCKETS.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.__counts = [0] * (len(self.buckets) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__min = None
+        self.__max = None
+        self.__lock = threading.Lock()
+
+    def observe(self, value):
+        """Records a value.
+
+        Args:
+            value (float): The value to record.
+        """
+        index = bisect_left(self.buckets, value)
+        with self.__lock:
+            self.__counts[index] += 1
+            self.__count += 1
+            self.__sum += value
+            self.__min = value if self.__min is None else min(self.__min, value)
+            self.__max = value if self.__max is None else max(self.__max, value)
+
+    @property
+    def count(self):
+        return self.__count
+
+    def percentile(self, fraction):
+        """Estimates a percentile as the upper bound of the bucket it falls in.
+
+        Args:
+            fraction (float): The percentile as a fraction between 0 and 1.
+
+        Returns:
+            (float) The estimated percentile, which is the largest value observed if it falls in the overflow, or None
+                if no values have been observed.
+        """
+        with self.__lock:
+            return self.__percentile(fraction)
+
+    def __percentile(self, fraction):
+        if not self.__count:
+            return None
+        rank = fraction * self.__count
+        seen = 0
+        for bound, count in zip(self.buckets, self.__counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.__max)
+        return self.__max
+
+    def as_json(self):
+        """Gets the JSON representation of the histogram.
+
+        Returns:
+            (dict) The number, sum, minimum, maximum and mean of the observed values, the estimated 50th, 95th and
+                99th percentiles, the count of each bucket, and the number of values larger than the last bucket.
+        """
+        with self.__lock:
+            return {'count': self.__count,
+                    'sum': self.__sum,
+                    'min': self.__min,
+                    'max': self.__max,
+                    'mean': self.__sum / self.__count if self.__count else None,
+                    'p50': self.__percentile(0.5),
+                    'p95': self.__percentile(0.95),
+                    'p99': self.__percentile(0.99),
+                    'buckets': [{'le': bound, 'count': count} for bound, count in zip(self.buckets, self.__counts)],
+                    'overflow': self.__counts[-1]}
+
+
+class Gauge(object):
+    def __init__(self, value=0):
+        """Initializes a Gauge, which holds the current value of a quantity and the highest value it has reached.
+        Safe to use from any thread.
+
+        Args:
+            value (int|float, optional): The initial value. Defaults to 0.
+        """
+        self.__value = value
+        self.__max = value
+        self.__lock = threading.Lock()
+
+    @property
+    def value(self):
+        return self.__value
+
+    def set(self, value):
+        """Sets the current value.
+
+        Args:
+            value (int|float): The current value.
+        """
+        with self.__lock:
+            self.__value = value
+            self.__max = max(self.__max, value)
+
+    def inc(self, amount=1):
+        """Increases the current value.
+
+        Args:
+            amount (int|float, optional): The amount to increase the value by. Defaults to 1.
+        """
+        with self.__lock:
+            self.__value += amount
+            self.__max = max(self.__max, self.__value)
+
+    def dec(self, amount=1):
+        """Decreases the current value.
+
+        Args:
+            amount (int|float, optional): The amount to decrease the value by. Defaults to 1.
+        """
+        with self.__lock:
+            self.__value -= amount
+
+    def as_json(self):
+        """Gets the JSON representation of the gauge.
+
+        Returns:
+            (dict) The current value and the highest value reached.
+        """
+        with self.__lock:
+            return {'value': self.__value, 'max': self.__max}
@@ -1,29 +1,81 @@
+import hashlib
 import json
 import logging
+import math
 import os
 import signal
 import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from copy import deepcopy
 
 import gevent
+from gevent import monkey
 import zmq.auth as auth
 import zmq.green as zmq
-from gevent.queue import Queue
+from gevent.lock import Semaphore
+from gevent.pool import Pool
 from zmq.utils.strtypes import asbytes, cast_unicode
 
 import core.config.config
 import core.config.paths
 from core.protobuf.build import data_pb2
-
-try:
-    from Queue import Queue
-except ImportError:
-    from queue import Queue
 from core.case import callbacks
+import core.case.subscription as case_subscription
+from core.callbackdispatcher import CallbackDispatcher
 from core.executionelements.workflow import Workflow
-
-REQUESTS_ADDR = 'tcp://127.0.0.1:5555'
-RESULTS_ADDR = 'tcp://127.0.0.1:5556'
-COMM_ADDR = 'tcp://127.0.0.1:5557'
+from core.instrumentation import Histogram
+from core.workflowqueue import WorkflowQueue, QueueFull
+
+LOADBALANCER_CONTROL_ADDR = 'inproc://loadbalancer-control'
+RECEIVER_CONTROL_ADDR = 'inproc://receiver-control'
+
+# What happens to the workflows executing on a worker which crashed
+WORKER_FAILURE_POLICIES = ('requeue', 'fail')
+
+# Callbacks after which a workflow may sit idle for a while, so any batched callbacks should be sent immediately
+FLUSH_CALLBACKS = {'Workflow Shutdown', 'Workflow Paused', 'Trigger Step Awaiting Data'}
+
+# Callbacks which the Receiver itself needs, so they are sent even if nothing else listens to them
+REQUIRED_CALLBACKS = {'Workflow Shutdown'}
+
+# Callbacks whose receivers read the inputs of the Step which sent them. Other Step callbacks are sent without them.
+INPUT_CALLBACKS = {'Function Execution Success'}
+
+# The ID sent in place of the name of each callback
+CALLBACK_IDS = {
+    'Workflow Execution Start': data_pb2.WORKFLOW_EXECUTION_START,
+    'Next Step Found': data_pb2.NEXT_STEP_FOUND,
+    'App Instance Created': data_pb2.APP_INSTANCE_CREATED,
+    'Workflow Shutdown': data_pb2.WORKFLOW_SHUTDOWN,
+    'Workflow Input Validated': data_pb2.WORKFLOW_INPUT_VALIDATED,
+    'Workflow Input Invalid': data_pb2.WORKFLOW_INPUT_INVALID,
+    'Workflow Paused': data_pb2.WORKFLOW_PAUSED,
+    'Workflow Resumed': data_pb2.WORKFLOW_RESUMED,
+    'Step Execution Success': data_pb2.STEP_EXECUTION_SUCCESS,
+    'Step Execution Error': data_pb2.STEP_EXECUTION_ERROR,
+    'Step Started': data_pb2.STEP_STARTED,
+    'Function Execution Success': data_pb2.FUNCTION_EXECUTION_SUCCESS,
+    'Step Input Invalid': data_pb2.STEP_INPUT_INVALID,
+    'Conditionals Executed': data_pb2.CONDITIONALS_EXECUTED,
+    'Next Step Taken': data_pb2.NEXT_STEP_TAKEN,
+    'Next Step Not Taken': data_pb2.NEXT_STEP_NOT_TAKEN,
+    'Flag Success': data_pb2.FLAG_SUCCESS,
+    'Flag Error': data_pb2.FLAG_ERROR,
+    'Filter Success': data_pb2.FILTER_SUCCESS,
+    'Filter Error': data_pb2.FILTER_ERROR,
+    'Trigger Step Taken': data_pb2.TRIGGER_STEP_TAKEN,
+    'Trigger Step Not Taken': data_pb2.TRIGGER_STEP_NOT_TAKEN,
+    'Trigger Step Awaiting Data': data_pb2.TRIGGER_STEP_AWAITING_DATA
+}
+CALLBACK_NAMES = {callback_id: callback_name for callback_name, callback_id in CALLBACK_IDS.items()}
+
+# The fields of a sender which hold the ID of an interned name, and the field the name is restored to on the server
+INTERNED_FIELDS = (('name_id', 'name'), ('app_id', 'app'), ('action_id', 'action'))
+
+# The number of worker sessions whose interned names the Receiver remembers
+MAX_NAME_SESSIONS = 1024
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +109,150 @@ def recreate_workflow(workflow_json):
     return workflow, start_input
 
 
+def get_workflow_hash(workflow_json):
+    """Gets a hash of the content of a workflow, which identifies its template in the caches of the workers.
+
+    Args:
+        workflow_json (dict): The JSON representation of the workflow, without its execution UID or start input.
+
+    Returns:
+        (bytes) The hash of the workflow.
+    """
+    return hashlib.sha1(asbytes(json.dumps(workflow_json, sort_keys=True))).digest()
+
+
+def create_workflow_template(workflow_json):
+    """Constructs a workflow which is copied for each of its executions, so that it only has to be constructed once.
+
+    Args:
+        workflow_json (dict): The JSON representation of the workflow, without its execution UID or start input.
+
+    Returns:
+        (Workflow) The workflow, without the AsyncResults of its Steps.
+    """
+    uid = workflow_json.pop('uid')
+    workflow = Workflow.create(workflow_json)
+    workflow.uid = uid
+    workflow.strip_async_result()
+    return workflow
+
+
+def create_workflow_shutdown_batch(workflow_json, error):
+    """Creates a batch holding a Workflow Shutdown callback for a workflow which could not finish executing.
+
+    Args:
+        workflow_json (dict): The workflow JSON, including its execution_uid.
+        error (str): Why the workflow could not finish.
+
+    Returns:
+        (data_pb2.MessageBatch) The batch.
+    """
+    batch = data_pb2.MessageBatch()
+    packet = batch.messages.add()
+    packet.type = data_pb2.Message.WORKFLOWPACKETDATA
+    workflow_packet = packet.workflow_packet_data
+    workflow_packet.sender.name = workflow_json['name']
+    workflow_packet.sender.uid = workflow_json['uid']
+    workflow_packet.sender.workflow_execution_uid = workflow_json['execution_uid']
+    workflow_packet.callback = CALLBACK_IDS['Workflow Shutdown']
+    workflow_packet.additional_data = json.dumps({'error': error})
+    return batch
+
+
+def get_callback_interest():
+    """Gets the callbacks which are consumed on the server, either by a listener connected to their signal, such as
+    the metrics, workflow results or a connected event stream, or by a case subscribed to them. Workers do not send any
+    other callbacks.
+
+    Returns:
+        (dict) The callback names needed from every execution element under 'all', and the additional callback names
+            needed from specific execution elements by their UID under 'originators'.
+    """
+    needed = set(REQUIRED_CALLBACKS)
+    for callback_name, (signal, _) in Receiver.callback_lookup.items():
+        if callbacks.has_listeners(signal):
+            needed.add(callback_name)
+    originators = {}
+    for case in list(case_subscription.subscriptions.values()):
+        for originator, events in list(case.items()):
+            subscribed = {callback_name for callback_name, (signal, _) in Receiver.callback_lookup.items()
+                          if callbacks.get_message_name(signal) in events and callback_name not in needed}
+            if subscribed:
+                originators.setdefault(originator, set()).update(subscribed)
+    return {'all': sorted(needed),
+            'originators': {originator: sorted(names) for originator, names in originators.items()}}
+
+
+def get_connect_address(address, host=None):
+    """Gets the address that a worker connects to in order to reach a socket bound by the server.
+
+    Args:
+        address (str): The address the socket is bound to, such as tcp://*:5555.
+        host (str, optional): The host of the server. Defaults to the host of the bound address, or to localhost if
+            the socket is bound to all interfaces.
+
+    Returns:
+        (str) The address to connect to.
+    """
+    protocol, _, location = address.partition('://')
+    if protocol != 'tcp':
+        return address
+    bound_host, _, port = location.rpartition(':')
+    if host is None:
+        host = '127.0.0.1' if bound_host in ('*', '0.0.0.0') else bound_host
+    return 'tcp://{0}:{1}'.format(host, port)
+
+
+def set_high_water_mark(socket, hwm):
+    """Sets the maximum number of messages a ZMQ socket buffers in each direction. Must be called before the socket
+    is bound or connected.
+
+    Args:
+        socket (Socket): The socket.
+        hwm (int): The maximum number of messages, or 0 for no limit.
+    """
+    socket.sndhwm = hwm
+    socket.rcvhwm = hwm
+
+
+class NameInterner(object):
+    def __init__(self):
+        """Initializes a NameInterner, which replaces the names of workflows, apps, actions and steps with small
+        integer IDs for a single worker session. Each name is sent in full only once, in the first batch of the session
+        which uses it.
+        """
+        self.session = uuid.uuid4().bytes
+        self.ids = {}
+        self.undeclared = {}
+
+    def intern(self, name):
+        """Gets the ID of a name, assigning it a new one if it has not been used before in this session.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            (int) The ID of the name.
+        """
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name_id = len(self.ids) + 1
+            self.ids[name] = name_id
+            self.undeclared[name_id] = name
+        return name_id
+
+    def declare(self, batch):
+        """Adds the session and the names which have not been sent yet to a batch which is about to be sent.
+
+        Args:
+            batch (data_pb2.MessageBatch): The batch.
+        """
+        batch.session = self.session
+        for name_id, name in self.undeclared.items():
+            batch.names[name_id] = name
+        self.undeclared.clear()
+
+
 def convert_to_protobuf(sender, workflow_execution_uid='', **kwargs):
     """Converts an execution element and its data to a protobuf message.
 
@@ -70,8 +266,26 @@ def convert_to_protobuf(sender, workflow_execution_uid='', **kwargs):
     Returns:
         The newly formed protobuf object, serialized as a string to send over the ZMQ socket.
     """
-    obj_type = kwargs['object_type']
     packet = data_pb2.Message()
+    fill_protobuf_message(packet, sender, workflow_execution_uid, **kwargs)
+    return packet.SerializeToString()
+
+
+def fill_protobuf_message(packet, sender, workflow_execution_uid='', names=None, **kwargs):
+    """Fills in a protobuf message from an execution element and its data.
+
+    Args:
+        packet (data_pb2.Message): The empty protobuf message to fill in.
+        sender (execution element): The execution element object that is sending the data.
+        workflow_execution_uid (str, optional): The execution UID of the Workflow under which this execution
+            element falls. Defaults to an empty string.
+        names (NameInterner, optional): The interner of the worker session. If given, the names of the sender are
+            sent as IDs, and the batch holding the message must be declared to the interner before it is sent.
+            Defaults to sending the names in full.
+        kwargs (dict, optional): A dict of extra fields, such as data, callback_name, etc.
+    """
+    obj_type = kwargs['object_type']
+    callback_name = kwargs['callback_name']
     if obj_type == 'Workflow':
         if 'data' in kwargs:
             packet.type = data_pb2.Message.WORKFLOWPACKETDATA
@@ -80,10 +294,13 @@ def convert_to_protobuf(sender, workflow_execution_uid='', **kwargs):
         else:
             packet.type = data_pb2.Message.WORKFLOWPACKET
             wf_packet = packet.workflow_packet
-        wf_packet.sender.name = sender.name
+        if names is not None:
+            wf_packet.sender.name_id = names.intern(sender.name)
+        else:
+            wf_packet.sender.name = sender.name
         wf_packet.sender.uid = sender.uid
         wf_packet.sender.workflow_execution_uid = workflow_execution_uid
-        wf_packet.callback_name = kwargs['callback_name']
+        set_callback(wf_packet, callback_name)
     elif obj_type == 'Step':
         if 'data' in kwargs:
             packet.type = data_pb2.Message.STEPPACKETDATA
@@ -92,27 +309,123 @@ def convert_to_protobuf(sender, workflow_execution_uid='', **kwargs):
         else:
             packet.type = data_pb2.Message.STEPPACKET
             step_packet = packet.step_packet
-        step_packet.sender.name = sender.name
+        if names is not None:
+            step_packet.sender.name_id = names.intern(sender.name)
+            step_packet.sender.app_id = names.intern(sender.app)
+            step_packet.sender.action_id = names.intern(sender.action)
+        else:
+            step_packet.sender.name = sender.name
+            step_packet.sender.app = sender.app
+            step_packet.sender.action = sender.action
         step_packet.sender.uid = sender.uid
         step_packet.sender.workflow_execution_uid = workflow_execution_uid
         step_packet.sender.execution_uid = sender.get_execution_uid()
-        step_packet.sender.app = sender.app
-        step_packet.sender.action = sender.action
 
-        for key, value in sender.inputs.items():
-            step_packet.sender.input[key] = str(value)
+        if callback_name in INPUT_CALLBACKS:
+            for key, value in sender.inputs.items():
+                step_packet.sender.input[key] = str(value)
 
-        step_packet.callback_name = kwargs['callback_name']
+        set_callback(step_packet, callback_name)
     elif obj_type in ['NextStep', 'Flag', 'Filter']:
         packet.type = data_pb2.Message.GENERALPACKET
         general_packet = packet.general_packet
         general_packet.sender.uid = sender.uid
         general_packet.sender.workflow_execution_uid = workflow_execution_uid
         if hasattr(sender, 'app'):
-            general_packet.sender.app = sender.app
-        general_packet.callback_name = kwargs['callback_name']
-    packet_bytes = packet.SerializeToString()
-    return packet_bytes
+            if names is not None:
+                general_packet.sender.app_id = names.intern(sender.app)
+            else:
+                general_packet.sender.app = sender.app
+        set_callback(general_packet, callback_name)
+
+
+def set_callback(packet, callback_name):
+    """Sets the callback of a packet, by its ID if it has one and by its name otherwise.
+
+    Args:
+        packet (protobuf message): The packet, such as a WorkflowPacket or StepPacketData.
+        callback_name (str): The name of the callback.
+    """
+    callback_id = CALLBACK_IDS.get(callback_name)
+    if callback_id is not None:
+        packet.callback = callback_id
+    else:
+        packet.callback_name = callback_name
+
+
+def get_callback_name(packet):
+    """Gets the name of the callback of a received packet.
+
+    Args:
+        packet (protobuf message): The packet, such as a WorkflowPacket or StepPacketData.
+
+    Returns:
+        (str) The name of the callback.
+    """
+    if packet.HasField('callback'):
+        return CALLBACK_NAMES.get(packet.callback, '')
+    return packet.callback_name
+
+
+def restore_interned_names(sender, names):
+    """Replaces the IDs of the interned names of a received sender with the names themselves, so that the receivers
+    of its callback can read them as usual.
+
+    Args:
+        sender (protobuf message): The sender, such as a WorkflowSender or StepSender.
+        names (dict{int: str}): The names declared by the worker session the sender was received from.
+    """
+    fields = sender.DESCRIPTOR.fields_by_name
+    for id_field, name_field in INTERNED_FIELDS:
+        if id_field in fields and sender.HasField(id_field):
+            name_id = getattr(sender, id_field)
+            if name_id in names:
+                setattr(sender, name_field, names[name_id])
+            else:
+                logger.warning('Received undeclared name ID {0}'.format(name_id))
+
+
+class ControlChannel(object):
+    def __init__(self, ctx, address):
+        """Initializes a ControlChannel, an inproc PUSH/PULL pair used to wake up a polling loop from another thread.
+
+        Args:
+            ctx (Context object): The Context in which both ends of the channel are created.
+            address (str): The inproc address to bind the receiving end to.
+        """
+        self.receiver = ctx.socket(zmq.PULL)
+        self.receiver.bind(address)
+        self.__sender = ctx.socket(zmq.PUSH)
+        self.__sender.connect(address)
+        self.__lock = threading.Lock()
+
+    def send(self, message):
+        """Sends a message to the polling loop. Safe to call from any thread.
+
+        Args:
+            message (bytes): The message to send.
+        """
+        with self.__lock:
+            self.__sender.send(message)
+
+    def recv_all(self):
+        """Receives all of the messages currently waiting on the channel without blocking.
+
+        Returns:
+            (list[bytes]) The received messages.
+        """
+        messages = []
+        while True:
+            try:
+                messages.append(self.receiver.recv(zmq.NOBLOCK))
+            except zmq.Again:
+                return messages
+
+    def close(self):
+        """Closes both ends of the channel.
+        """
+        self.__sender.close()
+        self.receiver.close()
 
 
 class LoadBalancer:
@@ -122,10 +435,34 @@ class LoadBalancer:
         Args:
             ctx (Context object): A Context object, shared with the Receiver thread.
         """
-        self.available_workers = []
+        self.available_workers = {}
+        self.worker_capacity = {}
+        self.idle_since = {}
+        self.retiring = set()
         self.workflow_comms = {}
-        self.thread_exit = False
-        self.pending_workflows = Queue()
+        self.dispatch_times = {}
+        self.average_execution_time = None
+        self.in_flight = {}
+        self.worker_caches = {}
+        self.worker_cache_sizes = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.standalone_workers = set()
+        self.last_seen = {}
+        self.lost_workers = deque()
+        self.submissions = {}
+        self.requeues = {}
+        self.requeued = 0
+        self.failed = 0
+        # Time in seconds between sending a workflow to a worker and the workflow starting, and the number of
+        # workflows and seconds busy and idle of each worker
+        self.dispatch_latency = Histogram()
+        self.awaiting_start = {}
+        self.worker_stats = {}
+        self.callback_interest = None
+        self.heartbeat_interval = core.config.config.worker_heartbeat_interval
+        self.heartbeat_timeout = core.config.config.worker_heartbeat_timeout
+        self.pending_workflows = WorkflowQueue()
 
         self.ctx = ctx
         server_secret_file = os.path.join(core.config.paths.zmq_private_keys_path, "server.key_secret")
@@ -135,51 +472,401 @@ class LoadBalancer:
         self.request_socket.curve_secretkey = server_secret
         self.request_socket.curve_publickey = server_public
         self.request_socket.curve_server = True
-        self.request_socket.bind(REQUESTS_ADDR)
+        set_high_water_mark(self.request_socket, core.config.config.request_socket_hwm)
+        self.request_socket.bind(core.config.config.zmq_requests_address)
 
         self.comm_socket = self.ctx.socket(zmq.ROUTER)
         self.comm_socket.curve_secretkey = server_secret
         self.comm_socket.curve_publickey = server_public
         self.comm_socket.curve_server = True
-        self.comm_socket.bind(COMM_ADDR)
+        set_high_water_mark(self.comm_socket, core.config.config.comm_socket_hwm)
+        self.comm_socket.bind(core.config.config.zmq_communication_address)
+
+        self.control = ControlChannel(self.ctx, LOADBALANCER_CONTROL_ADDR)
+
+        # Workflows which cannot be recovered from a crashed worker are shut down through the Receiver, so that their
+        # results and metrics are recorded the same way as those of any other workflow
+        self.receiver_control = self.ctx.socket(zmq.PUSH)
+        self.receiver_control.connect(RECEIVER_CONTROL_ADDR)
+
+        def handle_workflow_started(sender, **kwargs):
+            self.on_workflow_started(sender)
+        self.handle_workflow_started = handle_workflow_started
+        callbacks.WorkflowExecutionStart.connect(handle_workflow_started)
 
         gevent.sleep(2)
 
     def manage_workflows(self):
         """Manages the workflows to be executed and the workers. It waits for the server to submit a request to
         execute a workflow, and then passes the workflow off to an available worker, once one becomes available.
+        The loop sleeps in a poll until a worker reports in, a workflow is added, the LoadBalancer is shut down, or it
+        is time to check that every worker is still sending heartbeats.
         """
-        while True:
-            if self.thread_exit:
-                break
-            # There is a worker available and a workflow in the queue, so pop it off and send it to the worker
+        poller = zmq.Poller()
+        poller.register(self.request_socket, zmq.POLLIN)
+        poller.register(self.control.receiver, zmq.POLLIN)
+        last_heartbeat_check = time.time()
+
+        exiting = False
+        while not exiting:
+            # Workers must know which callbacks are needed before they start any workflow which might be audited
             if self.available_workers and not self.pending_workflows.empty():
+                self.__update_callback_interest()
+            # Hand out as many pending workflows as there are free worker slots, preferring the least busy worker
+            while self.available_workers and not self.pending_workflows.empty():
                 workflow = self.pending_workflows.get()
-                worker = self.available_workers.pop()
+                worker = max(self.available_workers, key=self.available_workers.get)
+                self.available_workers[worker] -= 1
+                if not self.available_workers[worker]:
+                    self.available_workers.pop(worker)
+                self.idle_since.pop(worker, None)
                 self.workflow_comms[workflow['execution_uid']] = worker
-                self.request_socket.send_multipart([worker, b"", asbytes(json.dumps(workflow))])
-            # If there is a worker available but no pending workflows, then see if there are any other workers
-            # available, but do not block in case a workflow becomes available
-            else:
-                try:
-                    worker, empty, ready = self.request_socket.recv_multipart(flags=zmq.NOBLOCK)
-                    if ready == b"Ready" or ready == b"Done":
-                        self.available_workers.append(worker)
-                except zmq.ZMQError:
-                    gevent.sleep(0.1)
-                    continue
+                self.dispatch_times[workflow['execution_uid']] = time.time()
+                self.awaiting_start[workflow['execution_uid']] = time.time()
+                self.in_flight[workflow['execution_uid']] = workflow
+                self.__send_workflow(worker, workflow)
+
+            events = dict(poller.poll(self.heartbeat_interval * 1000))
+            if self.request_socket in events:
+                self.__receive_worker_messages()
+            if self.control.receiver in events:
+                messages = self.control.recv_all()
+                exiting = b'Exit' in messages
+                for message in messages:
+                    if message == b'Retire':
+                        self.__retire_idle_worker()
+                    elif message.startswith(b'Remove:'):
+                        self.__remove_worker(message[len(b'Remove:'):], 'Worker {0} exited unexpectedly'.format(
+                            cast_unicode(message[len(b'Remove:'):])))
+            if time.time() - last_heartbeat_check >= self.heartbeat_interval:
+                self.__check_heartbeats()
+                self.__update_callback_interest()
+                last_heartbeat_check = time.time()
+
         self.request_socket.close()
         self.comm_socket.close()
+        self.receiver_control.close()
+        self.control.close()
+        callbacks.WorkflowExecutionStart.disconnect(self.handle_workflow_started)
         return
 
-    def add_workflow(self, workflow_json):
+    def __check_heartbeats(self):
+        now = time.time()
+        for worker, last_seen in list(self.last_seen.items()):
+            if now - last_seen > self.heartbeat_timeout:
+                logger.error('Worker {0} has not sent a heartbeat in {1} seconds'.format(cast_unicode(worker),
+                                                                                        now - last_seen))
+                self.lost_workers.append(cast_unicode(worker))
+                self.__remove_worker(worker, 'Worker {0} stopped responding'.format(cast_unicode(worker)))
+
+    def __remove_worker(self, worker, error):
+        if worker not in self.worker_capacity:
+            return
+        self.__forget_worker(worker)
+        for execution_uid in [uid for uid, uid_worker in self.workflow_comms.items() if uid_worker == worker]:
+            self.__recover_execution(execution_uid, error)
+
+    def __recover_execution(self, execution_uid, error):
+        self.workflow_comms.pop(execution_uid, None)
+        self.dispatch_times.pop(execution_uid, None)
+        self.awaiting_start.pop(execution_uid, None)
+        workflow_json = self.in_flight.pop(execution_uid, None)
+        if workflow_json is None:
+            return
+        priority, playbook_name, policy = self.submissions.get(execution_uid, (None, None, None))
+        policy = policy if policy is not None else core.config.config.worker_failure_policy
+        requeues = self.requeues.get(execution_uid, 0)
+        if policy == 'requeue' and requeues < core.config.config.max_workflow_requeues:
+            logger.warning('Requeueing workflow execution {0}. {1}'.format(execution_uid, error))
+            self.requeues[execution_uid] = requeues + 1
+            self.requeued += 1
+            self.pending_workflows.put(workflow_json, priority=priority, share=playbook_name, force=True)
+        else:
+            logger.error('Failing workflow execution {0}. {1}'.format(execution_uid, error))
+            self.submissions.pop(execution_uid, None)
+            self.requeues.pop(execution_uid, None)
+            self.failed += 1
+            self.receiver_control.send(create_workflow_shutdown_batch(workflow_json, error).SerializeToString())
+
+    def __receive_worker_messages(self):
+        while True:
+            try:
+                message = self.request_socket.recv_multipart(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                return
+            worker, status = message[0], message[2]
+            if status == b"Ready" or worker in self.worker_capacity:
+                self.last_seen[worker] = time.time()
+            if status == b"Ready":
+                # A worker reports how many workflows it can execute concurrently when it starts up
+                capacity = int(message[3]) if len(message) > 3 else 1
+                self.worker_capacity[worker] = capacity
+                self.worker_cache_sizes[worker] = int(message[4]) if len(message) > 4 else 0
+                self.worker_caches[worker] = OrderedDict()
+                self.available_workers[worker] = capacity
+                self.idle_since[worker] = time.time()
+                self.worker_stats[worker] = {'workflows': 0, 'busy_time': 0.0, 'idle_time': 0.0}
+                # Workers started on their own with startWorker.py are not retired when the pool is scaled down
+                if len(message) > 5 and message[5] == b"0":
+                    self.standalone_workers.add(worker)
+                logger.info('Worker {0} joined with {1} workflow slots'.format(cast_unicode(worker), capacity))
+                if self.callback_interest is not None:
+                    self.request_socket.send_multipart([worker, b"", b"Interest", self.callback_interest])
+            elif status == b"Heartbeat":
+                # Workers report the total number of seconds they have spent executing workflows and waiting for them
+                if len(message) > 4 and worker in self.worker_stats:
+                    self.worker_stats[worker]['busy_time'] = float(message[3])
+                    self.worker_stats[worker]['idle_time'] = float(message[4])
+            elif status == b"Leave":
+                if worker in self.worker_capacity and worker not in self.retiring:
+                    logger.info('Worker {0} is leaving'.format(cast_unicode(worker)))
+                    self.__retire(worker)
+            elif status == b"Done":
+                if len(message) > 3:
+                    self.__record_execution_time(cast_unicode(message[3]))
+                if worker in self.worker_stats:
+                    self.worker_stats[worker]['workflows'] += 1
+                if worker not in self.retiring:
+                    self.available_workers[worker] = self.available_workers.get(worker, 0) + 1
+                    if self.available_workers[worker] >= self.worker_capacity.get(worker, 1):
+                        self.idle_since[worker] = time.time()
+            elif status == b"Missing":
+                execution_uid = cast_unicode(message[3])
+                if execution_uid in self.in_flight:
+                    logger.debug('Worker {0} does not have the workflow for execution {1} cached'.format(
+                        cast_unicode(worker), execution_uid))
+                    self.__send_workflow(worker, self.in_flight[execution_uid], send_definition=True)
+            elif status == b"Retired":
+                self.__forget_worker(worker)
+                callbacks.WorkerRetired.send({'uid': cast_unicode(worker)})
+
+    def __update_callback_interest(self):
+        if not core.config.config.filter_unused_callbacks:
+            return
+        interest = asbytes(json.dumps(get_callback_interest(), sort_keys=True))
+        if interest != self.callback_interest:
+            self.callback_interest = interest
+            for worker in list(self.worker_capacity):
+                self.request_socket.send_multipart([worker, b"", b"Interest", interest])
+
+    def __forget_worker(self, worker):
+        for mapping in (self.worker_capacity, self.available_workers, self.idle_since, self.last_seen,
+                        self.worker_caches, self.worker_cache_sizes, self.worker_stats):
+            mapping.pop(worker, None)
+        self.retiring.discard(worker)
+        self.standalone_workers.discard(worker)
+
+    def __send_workflow(self, worker, workflow_json, send_definition=False):
+        # The cache of each worker is mirrored here by applying the same least recently used updates in the same order
+        # as the worker, so the definition is only sent when the worker does not have the workflow cached
+        definition = {key: value for key, value in workflow_json.items() if key not in ('execution_uid', 'start_input')}
+        workflow_hash = get_workflow_hash(definition)
+        request = data_pb2.ExecutionRequest()
+        request.workflow_hash = workflow_hash
+        request.execution_uid = workflow_json['execution_uid']
+        request.start = workflow_json['start']
+        if 'start_input' in workflow_json:
+            request.start_input = json.dumps(workflow_json['start_input'])
+
+        cache = self.worker_caches.setdefault(worker, OrderedDict())
+        cached = cache.pop(workflow_hash, None)
+        if cached is None or send_definition:
+            request.workflow = json.dumps(definition)
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        cache[workflow_hash] = True
+        while len(cache) > self.worker_cache_sizes.get(worker, 0):
+            cache.popitem(last=False)
+        self.request_socket.send_multipart([worker, b"", request.SerializeToString()])
+
+    def __record_execution_time(self, execution_uid):
+        self.workflow_comms.pop(execution_uid, None)
+        self.in_flight.pop(execution_uid, None)
+        self.submissions.pop(execution_uid, None)
+        self.requeues.pop(execution_uid, None)
+        dispatched = self.dispatch_times.pop(execution_uid, None)
+        if dispatched is not None:
+            execution_time = time.time() - dispatched
+            if self.average_execution_time is None:
+                self.average_execution_time = execution_time
+            else:
+                self.average_execution_time = (self.average_execution_time + execution_time) / 2
+
+    def on_workflow_started(self, sender):
+        """Records the time it took for a workflow to start after it was sent to a worker. Called by the Receiver
+        thread when a workflow starts.
+
+        Args:
+            sender (object): The sender of the Workflow Execution Start callback.
+        """
+        dispatched = self.awaiting_start.pop(sender.workflow_execution_uid, None)
+        if dispatched is not None:
+            self.dispatch_latency.observe(time.time() - dispatched)
+
+    def __retire_idle_worker(self):
+        idle_workers = [worker for worker, free in self.available_workers.items()
+                        if worker not in self.retiring and worker not in self.standalone_workers
+                        and free >= self.worker_capacity.get(worker, 1)]
+        if not idle_workers:
+            return
+        self.__retire(min(idle_workers, key=lambda idle_worker: self.idle_since.get(idle_worker, time.time())))
+
+    def __retire(self, worker):
+        self.available_workers.pop(worker, None)
+        self.idle_since.pop(worker, None)
+        self.retiring.add(worker)
+        self.request_socket.send_multipart([worker, b"", b"Retire"])
+
+    def add_workflow(self, workflow_json, priority=None, playbook_name=None, failure_policy=None):
         """Adds a workflow to the queue to be executed.
 
         Args:
             workflow_json (dict): Dict representation of a workflow, along with some additional fields necessary for
                 reconstructing the workflow.
+            priority (str, optional): The priority class of the workflow. Defaults to the default priority.
+            playbook_name (str, optional): The playbook of the workflow, which it is fairly shared with.
+            failure_policy (str, optional): Whether the workflow is requeued ('requeue') or failed ('fail') if its
+                worker crashes. Defaults to the worker_failure_policy in the config.
+
+        Returns:
+            (dict) The queued workflow which was dropped to make room for this one, or None if none was dropped.
+
+        Raises:
+            UnknownPriority: If the priority class is not configured.
+            QueueFull: If the queue is full and the workflow was rejected. Its retry_after is the estimated number of
+                seconds until the queue has room.
+            ValueError: If the failure policy is not one of the supported policies.
+        """
+        if failure_policy is not None and failure_policy not in WORKER_FAILURE_POLICIES:
+            raise ValueError('Unknown worker failure policy {0}'.format(failure_policy))
+        execution_uid = workflow_json['execution_uid']
+        self.submissions[execution_uid] = (priority, playbook_name, failure_policy)
+        try:
+            dropped = self.pending_workflows.put(workflow_json, priority=priority, share=playbook_name)
+        except QueueFull as e:
+            self.submissions.pop(execution_uid, None)
+            e.retry_after = self.__estimate_retry_after()
+            raise
+        except UnknownPriority:
+            self.submissions.pop(execution_uid, None)
+            raise
+        if dropped is not None:
+            self.submissions.pop(dropped['execution_uid'], None)
+        self.control.send(b'Workflow')
+        return dropped
+
+    def __estimate_retry_after(self):
+        total_slots = sum(slots for worker, slots in dict(self.worker_capacity).items() if worker not in self.retiring)
+        if self.average_execution_time is None or not total_slots:
+            return core.config.config.queue_retry_after
+        queued = self.pending_workflows.qsize()
+        return max(1, int(math.ceil(queued * self.average_execution_time / total_slots)))
+
+    def get_queue_position(self, execution_uid):
+        """Gets the position of a workflow in the queue.
+
+        Args:
+            execution_uid (str): The execution UID of the workflow.
+
+        Returns:
+            (int) The number of workflows which will be dispatched before it, or None if it is not queued.
+        """
+        return self.pending_workflows.position(execution_uid)
+
+    def get_queue_stats(self):
+        """Gets the number of queued workflows and their wait times for each priority class.
+
+        Returns:
+            (dict{str: dict}) The statistics of each priority class.
+        """
+        return self.pending_workflows.get_stats()
+
+    def get_admission_stats(self):
+        """Gets the depth and limit of the queue and how often workflows were turned away because it was full.
+
+        Returns:
+            (dict) The admission statistics of the queue.
+        """
+        return self.pending_workflows.get_admission_stats()
+
+    def get_dispatch_metrics(self):
+        """Gets the time workflows spend being queued and dispatched, the depth of the queue, and the utilization of
+        each worker. Safe to call from any thread.
+
+        Returns:
+            (dict) Histograms of the seconds workflows waited in the queue and the seconds between sending a workflow
+                to a worker and the workflow starting, the current and highest depth of the queue, and the number
+                of workflows executed and the seconds spent busy and idle by each worker.
+        """
+        return {'queue_wait': self.pending_workflows.wait_times.as_json(),
+                'dispatch_latency': self.dispatch_latency.as_json(),
+                'queue_depth': self.pending_workflows.depth.as_json(),
+                'workers': [{'id': cast_unicode(worker),
+                             'workflows': stats['workflows'],
+                             'busy_time': stats['busy_time'],
+                             'idle_time': stats['idle_time']}
+                            for worker, stats in dict(self.worker_stats).items()]}
+
+    def retire_worker(self):
+        """Retires the worker which has been idle the longest. The worker stops receiving workflows immediately and
+        exits once it has finished executing any workflows it already has. Nothing is retired if no worker is idle.
+        Standalone workers are never retired, but leave by themselves.
+        """
+        self.control.send(b'Retire')
+
+    def remove_worker(self, worker):
+        """Removes a worker whose process has died, requeueing or failing the workflows it was executing.
+
+        Args:
+            worker (str): The identity of the worker.
         """
-        self.pending_workflows.put(workflow_json)
+        self.control.send(b'Remove:' + asbytes(worker))
+
+    def get_lost_workers(self):
+        """Gets the workers which stopped sending heartbeats since the last call. These workers have already been
+        removed, and their processes should be killed. Safe to call from any thread.
+
+        Returns:
+            (list[str]) The identities of the workers.
+        """
+        lost = []
+        while self.lost_workers:
+            lost.append(self.lost_workers.popleft())
+        return lost
+
+    def get_pool_stats(self):
+        """Gets a snapshot of the state of the worker pool. Safe to call from any thread.
+
+        Returns:
+            (dict) The number of queued workflows, registered workers, standalone workers (which are not managed by
+                the pool) and workers being retired, the number of free
+                and total workflow slots, the number of seconds each idle pool worker has been idle, the average
+                workflow execution time in seconds, or None if no workflow has finished yet, the number of
+                workflows dispatched with and without their definition because the worker did or did not have them
+                cached, and the number of workflows requeued or failed because their worker crashed.
+        """
+        now = time.time()
+        retiring = set(self.retiring)
+        capacity = {worker: slots for worker, slots in dict(self.worker_capacity).items() if worker not in retiring}
+        return {'queued': self.pending_workflows.qsize(),
+                'workers': len(capacity),
+                'standalone_workers': len(set(self.standalone_workers) - retiring),
+                'retiring': len(retiring),
+                'free_slots': sum(dict(self.available_workers).values()),
+                'total_slots': sum(capacity.values()),
+                'idle_workers': [now - idle_since for worker, idle_since in dict(self.idle_since).items()
+                                 if worker not in retiring and worker not in self.standalone_workers],
+                'average_execution_time': self.average_execution_time,
+                'cache_hits': self.cache_hits,
+                'cache_misses': self.cache_misses,
+                'requeued': self.requeued,
+                'failed': self.failed}
+
+    def shutdown(self):
+        """Stops the manage_workflows loop and closes its sockets.
+        """
+        self.control.send(b'Exit')
 
     def pause_workflow(self, workflow_execution_uid):
         """Pauses a workflow currently executing.
@@ -189,7 +876,8 @@ class LoadBalancer:
         """
         logger.info('Pausing workflow {0}'.format(workflow_execution_uid))
         if workflow_execution_uid in self.workflow_comms:
-            self.comm_socket.send_multipart([self.workflow_comms[workflow_execution_uid], b'', b'Pause'])
+            self.comm_socket.send_multipart([self.workflow_comms[workflow_execution_uid], b'', b'Pause',
+                                             asbytes(workflow_execution_uid)])
 
     def resume_workflow(self, workflow_execution_uid):
         """Resumes a workflow that has previously been paused.
@@ -199,7 +887,8 @@ class LoadBalancer:
         """
         logger.info('Resuming workflow {0}'.format(workflow_execution_uid))
         if workflow_execution_uid in self.workflow_comms:
-            self.comm_socket.send_multipart([self.workflow_comms[workflow_execution_uid], b'', b'Resume'])
+            self.comm_socket.send_multipart([self.workflow_comms[workflow_execution_uid], b'', b'Resume',
+                                             asbytes(workflow_execution_uid)])
 
     def send_data_to_trigger(self, data_in, workflow_uids, inputs={}):
         """Sends the data_in to the workflows specified in workflow_uids.
@@ -216,27 +905,57 @@ class LoadBalancer:
         for uid in workflow_uids:
             if uid in self.workflow_comms:
                 self.comm_socket.send_multipart(
-                    [self.workflow_comms[uid], b'', str.encode(json.dumps(data))])
+                    [self.workflow_comms[uid], b'', b'Data', asbytes(uid), str.encode(json.dumps(data))])
 
 
 class Worker:
-    def __init__(self, id_, worker_environment_setup=None):
+    def __init__(self, id_, worker_environment_setup=None, server_host=None, standalone=False):
         """Initialize a Workflow object, which will be executing workflows.
 
         Args:
             id_ (str): The ID of the worker. Needed for ZMQ socket communication.
             worker_environment_setup (func, optional): Function to setup globals in the worker.
+            server_host (str, optional): The host of the server to connect to. Defaults to the host of the addresses
+                in the config.
+            standalone (bool, optional): Whether the worker was started on its own rather than by the worker pool of
+                the server, in which case it is never retired by the pool. Defaults to False.
         """
+        # Workflows share the process as greenlets, so blocking calls made by apps must yield to each other and to
+        # the communication greenlet. This is a no-op if the server has already patched the process.
+        monkey.patch_all(thread=False, subprocess=False, ssl=False)
+
         signal.signal(signal.SIGINT, self.exit_handler)
         signal.signal(signal.SIGABRT, self.exit_handler)
+        gevent.signal_handler(signal.SIGTERM, self.leave)
+        self.standalone = standalone
 
         def handle_data_sent(sender, **kwargs):
             self.on_data_sent(sender, **kwargs)
         self.handle_data_sent = handle_data_sent
         callbacks.data_sent.connect(handle_data_sent)
 
-        self.thread_exit = False
-        self.workflow = None
+        self.capacity = max(1, core.config.config.worker_concurrency)
+        self.pool = Pool(self.capacity)
+        self.cache_size = max(0, core.config.config.workflow_cache_size)
+        self.templates = OrderedDict()
+        self.workflows = {}
+        self.greenlet_workflows = {}
+        self.comm_greenlet = None
+        self.heartbeat_greenlet = None
+        self.heartbeat_interval = core.config.config.worker_heartbeat_interval
+        self.started_at = time.time()
+        self.busy_since = None
+        self.busy_time = 0.0
+        self.needed_callbacks = None
+        self.originator_callbacks = {}
+
+        self.batch_size = max(1, core.config.config.callback_batch_size)
+        self.batch_window = core.config.config.callback_batch_window
+        # The batch is cleared and reused after it is sent, rather than building a new one for every frame
+        self.pending_packets = data_pb2.MessageBatch()
+        self.names = NameInterner()
+        self.batch_started = None
+        self.results_lock = Semaphore()
 
         server_secret_file = os.path.join(core.config.paths.zmq_private_keys_path, "server.key_secret")
         server_public, server_secret = auth.load_certificate(server_secret_file)
@@ -245,43 +964,45 @@ class Worker:
 
         self.ctx = zmq.Context()
 
-        self.request_sock = self.ctx.socket(zmq.REQ)
+        self.request_sock = self.ctx.socket(zmq.DEALER)
         self.request_sock.identity = u"Worker-{}".format(id_).encode("ascii")
         self.request_sock.curve_secretkey = client_secret
         self.request_sock.curve_publickey = client_public
         self.request_sock.curve_serverkey = server_public
-        self.request_sock.connect(REQUESTS_ADDR)
+        set_high_water_mark(self.request_sock, core.config.config.request_socket_hwm)
+        self.request_sock.connect(get_connect_address(core.config.config.zmq_requests_address, server_host))
 
-        self.comm_sock = self.ctx.socket(zmq.REQ)
+        self.comm_sock = self.ctx.socket(zmq.DEALER)
         self.comm_sock.identity = u"Worker-{}".format(id_).encode("ascii")
         self.comm_sock.curve_secretkey = client_secret
         self.comm_sock.curve_publickey = client_public
         self.comm_sock.curve_serverkey = server_public
-        self.comm_sock.connect(COMM_ADDR)
+        set_high_water_mark(self.comm_sock, core.config.config.comm_socket_hwm)
+        self.comm_sock.connect(get_connect_address(core.config.config.zmq_communication_address, server_host))
 
         self.results_sock = self.ctx.socket(zmq.PUSH)
         self.results_sock.identity = u"Worker-{}".format(id_).encode("ascii")
         self.results_sock.curve_secretkey = client_secret
         self.results_sock.curve_publickey = client_public
         self.results_sock.curve_serverkey = server_public
-        self.results_sock.connect(RESULTS_ADDR)
+        set_high_water_mark(self.results_sock, core.config.config.results_socket_hwm)
+        self.results_sock.connect(get_connect_address(core.config.config.zmq_results_address, server_host))
 
         if worker_environment_setup:
             worker_environment_setup()
         else:
             core.config.config.initialize()
 
-        self.comm_thread = threading.Thread(target=self.receive_data)
-        self.comm_thread.start()
+        self.comm_greenlet = gevent.spawn(self.receive_data)
+        self.heartbeat_greenlet = gevent.spawn(self.send_heartbeats)
 
         self.execute_workflow_worker()
 
     def exit_handler(self, signum, frame):
         """Clean up upon receiving a SIGINT or SIGABT.
         """
-        self.thread_exit = True
-        if self.comm_thread:
-            self.comm_thread.join(timeout=2)
+        if not self.results_lock.locked():
+            self.flush_callbacks()
         if self.request_sock:
             self.request_sock.close()
         if self.results_sock:
@@ -291,43 +1012,175 @@ class Worker:
         os._exit(0)
 
     def execute_workflow_worker(self):
-        """Keep executing workflows as they come in over the ZMQ socket from the manager.
+        """Keep executing workflows as they come in over the ZMQ socket from the manager. Up to worker_concurrency
+        workflows are executed at once, each in its own greenlet.
         """
-        self.request_sock.send(b"Ready")
-        self.comm_sock.send(b"Executing")
+        self.started_at = time.time()
+        self.request_sock.send_multipart([b"", b"Ready", str(self.capacity).encode('ascii'),
+                                          str(self.cache_size).encode('ascii'), b"0" if self.standalone else b"1"])
+        self.comm_sock.send_multipart([b"", b"Executing"])
 
         while True:
-            workflow_in = self.request_sock.recv()
+            frames = self.request_sock.recv_multipart()
+            message = frames[1]
+            if message == b"Retire":
+                break
+            if message == b"Interest":
+                self.set_callback_interest(json.loads(cast_unicode(frames[2])))
+                continue
+            request = data_pb2.ExecutionRequest()
+            request.ParseFromString(message)
+            template = self.get_template(request)
+            if template is None:
+                self.request_sock.send_multipart([b"", b"Missing", asbytes(request.execution_uid)])
+            else:
+                self.pool.spawn(self.execute_workflow, template, request)
+        self.retire()
 
-            self.workflow, start_input = recreate_workflow(json.loads(cast_unicode(workflow_in)))
+    def get_template(self, request):
+        """Gets the template of the workflow to execute, constructing it if the request holds its definition, and
+        caches it for later executions.
 
-            self.workflow.execute(execution_uid=self.workflow.get_execution_uid(), start=self.workflow.start,
-                                  start_input=start_input)
-            self.request_sock.send(b"Done")
+        Args:
+            request (ExecutionRequest): The request to execute the workflow.
+
+        Returns:
+            (Workflow) The template of the workflow, or None if it is not cached and the request only holds its hash.
+        """
+        template = self.templates.pop(request.workflow_hash, None)
+        if request.HasField('workflow'):
+            template = create_workflow_template(json.loads(request.workflow))
+        if template is not None:
+            self.templates[request.workflow_hash] = template
+            while len(self.templates) > self.cache_size:
+                self.templates.popitem(last=False)
+        return template
+
+    def set_callback_interest(self, interest):
+        """Sets which callbacks are consumed on the server. Any other callbacks are not sent.
+
+        Args:
+            interest (dict): The callback names needed from every execution element under 'all', and the callback names
+                needed from specific execution elements by their UID under 'originators', as returned by
+                get_callback_interest.
+        """
+        self.needed_callbacks = set(interest['all'])
+        self.originator_callbacks = {originator: set(names) for originator, names in interest['originators'].items()}
+
+    def is_callback_needed(self, sender, callback_name):
+        """Checks whether a callback is consumed on the server.
+
+        Args:
+            sender (execution element): The execution element that sent the callback.
+            callback_name (str): The name of the callback.
+
+        Returns:
+            (bool) True if the callback should be sent, False otherwise. Every callback is sent until the server has
+                told the worker which callbacks it needs.
+        """
+        if self.needed_callbacks is None or callback_name in self.needed_callbacks:
+            return True
+        originator = sender['uid'] if isinstance(sender, dict) else getattr(sender, 'uid', None)
+        return callback_name in self.originator_callbacks.get(originator, ())
+
+    def leave(self):
+        """Asks the manager to retire this worker, so that it stops receiving workflows and exits once it has finished
+        the workflows it already has. Called when the worker receives a SIGTERM.
+        """
+        logger.info('Leaving the worker pool')
+        self.request_sock.send_multipart([b"", b"Leave"])
+
+    def retire(self):
+        """Finishes executing the workflows already received, then tells the manager that this worker has retired
+        and closes its sockets so that the process can exit.
+        """
+        self.pool.join()
+        self.comm_greenlet.kill()
+        self.heartbeat_greenlet.kill()
+        self.flush_callbacks()
+        self.request_sock.send_multipart([b"", b"Retired"])
+        for sock in (self.request_sock, self.comm_sock, self.results_sock):
+            sock.close(linger=1000)
+        self.ctx.term()
+
+    def execute_workflow(self, template, request):
+        """Executes a single workflow, then tells the manager that its slot is free again.
+
+        Args:
+            template (Workflow): The template of the workflow, which is copied for this execution.
+            request (ExecutionRequest): The request to execute the workflow, holding its execution UID, start step
+                and start input.
+        """
+        workflow = deepcopy(template)
+        workflow.reset_async_result()
+        execution_uid = request.execution_uid
+        workflow.set_execution_uid(execution_uid)
+        workflow.start = request.start
+        start_input = json.loads(request.start_input) if request.HasField('start_input') else ''
+        current = gevent.getcurrent()
+        if not self.workflows:
+            self.busy_since = time.time()
+        self.workflows[execution_uid] = workflow
+        self.greenlet_workflows[current] = workflow
+        try:
+            workflow.execute(execution_uid=execution_uid, start=workflow.start, start_input=start_input)
+        finally:
+            self.workflows.pop(execution_uid, None)
+            self.greenlet_workflows.pop(current, None)
+            if not self.workflows:
+                self.busy_time += time.time() - self.busy_since
+                self.busy_since = None
+            self.request_sock.send_multipart([b"", b"Done", asbytes(execution_uid)])
+
+    def get_utilization(self):
+        """Gets how long this worker has spent executing workflows and waiting for them.
+
+        Returns:
+            (tuple(float, float)) The number of seconds during which at least one workflow was executing, and the
+                number of seconds during which none were.
+        """
+        now = time.time()
+        busy = self.busy_time + (now - self.busy_since if self.busy_since is not None else 0.0)
+        return busy, max(0.0, now - self.started_at - busy)
+
+    def send_heartbeats(self):
+        """Tells the manager that this worker is still alive, and how busy it has been, every
+        worker_heartbeat_interval seconds.
+        """
+        while True:
+            gevent.sleep(self.heartbeat_interval)
+            busy, idle = self.get_utilization()
+            self.request_sock.send_multipart([b"", b"Heartbeat", repr(busy).encode('ascii'),
+                                              repr(idle).encode('ascii')])
 
     def receive_data(self):
-        """Constantly receives data from the ZMQ socket and handles it accordingly.
+        """Constantly receives data from the ZMQ socket and routes it to the workflow it is addressed to.
         """
+        poller = zmq.Poller()
+        poller.register(self.comm_sock, zmq.POLLIN)
+        # Only wake up periodically if there may be batched callbacks which need to be flushed
+        timeout = self.batch_window * 1000 if self.batch_size > 1 else None
+
         while True:
-            if self.thread_exit:
-                break
-            try:
-                message = self.comm_sock.recv(zmq.NOBLOCK)
-            except zmq.ZMQError:
-                gevent.sleep(0.1)
+            events = dict(poller.poll(timeout))
+            if self.batch_started is not None and time.time() - self.batch_started >= self.batch_window:
+                self.flush_callbacks()
+            if self.comm_sock not in events:
                 continue
 
-            if message == b'Pause':
-                self.workflow.pause()
-                self.comm_sock.send(b"Paused")
-            elif message == b'Resume':
-                self.workflow.resume()
-                self.comm_sock.send(b"Resumed")
-            else:
-                self.workflow.send_data_to_step(json.loads(message.decode("utf-8")))
+            message = self.comm_sock.recv_multipart()
+            command, execution_uid = message[1], cast_unicode(message[2])
+            workflow = self.workflows.get(execution_uid, None)
+            if workflow is None:
+                logger.warning('Received message for unknown workflow execution {}'.format(execution_uid))
+                continue
 
-            gevent.sleep(0.1)
-        return
+            if command == b'Pause':
+                workflow.pause()
+            elif command == b'Resume':
+                workflow.resume()
+            elif command == b'Data':
+                workflow.send_data_to_step(json.loads(cast_unicode(message[3])))
 
     def on_data_sent(self, sender, **kwargs):
         """Listens for the data_sent callback, which signifies that an execution element needs to trigger a
@@ -337,8 +1190,32 @@ class Worker:
                 sender (execution element): The execution element that sent the signal.
                 kwargs (dict): Any extra data to send.
         """
-        packet_bytes = convert_to_protobuf(sender, self.workflow.get_execution_uid(), **kwargs)
-        self.results_sock.send(packet_bytes)
+        if not self.is_callback_needed(sender, kwargs['callback_name']):
+            return
+        workflow = self.greenlet_workflows.get(gevent.getcurrent(), None)
+        workflow_execution_uid = workflow.get_execution_uid() if workflow is not None else ''
+        with self.results_lock:
+            fill_protobuf_message(self.pending_packets.messages.add(), sender, workflow_execution_uid,
+                                  names=self.names, **kwargs)
+            if self.batch_started is None:
+                self.batch_started = time.time()
+            flush = (len(self.pending_packets.messages) >= self.batch_size
+                     or kwargs['callback_name'] in FLUSH_CALLBACKS
+                     or time.time() - self.batch_started >= self.batch_window)
+        if flush:
+            self.flush_callbacks()
+
+    def flush_callbacks(self):
+        """Sends all of the batched callbacks to the Receiver as a single frame.
+        """
+        with self.results_lock:
+            if not self.pending_packets.messages:
+                return
+            self.names.declare(self.pending_packets)
+            packet_bytes = self.pending_packets.SerializeToString()
+            self.pending_packets.Clear()
+            self.batch_started = None
+            self.results_sock.send(packet_bytes)
 
 
 class Receiver:
@@ -369,13 +1246,17 @@ class Receiver:
     }
 
     def __init__(self, ctx):
-        """Initialize a Receiver object, which will receive callbacks from the execution elements.
+        """Initialize a Receiver object, which will receive callbacks from the execution elements. Batches of
+        callbacks can also be sent over its control channel by the LoadBalancer, for workflows which could not finish
+        on a worker. The Receiver only decodes the callbacks and queues them for the receivers of their signals, which
+        are run by a CallbackDispatcher.
 
         Args:
             ctx (Context object): A Context object, shared with the LoadBalancer thread.
         """
-        self.thread_exit = False
         self.workflows_executed = 0
+        # The names interned by each worker session, by the ID of the session
+        self.session_names = OrderedDict()
 
         server_secret_file = os.path.join(core.config.paths.zmq_private_keys_path, "server.key_secret")
         server_public, server_secret = auth.load_certificate(server_secret_file)
@@ -386,7 +1267,11 @@ class Receiver:
         self.results_sock.curve_secretkey = server_secret
         self.results_sock.curve_publickey = server_public
         self.results_sock.curve_server = True
-        self.results_sock.bind(RESULTS_ADDR)
+        set_high_water_mark(self.results_sock, core.config.config.results_socket_hwm)
+        self.results_sock.bind(core.config.config.zmq_results_address)
+
+        self.control = ControlChannel(self.ctx, RECEIVER_CONTROL_ADDR)
+        self.dispatcher = CallbackDispatcher()
 
     @staticmethod
     def send_callback(callback, sender, data):
@@ -405,41 +1290,95 @@ class Receiver:
     def receive_results(self):
         """Keep receiving results from execution elements over a ZMQ socket, and trigger the callbacks.
         """
-        while True:
-            if self.thread_exit:
-                break
-            try:
-                message_bytes = self.results_sock.recv(zmq.NOBLOCK)
-            except zmq.ZMQError:
-                gevent.sleep(0.1)
-                continue
+        poller = zmq.Poller()
+        poller.register(self.results_sock, zmq.POLLIN)
+        poller.register(self.control.receiver, zmq.POLLIN)
+        self.dispatcher.start()
+
+        exiting = False
+        while not exiting:
+            events = dict(poller.poll())
+            if self.results_sock in events:
+                self.__receive_packets()
+            if self.control.receiver in events:
+                for message in self.control.recv_all():
+                    if message == b'Exit':
+                        exiting = True
+                    else:
+                        self.__dispatch_batch(message)
 
-            message_outer = data_pb2.Message()
-            message_outer.ParseFromString(message_bytes)
-
-            if message_outer.type == data_pb2.Message.WORKFLOWPACKET:
-                message = message_outer.workflow_packet
-            elif message_outer.type == data_pb2.Message.WORKFLOWPACKETDATA:
-                message = message_outer.workflow_packet_data
-            elif message_outer.type == data_pb2.Message.STEPPACKET:
-                message = message_outer.step_packet
-            elif message_outer.type == data_pb2.Message.STEPPACKETDATA:
-                message = message_outer.step_packet_data
-            else:
-                message = message_outer.general_packet
+        self.results_sock.close()
+        self.control.close()
+        self.dispatcher.stop(timeout=core.config.config.callback_sink_drain_timeout)
+        return
+
+    def shutdown(self):
+        """Stops the receive_results loop and closes its sockets. The callbacks already received are still handed to
+        their receivers.
+        """
+        self.control.send(b'Exit')
 
-            callback_name = message.callback_name
-            sender = message.sender
+    def get_sink_metrics(self):
+        """Gets how far behind the receivers of each sink are. Safe to call from any thread.
 
+        Returns:
+            (dict{str: dict}) The policy, queue depth, lag, and number of handled and dropped callbacks of each sink.
+        """
+        return self.dispatcher.get_metrics()
+
+    def __receive_packets(self):
+        while True:
             try:
-                callback = self.callback_lookup[callback_name]
-                data = json.loads(message.additional_data) if callback[1] else {}
-                Receiver.send_callback(callback[0], sender, data)
-            except KeyError:
-                logger.error('Unknown callback {} sent'.format(callback_name))
-            else:
-                if callback_name == 'Workflow Shutdown':
-                    self.workflows_executed += 1
+                message_bytes = self.results_sock.recv(zmq.NOBLOCK)
+            except zmq.Again:
+                return
+
+            self.__dispatch_batch(message_bytes)
+
+    def __dispatch_batch(self, message_bytes):
+        # A new batch is parsed every time, because the senders of its messages are still referenced by the
+        # callbacks queued in the sinks
+        batch = data_pb2.MessageBatch()
+        batch.ParseFromString(message_bytes)
+        names = None
+        if batch.HasField('session'):
+            names = self.session_names.pop(batch.session, {})
+            names.update(batch.names)
+            self.session_names[batch.session] = names
+            while len(self.session_names) > MAX_NAME_SESSIONS:
+                self.session_names.popitem(last=False)
+        for message_outer in batch.messages:
+            self.__dispatch_message(message_outer, names)
+
+    def __dispatch_message(self, message_outer, names=None):
+        """Triggers the callback for a single message out of a batch.
 
-        self.results_sock.close()
-        return
+        Args:
+            message_outer (data_pb2.Message): The message.
+            names (dict{int: str}, optional): The names interned by the worker session which sent the batch, if any.
+        """
+        if message_outer.type == data_pb2.Message.WORKFLOWPACKET:
+            message = message_outer.workflow_packet
+        elif message_outer.type == data_pb2.Message.WORKFLOWPACKETDATA:
+            message = message_outer.workflow_packet_data
+        elif message_outer.type == data_pb2.Message.STEPPACKET:
+            message = message_outer.step_packet
+        elif message_outer.type == data_pb2.Message.STEPPACKETDATA:
+            message = message_outer.step_packet_data
+        else:
+            message = message_outer.general_packet
+
+        callback_name = get_callback_name(message)
+        sender = message.sender
+        if names is not None:
+            restore_interned_names(sender, names)
+
+        try:
+            callback = self.callback_lookup[callback_name]
+            data = json.loads(message.additional_data) if callback[1] else {}
+            self.dispatcher.dispatch(callback[0], sender, data)
+        except KeyError:
+            logger.error('Unknown callback {} sent'.format(callback_name))
+        else:
+            if callback_name == 'Workflow Shutdown':
+                self.workflows_executed += 1
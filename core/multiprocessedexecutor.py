@@ -12,8 +12,10 @@ import zmq.green as zmq
 import core.config.config
 import core.config.paths
 from core import loadbalancer
+from core.autoscaler import Autoscaler
 from core.case import callbacks
 from core.threadauthenticator import ThreadAuthenticator
+from core.workflowqueue import UnknownPriority, QueueFull
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,9 @@ class MultiprocessedExecutor(object):
         self.threading_is_initialized = False
         self.uid = "executor"
         self.pids = []
+        self.next_worker_id = 0
+        self.spawn_lock = threading.Lock()
+        self.worker_environment_setup = None
         self.workflow_status = {}
         self.workflows_executed = 0
 
@@ -57,6 +62,10 @@ class MultiprocessedExecutor(object):
         self.manager_thread = None
         self.receiver = None
         self.receiver_thread = None
+        self.autoscaler = None
+        self.autoscaler_thread = None
+        self.supervisor_exit = threading.Event()
+        self.supervisor_thread = None
 
     def __trigger_workflow_status_wait(self, sender, **kwargs):
         self.workflow_status[sender.workflow_execution_uid] = WORKFLOW_AWAITING_DATA
@@ -79,17 +88,15 @@ class MultiprocessedExecutor(object):
             logging.error("Certificates are missing - run generate_certificates.py script first.")
             sys.exit(0)
 
-        for i in range(NUM_PROCESSES):
-            args = (i, worker_environment_setup) if worker_environment_setup else (i, )
-
-            pid = multiprocessing.Process(target=loadbalancer.Worker, args=args)
-            pid.start()
-            self.pids.append(pid)
+        self.worker_environment_setup = worker_environment_setup
+        for _ in range(NUM_PROCESSES):
+            self.spawn_worker()
 
         self.ctx = zmq.Context.instance()
         self.auth = ThreadAuthenticator(self.ctx)
         self.auth.start()
-        self.auth.allow('127.0.0.1')
+        if core.config.config.zmq_allowed_addresses:
+            self.auth.allow(*core.config.config.zmq_allowed_addresses)
         self.auth.configure_curve(domain='*', location=core.config.paths.zmq_public_keys_path)
 
         self.manager = loadbalancer.LoadBalancer(self.ctx)
@@ -101,10 +108,79 @@ class MultiprocessedExecutor(object):
         self.manager_thread = threading.Thread(target=self.manager.manage_workflows)
         self.manager_thread.start()
 
+        self.autoscaler = Autoscaler(self)
+        self.autoscaler_thread = threading.Thread(target=self.autoscaler.run)
+        self.autoscaler_thread.start()
+
+        self.supervisor_exit.clear()
+        self.supervisor_thread = threading.Thread(target=self.__run_supervisor)
+        self.supervisor_thread.start()
+
         self.threading_is_initialized = True
         logger.debug('Controller threading initialized')
         gevent.sleep(0)
 
+    def spawn_worker(self):
+        """Starts a new worker process, which will start receiving workflows once it has connected to the manager.
+        """
+        with self.spawn_lock:
+            worker_id = self.next_worker_id
+            self.next_worker_id += 1
+        args = (worker_id, self.worker_environment_setup) if self.worker_environment_setup else (worker_id, )
+
+        pid = multiprocessing.Process(target=loadbalancer.Worker, args=args, name='Worker-{}'.format(worker_id))
+        # Fork from a thread which has never run a gevent hub, so that the worker does not inherit watchers on the
+        # ZMQ sockets of this process
+        starter = threading.Thread(target=pid.start)
+        starter.start()
+        starter.join()
+        self.pids.append(pid)
+        callbacks.WorkerSpawned.send({'uid': 'Worker-{}'.format(worker_id)})
+
+    def retire_worker(self):
+        """Retires the worker which has been idle the longest, once it has finished its current workflows.
+        """
+        self.manager.retire_worker()
+
+    def count_workers(self):
+        """Counts the worker processes which are still running.
+
+        Returns:
+            (int) The number of running worker processes.
+        """
+        return len([pid for pid in self.pids if pid.is_alive()])
+
+    def __run_supervisor(self):
+        while not self.supervisor_exit.wait(core.config.config.worker_heartbeat_interval):
+            try:
+                self.supervise_workers()
+            except Exception:
+                logger.exception('Error while supervising the worker pool')
+
+    def supervise_workers(self):
+        """Replaces the worker processes which have died or stopped sending heartbeats, killing the latter. The
+        workflows they were executing are requeued or failed by the manager. Workers which exited after being
+        retired are forgotten.
+        """
+        lost = set(self.manager.get_lost_workers())
+        for pid in list(self.pids):
+            if pid.name in lost and pid.is_alive():
+                logger.error('Killing unresponsive worker {0}'.format(pid.name))
+                try:
+                    os.kill(pid.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+                pid.join(timeout=3)
+            if pid.is_alive():
+                continue
+            self.pids.remove(pid)
+            if pid.name in lost or pid.exitcode != 0:
+                logger.error('Worker {0} exited unexpectedly with code {1}. Replacing it'.format(pid.name,
+                                                                                                 pid.exitcode))
+                self.manager.remove_worker(pid.name)
+                callbacks.WorkerCrashed.send({'uid': pid.name})
+                self.spawn_worker()
+
     def shutdown_pool(self, num_workflows=0):
         """Shuts down the threadpool.
 
@@ -114,6 +190,13 @@ class MultiprocessedExecutor(object):
         """
         gevent.sleep(0.1)
 
+        if self.autoscaler_thread:
+            self.autoscaler.shutdown()
+            self.autoscaler_thread.join(timeout=1)
+        if self.supervisor_thread:
+            self.supervisor_exit.set()
+            self.supervisor_thread.join(timeout=5)
+
         timeout = 0
         shutdown = 10
 
@@ -127,7 +210,7 @@ class MultiprocessedExecutor(object):
             gevent.sleep(0.1)
 
         if self.manager_thread:
-            self.manager.thread_exit = True
+            self.manager.shutdown()
             self.manager_thread.join(timeout=1)
         if len(self.pids) > 0:
             for p in self.pids:
@@ -139,8 +222,8 @@ class MultiprocessedExecutor(object):
                     except (OSError, AttributeError):
                         pass
         if self.receiver_thread:
-            self.receiver.thread_exit = True
-            self.receiver_thread.join(timeout=1)
+            self.receiver.shutdown()
+            self.receiver_thread.join(timeout=core.config.config.callback_sink_drain_timeout + 1)
         self.threading_is_initialized = False
         logger.debug('Controller thread pool shutdown')
 
@@ -161,17 +244,30 @@ class MultiprocessedExecutor(object):
         self.threading_is_initialized = False
         self.manager = None
         self.receiver = None
+        self.autoscaler = None
+        self.autoscaler_thread = None
+        self.supervisor_thread = None
 
-    def execute_workflow(self, workflow, start=None, start_input=None):
+    def execute_workflow(self, workflow, start=None, start_input=None, priority=None, playbook_name=None,
+                         failure_policy=None):
         """Executes a workflow.
 
         Args:
             workflow (Workflow): The Workflow to be executed.
             start (str, optional): The name of the first, or starting step. Defaults to None.
             start_input (dict, optional): The input to the starting step of the workflow. Defaults to None.
+            priority (str, optional): The priority class of the workflow. Defaults to the default priority.
+            playbook_name (str, optional): The playbook of the workflow, which it is fairly shared with while queued.
+            failure_policy (str, optional): Whether the workflow is requeued ('requeue') or failed ('fail') if its
+                worker crashes. Defaults to the worker_failure_policy in the config.
 
         Returns:
             The execution UID of the Workflow.
+
+        Raises:
+            UnknownPriority: If the priority class is not configured.
+            QueueFull: If too many workflows are waiting for a worker and the workflow was rejected.
+            ValueError: If the failure policy is not one of the supported policies.
         """
         uid = uuid.uuid4().hex
 
@@ -190,7 +286,15 @@ class MultiprocessedExecutor(object):
         if start_input:
             workflow_json['start_input'] = start_input
         workflow_json['execution_uid'] = uid
-        self.manager.add_workflow(workflow_json)
+        try:
+            dropped = self.manager.add_workflow(workflow_json, priority=priority, playbook_name=playbook_name,
+                                                failure_policy=failure_policy)
+        except (UnknownPriority, QueueFull, ValueError):
+            self.workflow_status.pop(uid, None)
+            raise
+        if dropped is not None:
+            logger.warning('Workflow queue is full. Dropped queued workflow {0}'.format(dropped['execution_uid']))
+            self.workflow_status.pop(dropped['execution_uid'], None)
 
         callbacks.SchedulerJobExecuted.send(self)
         # TODO: Find some way to catch a validation error. Maybe pre-validate the input in the controller?
@@ -226,6 +330,48 @@ class MultiprocessedExecutor(object):
             logger.warning('Cannot resume workflow {0}. Invalid key'.format(workflow_execution_uid))
             return False
 
+    def get_queue_position(self, execution_uid):
+        """Gets the position of a workflow which is waiting for a worker.
+
+        Args:
+            execution_uid (str): The execution UID of the workflow.
+
+        Returns:
+            (int) The number of workflows which will be dispatched before it, or None if it is not queued.
+        """
+        return self.manager.get_queue_position(execution_uid) if self.manager is not None else None
+
+    def get_queue_stats(self):
+        """Gets the number of queued workflows and their wait times for each priority class.
+
+        Returns:
+            (dict{str: dict}) The statistics of each priority class.
+        """
+        return self.manager.get_queue_stats() if self.manager is not None else {}
+
+    def get_admission_stats(self):
+        """Gets the depth and limit of the workflow queue and how often workflows were turned away because it was full.
+
+        Returns:
+            (dict) The admission statistics of the queue.
+        """
+        return self.manager.get_admission_stats() if self.manager is not None else {}
+
+    def get_dispatch_metrics(self):
+        """Gets the time workflows spend being queued and dispatched, the depth of the queue, and the utilization of
+        each worker.
+
+        Returns:
+            (dict) The dispatch metrics of the load balancer, and how far behind the receivers of each callback sink
+                are under 'callback_sinks'.
+        """
+        if self.manager is None:
+            return {}
+        dispatch_metrics = self.manager.get_dispatch_metrics()
+        if self.receiver is not None:
+            dispatch_metrics['callback_sinks'] = self.receiver.get_sink_metrics()
+        return dispatch_metrics
+
     def get_waiting_workflows(self):
         """Gets a list of the execution UIDs of workflows currently awaiting data to be sent to a trigger.
 
@@ -1,13 +1,14 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: data.proto
 
 import sys
 _b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf.internal import enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -19,9 +20,140 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='data.proto',
   package='core',
   syntax='proto2',
-  serialized_pb=_b('\n\ndata.proto\x12\x04\x63ore\"\x81\x03\n\x07Message\x12 \n\x04type\x18\x01 \x01(\x0e\x32\x12.core.Message.Type\x12-\n\x0fworkflow_packet\x18\x02 \x01(\x0b\x32\x14.core.WorkflowPacket\x12\x36\n\x14workflow_packet_data\x18\x03 \x01(\x0b\x32\x18.core.WorkflowPacketData\x12%\n\x0bstep_packet\x18\x04 \x01(\x0b\x32\x10.core.StepPacket\x12.\n\x10step_packet_data\x18\x05 \x01(\x0b\x32\x14.core.StepPacketData\x12+\n\x0egeneral_packet\x18\x06 \x01(\x0b\x32\x13.core.GeneralPacket\"i\n\x04Type\x12\x12\n\x0eWORKFLOWPACKET\x10\x01\x12\x16\n\x12WORKFLOWPACKETDATA\x10\x02\x12\x0e\n\nSTEPPACKET\x10\x03\x12\x12\n\x0eSTEPPACKETDATA\x10\x04\x12\x11\n\rGENERALPACKET\x10\x05\"\xa9\x01\n\x0eWorkflowPacket\x12\x33\n\x06sender\x18\x01 \x01(\x0b\x32#.core.WorkflowPacket.WorkflowSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x1aK\n\x0eWorkflowSender\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03uid\x18\x02 \x01(\t\x12\x1e\n\x16workflow_execution_uid\x18\x03 \x01(\t\"y\n\x12WorkflowPacketData\x12\x33\n\x06sender\x18\x01 \x01(\x0b\x32#.core.WorkflowPacket.WorkflowSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_data\x18\x03 \x01(\t\"\xb3\x02\n\nStepPacket\x12+\n\x06sender\x18\x01 \x01(\x0b\x32\x1b.core.StepPacket.StepSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x1a\xe0\x01\n\nStepSender\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03uid\x18\x02 \x01(\t\x12\x15\n\rexecution_uid\x18\x03 \x01(\t\x12\x0b\n\x03\x61pp\x18\x04 \x01(\t\x12\x0e\n\x06\x61\x63tion\x18\x05 \x01(\t\x12\x35\n\x05input\x18\x06 \x03(\x0b\x32&.core.StepPacket.StepSender.InputEntry\x12\x1e\n\x16workflow_execution_uid\x18\x07 \x01(\t\x1a,\n\nInputEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"m\n\x0eStepPacketData\x12+\n\x06sender\x18\x01 \x01(\x0b\x32\x1b.core.StepPacket.StepSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_data\x18\x03 \x01(\t\"\xa4\x01\n\rGeneralPacket\x12\x31\n\x06sender\x18\x01 \x01(\x0b\x32!.core.GeneralPacket.GeneralSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x1aI\n\rGeneralSender\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x0b\n\x03\x61pp\x18\x02 \x01(\t\x12\x1e\n\x16workflow_execution_uid\x18\x03 \x01(\t')
+  serialized_options=None,
+  serialized_pb=_b('\n\ndata.proto\x12\x04\x63ore\"\x81\x03\n\x07Message\x12 \n\x04type\x18\x01 \x01(\x0e\x32\x12.core.Message.Type\x12-\n\x0fworkflow_packet\x18\x02 \x01(\x0b\x32\x14.core.WorkflowPacket\x12\x36\n\x14workflow_packet_data\x18\x03 \x01(\x0b\x32\x18.core.WorkflowPacketData\x12%\n\x0bstep_packet\x18\x04 \x01(\x0b\x32\x10.core.StepPacket\x12.\n\x10step_packet_data\x18\x05 \x01(\x0b\x32\x14.core.StepPacketData\x12+\n\x0egeneral_packet\x18\x06 \x01(\x0b\x32\x13.core.GeneralPacket\"i\n\x04Type\x12\x12\n\x0eWORKFLOWPACKET\x10\x01\x12\x16\n\x12WORKFLOWPACKETDATA\x10\x02\x12\x0e\n\nSTEPPACKET\x10\x03\x12\x12\n\x0eSTEPPACKETDATA\x10\x04\x12\x11\n\rGENERALPACKET\x10\x05\"\x9c\x01\n\x0cMessageBatch\x12\x1f\n\x08messages\x18\x01 \x03(\x0b\x32\r.core.Message\x12\x0f\n\x07session\x18\x02 \x01(\x0c\x12,\n\x05names\x18\x03 \x03(\x0b\x32\x1d.core.MessageBatch.NamesEntry\x1a,\n\nNamesEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"v\n\x10\x45xecutionRequest\x12\x15\n\rworkflow_hash\x18\x01 \x01(\x0c\x12\x15\n\rexecution_uid\x18\x02 \x01(\t\x12\r\n\x05start\x18\x03 \x01(\t\x12\x13\n\x0bstart_input\x18\x04 \x01(\t\x12\x10\n\x08workflow\x18\x05 \x01(\t\"\xdc\x01\n\x0eWorkflowPacket\x12\x33\n\x06sender\x18\x01 \x01(\x0b\x32#.core.WorkflowPacket.WorkflowSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x12 \n\x08\x63\x61llback\x18\x03 \x01(\x0e\x32\x0e.core.Callback\x1a\\\n\x0eWorkflowSender\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03uid\x18\x02 \x01(\t\x12\x1e\n\x16workflow_execution_uid\x18\x03 \x01(\t\x12\x0f\n\x07name_id\x18\x04 \x01(\r\"\x9b\x01\n\x12WorkflowPacketData\x12\x33\n\x06sender\x18\x01 \x01(\x0b\x32#.core.WorkflowPacket.WorkflowSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_data\x18\x03 \x01(\t\x12 \n\x08\x63\x61llback\x18\x04 \x01(\x0e\x32\x0e.core.Callback\"\x89\x03\n\nStepPacket\x12+\n\x06sender\x18\x01 \x01(\x0b\x32\x1b.core.StepPacket.StepSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x12 \n\x08\x63\x61llback\x18\x03 \x01(\x0e\x32\x0e.core.Callback\x1a\x94\x02\n\nStepSender\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03uid\x18\x02 \x01(\t\x12\x15\n\rexecution_uid\x18\x03 \x01(\t\x12\x0b\n\x03\x61pp\x18\x04 \x01(\t\x12\x0e\n\x06\x61\x63tion\x18\x05 \x01(\t\x12\x35\n\x05input\x18\x06 \x03(\x0b\x32&.core.StepPacket.StepSender.InputEntry\x12\x1e\n\x16workflow_execution_uid\x18\x07 \x01(\t\x12\x0f\n\x07name_id\x18\x08 \x01(\r\x12\x0e\n\x06\x61pp_id\x18\t \x01(\r\x12\x11\n\taction_id\x18\n \x01(\r\x1a,\n\nInputEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x8f\x01\n\x0eStepPacketData\x12+\n\x06sender\x18\x01 \x01(\x0b\x32\x1b.core.StepPacket.StepSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_data\x18\x03 \x01(\t\x12 \n\x08\x63\x61llback\x18\x04 \x01(\x0e\x32\x0e.core.Callback\"\xd6\x01\n\rGeneralPacket\x12\x31\n\x06sender\x18\x01 \x01(\x0b\x32!.core.GeneralPacket.GeneralSender\x12\x15\n\rcallback_name\x18\x02 \x01(\t\x12 \n\x08\x63\x61llback\x18\x03 \x01(\x0e\x32\x0e.core.Callback\x1aY\n\rGeneralSender\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x0b\n\x03\x61pp\x18\x02 \x01(\t\x12\x1e\n\x16workflow_execution_uid\x18\x03 \x01(\t\x12\x0e\n\x06\x61pp_id\x18\x04 \x01(\r*\xb8\x04\n\x08\x43\x61llback\x12\x1c\n\x18WORKFLOW_EXECUTION_START\x10\x01\x12\x13\n\x0fNEXT_STEP_FOUND\x10\x02\x12\x18\n\x14\x41PP_INSTANCE_CREATED\x10\x03\x12\x15\n\x11WORKFLOW_SHUTDOWN\x10\x04\x12\x1c\n\x18WORKFLOW_INPUT_VALIDATED\x10\x05\x12\x1a\n\x16WORKFLOW_INPUT_INVALID\x10\x06\x12\x13\n\x0fWORKFLOW_PAUSED\x10\x07\x12\x14\n\x10WORKFLOW_RESUMED\x10\x08\x12\x1a\n\x16STEP_EXECUTION_SUCCESS\x10\t\x12\x18\n\x14STEP_EXECUTION_ERROR\x10\n\x12\x10\n\x0cSTEP_STARTED\x10\x0b\x12\x1e\n\x1a\x46UNCTION_EXECUTION_SUCCESS\x10\x0c\x12\x16\n\x12STEP_INPUT_INVALID\x10\r\x12\x19\n\x15\x43ONDITIONALS_EXECUTED\x10\x0e\x12\x13\n\x0fNEXT_STEP_TAKEN\x10\x0f\x12\x17\n\x13NEXT_STEP_NOT_TAKEN\x10\x10\x12\x10\n\x0c\x46LAG_SUCCESS\x10\x11\x12\x0e\n\nFLAG_ERROR\x10\x12\x12\x12\n\x0e\x46ILTER_SUCCESS\x10\x13\x12\x10\n\x0c\x46ILTER_ERROR\x10\x14\x12\x16\n\x12TRIGGER_STEP_TAKEN\x10\x15\x12\x1a\n\x16TRIGGER_STEP_NOT_TAKEN\x10\x16\x12\x1e\n\x1aTRIGGER_STEP_AWAITING_DATA\x10\x17')
 )
 
+_CALLBACK = _descriptor.EnumDescriptor(
+  name='Callback',
+  full_name='core.Callback',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='WORKFLOW_EXECUTION_START', index=0, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NEXT_STEP_FOUND', index=1, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='APP_INSTANCE_CREATED', index=2, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WORKFLOW_SHUTDOWN', index=3, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WORKFLOW_INPUT_VALIDATED', index=4, number=5,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WORKFLOW_INPUT_INVALID', index=5, number=6,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WORKFLOW_PAUSED', index=6, number=7,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WORKFLOW_RESUMED', index=7, number=8,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STEP_EXECUTION_SUCCESS', index=8, number=9,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STEP_EXECUTION_ERROR', index=9, number=10,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STEP_STARTED', index=10, number=11,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FUNCTION_EXECUTION_SUCCESS', index=11, number=12,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STEP_INPUT_INVALID', index=12, number=13,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CONDITIONALS_EXECUTED', index=13, number=14,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NEXT_STEP_TAKEN', index=14, number=15,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NEXT_STEP_NOT_TAKEN', index=15, number=16,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FLAG_SUCCESS', index=16, number=17,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FLAG_ERROR', index=17, number=18,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILTER_SUCCESS', index=18, number=19,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILTER_ERROR', index=19, number=20,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TRIGGER_STEP_TAKEN', index=20, number=21,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TRIGGER_STEP_NOT_TAKEN', index=21, number=22,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TRIGGER_STEP_AWAITING_DATA', index=22, number=23,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=1828,
+  serialized_end=2396,
+)
+_sym_db.RegisterEnumDescriptor(_CALLBACK)
+
+Callback = enum_type_wrapper.EnumTypeWrapper(_CALLBACK)
+WORKFLOW_EXECUTION_START = 1
+NEXT_STEP_FOUND = 2
+APP_INSTANCE_CREATED = 3
+WORKFLOW_SHUTDOWN = 4
+WORKFLOW_INPUT_VALIDATED = 5
+WORKFLOW_INPUT_INVALID = 6
+WORKFLOW_PAUSED = 7
+WORKFLOW_RESUMED = 8
+STEP_EXECUTION_SUCCESS = 9
+STEP_EXECUTION_ERROR = 10
+STEP_STARTED = 11
+FUNCTION_EXECUTION_SUCCESS = 12
+STEP_INPUT_INVALID = 13
+CONDITIONALS_EXECUTED = 14
+NEXT_STEP_TAKEN = 15
+NEXT_STEP_NOT_TAKEN = 16
+FLAG_SUCCESS = 17
+FLAG_ERROR = 18
+FILTER_SUCCESS = 19
+FILTER_ERROR = 20
+TRIGGER_STEP_TAKEN = 21
+TRIGGER_STEP_NOT_TAKEN = 22
+TRIGGER_STEP_AWAITING_DATA = 23
 
 
 _MESSAGE_TYPE = _descriptor.EnumDescriptor(
@@ -32,27 +164,27 @@ _MESSAGE_TYPE = _descriptor.EnumDescriptor(
   values=[
     _descriptor.EnumValueDescriptor(
       name='WORKFLOWPACKET', index=0, number=1,
-      options=None,
+      serialized_options=None,
       type=None),
     _descriptor.EnumValueDescriptor(
       name='WORKFLOWPACKETDATA', index=1, number=2,
-      options=None,
+      serialized_options=None,
       type=None),
     _descriptor.EnumValueDescriptor(
       name='STEPPACKET', index=2, number=3,
-      options=None,
+      serialized_options=None,
       type=None),
     _descriptor.EnumValueDescriptor(
       name='STEPPACKETDATA', index=3, number=4,
-      options=None,
+      serialized_options=None,
       type=None),
     _descriptor.EnumValueDescriptor(
       name='GENERALPACKET', index=4, number=5,
-      options=None,
+      serialized_options=None,
       type=None),
   ],
   containing_type=None,
-  options=None,
+  serialized_options=None,
   serialized_start=301,
   serialized_end=406,
 )
@@ -72,42 +204,42 @@ _MESSAGE = _descriptor.Descriptor(
       has_default_value=False, default_value=1,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='workflow_packet', full_name='core.Message.workflow_packet', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='workflow_packet_data', full_name='core.Message.workflow_packet_data', index=2,
       number=3, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='step_packet', full_name='core.Message.step_packet', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='step_packet_data', full_name='core.Message.step_packet_data', index=4,
       number=5, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='general_packet', full_name='core.Message.general_packet', index=5,
       number=6, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -115,7 +247,7 @@ _MESSAGE = _descriptor.Descriptor(
   enum_types=[
     _MESSAGE_TYPE,
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
@@ -126,6 +258,147 @@ _MESSAGE = _descriptor.Descriptor(
 )
 
 
+_MESSAGEBATCH_NAMESENTRY = _descriptor.Descriptor(
+  name='NamesEntry',
+  full_name='core.MessageBatch.NamesEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='core.MessageBatch.NamesEntry.key', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='core.MessageBatch.NamesEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('8\001'),
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=521,
+  serialized_end=565,
+)
+
+_MESSAGEBATCH = _descriptor.Descriptor(
+  name='MessageBatch',
+  full_name='core.MessageBatch',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='messages', full_name='core.MessageBatch.messages', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='session', full_name='core.MessageBatch.session', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='names', full_name='core.MessageBatch.names', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_MESSAGEBATCH_NAMESENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=409,
+  serialized_end=565,
+)
+
+
+_EXECUTIONREQUEST = _descriptor.Descriptor(
+  name='ExecutionRequest',
+  full_name='core.ExecutionRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='workflow_hash', full_name='core.ExecutionRequest.workflow_hash', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='execution_uid', full_name='core.ExecutionRequest.execution_uid', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='start', full_name='core.ExecutionRequest.start', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='start_input', full_name='core.ExecutionRequest.start_input', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='workflow', full_name='core.ExecutionRequest.workflow', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=567,
+  serialized_end=685,
+)
+
+
 _WORKFLOWPACKET_WORKFLOWSENDER = _descriptor.Descriptor(
   name='WorkflowSender',
   full_name='core.WorkflowPacket.WorkflowSender',
@@ -139,35 +412,42 @@ _WORKFLOWPACKET_WORKFLOWSENDER = _descriptor.Descriptor(
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='uid', full_name='core.WorkflowPacket.WorkflowSender.uid', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='workflow_execution_uid', full_name='core.WorkflowPacket.WorkflowSender.workflow_execution_uid', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name_id', full_name='core.WorkflowPacket.WorkflowSender.name_id', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=503,
-  serialized_end=578,
+  serialized_start=816,
+  serialized_end=908,
 )
 
 _WORKFLOWPACKET = _descriptor.Descriptor(
@@ -183,28 +463,35 @@ _WORKFLOWPACKET = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='callback_name', full_name='core.WorkflowPacket.callback_name', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='callback', full_name='core.WorkflowPacket.callback', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[_WORKFLOWPACKET_WORKFLOWSENDER, ],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=409,
-  serialized_end=578,
+  serialized_start=688,
+  serialized_end=908,
 )
 
 
@@ -221,35 +508,42 @@ _WORKFLOWPACKETDATA = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='callback_name', full_name='core.WorkflowPacketData.callback_name', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='additional_data', full_name='core.WorkflowPacketData.additional_data', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='callback', full_name='core.WorkflowPacketData.callback', index=3,
+      number=4, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=580,
-  serialized_end=701,
+  serialized_start=911,
+  serialized_end=1066,
 )
 
 
@@ -266,28 +560,28 @@ _STEPPACKET_STEPSENDER_INPUTENTRY = _descriptor.Descriptor(
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='value', full_name='core.StepPacket.StepSender.InputEntry.value', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  serialized_options=_b('8\001'),
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=967,
-  serialized_end=1011,
+  serialized_start=1418,
+  serialized_end=1462,
 )
 
 _STEPPACKET_STEPSENDER = _descriptor.Descriptor(
@@ -303,63 +597,84 @@ _STEPPACKET_STEPSENDER = _descriptor.Descriptor(
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='uid', full_name='core.StepPacket.StepSender.uid', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='execution_uid', full_name='core.StepPacket.StepSender.execution_uid', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='app', full_name='core.StepPacket.StepSender.app', index=3,
       number=4, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='action', full_name='core.StepPacket.StepSender.action', index=4,
       number=5, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='input', full_name='core.StepPacket.StepSender.input', index=5,
       number=6, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='workflow_execution_uid', full_name='core.StepPacket.StepSender.workflow_execution_uid', index=6,
       number=7, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name_id', full_name='core.StepPacket.StepSender.name_id', index=7,
+      number=8, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='app_id', full_name='core.StepPacket.StepSender.app_id', index=8,
+      number=9, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='action_id', full_name='core.StepPacket.StepSender.action_id', index=9,
+      number=10, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[_STEPPACKET_STEPSENDER_INPUTENTRY, ],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=787,
-  serialized_end=1011,
+  serialized_start=1186,
+  serialized_end=1462,
 )
 
 _STEPPACKET = _descriptor.Descriptor(
@@ -375,28 +690,35 @@ _STEPPACKET = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='callback_name', full_name='core.StepPacket.callback_name', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='callback', full_name='core.StepPacket.callback', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[_STEPPACKET_STEPSENDER, ],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=704,
-  serialized_end=1011,
+  serialized_start=1069,
+  serialized_end=1462,
 )
 
 
@@ -413,35 +735,42 @@ _STEPPACKETDATA = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='callback_name', full_name='core.StepPacketData.callback_name', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='additional_data', full_name='core.StepPacketData.additional_data', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='callback', full_name='core.StepPacketData.callback', index=3,
+      number=4, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1013,
-  serialized_end=1122,
+  serialized_start=1465,
+  serialized_end=1608,
 )
 
 
@@ -458,35 +787,42 @@ _GENERALPACKET_GENERALSENDER = _descriptor.Descriptor(
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='app', full_name='core.GeneralPacket.GeneralSender.app', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='workflow_execution_uid', full_name='core.GeneralPacket.GeneralSender.workflow_execution_uid', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='app_id', full_name='core.GeneralPacket.GeneralSender.app_id', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1216,
-  serialized_end=1289,
+  serialized_start=1736,
+  serialized_end=1825,
 )
 
 _GENERALPACKET = _descriptor.Descriptor(
@@ -502,28 +838,35 @@ _GENERALPACKET = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='callback_name', full_name='core.GeneralPacket.callback_name', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='callback', full_name='core.GeneralPacket.callback', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[_GENERALPACKET_GENERALSENDER, ],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto2',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1125,
-  serialized_end=1289,
+  serialized_start=1611,
+  serialized_end=1825,
 )
 
 _MESSAGE.fields_by_name['type'].enum_type = _MESSAGE_TYPE
@@ -533,99 +876,132 @@ _MESSAGE.fields_by_name['step_packet'].message_type = _STEPPACKET
 _MESSAGE.fields_by_name['step_packet_data'].message_type = _STEPPACKETDATA
 _MESSAGE.fields_by_name['general_packet'].message_type = _GENERALPACKET
 _MESSAGE_TYPE.containing_type = _MESSAGE
+_MESSAGEBATCH_NAMESENTRY.containing_type = _MESSAGEBATCH
+_MESSAGEBATCH.fields_by_name['messages'].message_type = _MESSAGE
+_MESSAGEBATCH.fields_by_name['names'].message_type = _MESSAGEBATCH_NAMESENTRY
 _WORKFLOWPACKET_WORKFLOWSENDER.containing_type = _WORKFLOWPACKET
 _WORKFLOWPACKET.fields_by_name['sender'].message_type = _WORKFLOWPACKET_WORKFLOWSENDER
+_WORKFLOWPACKET.fields_by_name['callback'].enum_type = _CALLBACK
 _WORKFLOWPACKETDATA.fields_by_name['sender'].message_type = _WORKFLOWPACKET_WORKFLOWSENDER
+_WORKFLOWPACKETDATA.fields_by_name['callback'].enum_type = _CALLBACK
 _STEPPACKET_STEPSENDER_INPUTENTRY.containing_type = _STEPPACKET_STEPSENDER
 _STEPPACKET_STEPSENDER.fields_by_name['input'].message_type = _STEPPACKET_STEPSENDER_INPUTENTRY
 _STEPPACKET_STEPSENDER.containing_type = _STEPPACKET
 _STEPPACKET.fields_by_name['sender'].message_type = _STEPPACKET_STEPSENDER
+_STEPPACKET.fields_by_name['callback'].enum_type = _CALLBACK
 _STEPPACKETDATA.fields_by_name['sender'].message_type = _STEPPACKET_STEPSENDER
+_STEPPACKETDATA.fields_by_name['callback'].enum_type = _CALLBACK
 _GENERALPACKET_GENERALSENDER.containing_type = _GENERALPACKET
 _GENERALPACKET.fields_by_name['sender'].message_type = _GENERALPACKET_GENERALSENDER
+_GENERALPACKET.fields_by_name['callback'].enum_type = _CALLBACK
 DESCRIPTOR.message_types_by_name['Message'] = _MESSAGE
+DESCRIPTOR.message_types_by_name['MessageBatch'] = _MESSAGEBATCH
+DESCRIPTOR.message_types_by_name['ExecutionRequest'] = _EXECUTIONREQUEST
 DESCRIPTOR.message_types_by_name['WorkflowPacket'] = _WORKFLOWPACKET
 DESCRIPTOR.message_types_by_name['WorkflowPacketData'] = _WORKFLOWPACKETDATA
 DESCRIPTOR.message_types_by_name['StepPacket'] = _STEPPACKET
 DESCRIPTOR.message_types_by_name['StepPacketData'] = _STEPPACKETDATA
 DESCRIPTOR.message_types_by_name['GeneralPacket'] = _GENERALPACKET
+DESCRIPTOR.enum_types_by_name['Callback'] = _CALLBACK
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
-Message = _reflection.GeneratedProtocolMessageType('Message', (_message.Message,), dict(
-  DESCRIPTOR = _MESSAGE,
-  __module__ = 'data_pb2'
+Message = _reflection.GeneratedProtocolMessageType('Message', (_message.Message,), {
+  'DESCRIPTOR' : _MESSAGE,
+  '__module__' : 'data_pb2'
   # @@protoc_insertion_point(class_scope:core.Message)
-  ))
+  })
 _sym_db.RegisterMessage(Message)
 
-WorkflowPacket = _reflection.GeneratedProtocolMessageType('WorkflowPacket', (_message.Message,), dict(
+MessageBatch = _reflection.GeneratedProtocolMessageType('MessageBatch', (_message.Message,), {
 
-  WorkflowSender = _reflection.GeneratedProtocolMessageType('WorkflowSender', (_message.Message,), dict(
-    DESCRIPTOR = _WORKFLOWPACKET_WORKFLOWSENDER,
-    __module__ = 'data_pb2'
+  'NamesEntry' : _reflection.GeneratedProtocolMessageType('NamesEntry', (_message.Message,), {
+    'DESCRIPTOR' : _MESSAGEBATCH_NAMESENTRY,
+    '__module__' : 'data_pb2'
+    # @@protoc_insertion_point(class_scope:core.MessageBatch.NamesEntry)
+    })
+  ,
+  'DESCRIPTOR' : _MESSAGEBATCH,
+  '__module__' : 'data_pb2'
+  # @@protoc_insertion_point(class_scope:core.MessageBatch)
+  })
+_sym_db.RegisterMessage(MessageBatch)
+_sym_db.RegisterMessage(MessageBatch.NamesEntry)
+
+ExecutionRequest = _reflection.GeneratedProtocolMessageType('ExecutionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EXECUTIONREQUEST,
+  '__module__' : 'data_pb2'
+  # @@protoc_insertion_point(class_scope:core.ExecutionRequest)
+  })
+_sym_db.RegisterMessage(ExecutionRequest)
+
+WorkflowPacket = _reflection.GeneratedProtocolMessageType('WorkflowPacket', (_message.Message,), {
+
+  'WorkflowSender' : _reflection.GeneratedProtocolMessageType('WorkflowSender', (_message.Message,), {
+    'DESCRIPTOR' : _WORKFLOWPACKET_WORKFLOWSENDER,
+    '__module__' : 'data_pb2'
     # @@protoc_insertion_point(class_scope:core.WorkflowPacket.WorkflowSender)
-    ))
+    })
   ,
-  DESCRIPTOR = _WORKFLOWPACKET,
-  __module__ = 'data_pb2'
+  'DESCRIPTOR' : _WORKFLOWPACKET,
+  '__module__' : 'data_pb2'
   # @@protoc_insertion_point(class_scope:core.WorkflowPacket)
-  ))
+  })
 _sym_db.RegisterMessage(WorkflowPacket)
 _sym_db.RegisterMessage(WorkflowPacket.WorkflowSender)
 
-WorkflowPacketData = _reflection.GeneratedProtocolMessageType('WorkflowPacketData', (_message.Message,), dict(
-  DESCRIPTOR = _WORKFLOWPACKETDATA,
-  __module__ = 'data_pb2'
+WorkflowPacketData = _reflection.GeneratedProtocolMessageType('WorkflowPacketData', (_message.Message,), {
+  'DESCRIPTOR' : _WORKFLOWPACKETDATA,
+  '__module__' : 'data_pb2'
   # @@protoc_insertion_point(class_scope:core.WorkflowPacketData)
-  ))
+  })
 _sym_db.RegisterMessage(WorkflowPacketData)
 
-StepPacket = _reflection.GeneratedProtocolMessageType('StepPacket', (_message.Message,), dict(
+StepPacket = _reflection.GeneratedProtocolMessageType('StepPacket', (_message.Message,), {
 
-  StepSender = _reflection.GeneratedProtocolMessageType('StepSender', (_message.Message,), dict(
+  'StepSender' : _reflection.GeneratedProtocolMessageType('StepSender', (_message.Message,), {
 
-    InputEntry = _reflection.GeneratedProtocolMessageType('InputEntry', (_message.Message,), dict(
-      DESCRIPTOR = _STEPPACKET_STEPSENDER_INPUTENTRY,
-      __module__ = 'data_pb2'
+    'InputEntry' : _reflection.GeneratedProtocolMessageType('InputEntry', (_message.Message,), {
+      'DESCRIPTOR' : _STEPPACKET_STEPSENDER_INPUTENTRY,
+      '__module__' : 'data_pb2'
       # @@protoc_insertion_point(class_scope:core.StepPacket.StepSender.InputEntry)
-      ))
+      })
     ,
-    DESCRIPTOR = _STEPPACKET_STEPSENDER,
-    __module__ = 'data_pb2'
+    'DESCRIPTOR' : _STEPPACKET_STEPSENDER,
+    '__module__' : 'data_pb2'
     # @@protoc_insertion_point(class_scope:core.StepPacket.StepSender)
-    ))
+    })
   ,
-  DESCRIPTOR = _STEPPACKET,
-  __module__ = 'data_pb2'
+  'DESCRIPTOR' : _STEPPACKET,
+  '__module__' : 'data_pb2'
   # @@protoc_insertion_point(class_scope:core.StepPacket)
-  ))
+  })
 _sym_db.RegisterMessage(StepPacket)
 _sym_db.RegisterMessage(StepPacket.StepSender)
 _sym_db.RegisterMessage(StepPacket.StepSender.InputEntry)
 
-StepPacketData = _reflection.GeneratedProtocolMessageType('StepPacketData', (_message.Message,), dict(
-  DESCRIPTOR = _STEPPACKETDATA,
-  __module__ = 'data_pb2'
+StepPacketData = _reflection.GeneratedProtocolMessageType('StepPacketData', (_message.Message,), {
+  'DESCRIPTOR' : _STEPPACKETDATA,
+  '__module__' : 'data_pb2'
   # @@protoc_insertion_point(class_scope:core.StepPacketData)
-  ))
+  })
 _sym_db.RegisterMessage(StepPacketData)
 
-GeneralPacket = _reflection.GeneratedProtocolMessageType('GeneralPacket', (_message.Message,), dict(
+GeneralPacket = _reflection.GeneratedProtocolMessageType('GeneralPacket', (_message.Message,), {
 
-  GeneralSender = _reflection.GeneratedProtocolMessageType('GeneralSender', (_message.Message,), dict(
-    DESCRIPTOR = _GENERALPACKET_GENERALSENDER,
-    __module__ = 'data_pb2'
+  'GeneralSender' : _reflection.GeneratedProtocolMessageType('GeneralSender', (_message.Message,), {
+    'DESCRIPTOR' : _GENERALPACKET_GENERALSENDER,
+    '__module__' : 'data_pb2'
     # @@protoc_insertion_point(class_scope:core.GeneralPacket.GeneralSender)
-    ))
+    })
   ,
-  DESCRIPTOR = _GENERALPACKET,
-  __module__ = 'data_pb2'
+  'DESCRIPTOR' : _GENERALPACKET,
+  '__module__' : 'data_pb2'
   # @@protoc_insertion_point(class_scope:core.GeneralPacket)
-  ))
+  })
 _sym_db.RegisterMessage(GeneralPacket)
 _sym_db.RegisterMessage(GeneralPacket.GeneralSender)
 
 
-_STEPPACKET_STEPSENDER_INPUTENTRY.has_options = True
-_STEPPACKET_STEPSENDER_INPUTENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_MESSAGEBATCH_NAMESENTRY._options = None
+_STEPPACKET_STEPSENDER_INPUTENTRY._options = None
 # @@protoc_insertion_point(module_scope)
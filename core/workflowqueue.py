@@ -0,0 +1,275 @@
+import threading
+import time
+from collections import deque
+
+try:
+    from Queue import Empty
+except ImportError:
+    from queue import Empty
+
+import core.config.config
+from core.instrumentation import Histogram, Gauge
+
+
+OVERFLOW_POLICIES = ('reject', 'drop_oldest', 'block')
+
+
+class UnknownPriority(Exception):
+    pass
+
+
+class QueueFull(Exception):
+    def __init__(self, message, retry_after=None):
+        super(QueueFull, self).__init__(message)
+        self.retry_after = retry_after
+
+
+class _FairQueue(object):
+    def __init__(self):
+        """Initializes a _FairQueue, which shares dispatches between its flows in proportion to their weights using
+        stride scheduling. A flow which becomes active does not get credit for the time it was empty.
+        """
+        self.flows = {}
+        self.passes = {}
+        self.virtual_time = 0.0
+        self.size = 0
+
+    def put(self, key, item):
+        flow = self.flows.get(key, None)
+        if flow is None:
+            flow = self.flows[key] = deque()
+        if not flow:
+            self.passes[key] = max(self.passes.get(key, 0.0), self.virtual_time)
+        flow.append(item)
+        self.size += 1
+
+    def next_key(self, weight_of, passes=None, sizes=None):
+        passes = passes if passes is not None else self.passes
+        candidates = [key for key, flow in self.flows.items() if (sizes[key] if sizes is not None else flow)]
+        if not candidates:
+            raise Empty
+        return min(candidates, key=lambda key: (passes[key], -weight_of(key)))
+
+    def get(self, weight_of):
+        key = self.next_key(weight_of)
+        self.virtual_time = self.passes[key]
+        self.passes[key] += 1.0 / weight_of(key)
+        self.size -= 1
+        return key, self.flows[key].popleft()
+
+    def drop(self, key):
+        self.size -= 1
+        return self.flows[key].popleft()
+
+
+class WorkflowQueue(object):
+    def __init__(self, priority_weights=None, share_weights=None, default_priority=None, max_size=None,
+                 overflow_policy=None, block_timeout=None):
+        """Initializes a WorkflowQueue, a multi-level queue of workflows waiting for a worker.
+
+        Workflows are queued by priority class, and each class gets a share of the dispatches proportional to its
+        weight, so that a flood of low priority workflows cannot starve high priority ones. Within a class, workflows
+        are shared fairly between playbooks in proportion to their weights.
+
+        Args:
+            priority_weights (dict{str: float}, optional): The weight of each priority class. Defaults to the
+                workflow_priority_weights in the config.
+            share_weights (dict{str: float}, optional): The weight of each playbook. Playbooks which are not listed
+                have a weight of 1. Defaults to the playbook_weights in the config.
+            default_priority (str, optional): The priority class of workflows queued without one. Defaults to the
+                default_workflow_priority in the config.
+            max_size (int, optional): The maximum number of queued workflows, or 0 for no limit. Defaults to the
+                max_queued_workflows in the config.
+            overflow_policy (str, optional): What to do when a workflow is put into a full queue, one of 'reject',
+                'drop_oldest' or 'block'. Defaults to the queue_overflow_policy in the config.
+            block_timeout (float, optional): The maximum number of seconds to wait for room in the queue under the
+                'block' policy. Defaults to the queue_block_timeout in the config.
+
+        Raises:
+            UnknownPriority: If the default priority class has no weight.
+            ValueError: If the overflow policy is not one of the supported policies.
+        """
+        self.priority_weights = dict(priority_weights if priority_weights is not None
+                                     else core.config.config.workflow_priority_weights)
+        self.share_weights = dict(share_weights if share_weights is not None else core.config.config.playbook_weights)
+        self.default_priority = (default_priority if default_priority is not None
+                                 else core.config.config.default_workflow_priority)
+        if self.default_priority not in self.priority_weights:
+            raise UnknownPriority('Default priority {0} has no weight'.format(self.default_priority))
+        self.max_size = max(0, max_size if max_size is not None else core.config.config.max_queued_workflows)
+        self.overflow_policy = (overflow_policy if overflow_policy is not None
+                                else core.config.config.queue_overflow_policy)
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError('Unknown queue overflow policy {0}'.format(self.overflow_policy))
+        self.block_timeout = block_timeout if block_timeout is not None else core.config.config.queue_block_timeout
+
+        self.__classes = _FairQueue()
+        self.__shares = {priority: _FairQueue() for priority in self.priority_weights}
+        self.__queued = {}
+        self.__wait_stats = {priority: {'count': 0, 'total': 0.0, 'max': 0.0} for priority in self.priority_weights}
+        self.__admission_stats = {'rejected': 0, 'dropped': 0, 'blocked': 0}
+        # Time in seconds that each workflow waited between being queued and being dispatched, and the live depth
+        self.wait_times = Histogram()
+        self.depth = Gauge()
+        self.__lock = threading.Lock()
+        self.__not_full = threading.Condition(self.__lock)
+
+    def __priority_weight(self, priority):
+        return self.priority_weights[priority]
+
+    def __share_weight(self, share):
+        return self.share_weights.get(share, 1)
+
+    def put(self, workflow_json, priority=None, share=None, force=False):
+        """Queues a workflow.
+
+        Args:
+            workflow_json (dict): The workflow to queue. Must contain its execution_uid.
+            priority (str, optional): The priority class of the workflow. Defaults to the default priority.
+            share (str, optional): The playbook or tenant that the workflow is shared fairly with. Defaults to None,
+                which is shared with other workflows queued without one.
+            force (bool, optional): Queue the workflow even if the queue is full, for workflows which were already
+                admitted once. Defaults to False.
+
+        Returns:
+            (dict) The workflow JSON of the queued workflow which was dropped to make room for this one under the
+                'drop_oldest' policy, or None if no workflow was dropped.
+
+        Raises:
+            UnknownPriority: If the priority class has no weight.
+            QueueFull: If the queue is full and the workflow was rejected.
+        """
+        priority = priority if priority is not None else self.default_priority
+        if priority not in self.priority_weights:
+            raise UnknownPriority('Unknown workflow priority {0}'.format(priority))
+        with self.__lock:
+            dropped = None
+            if not force and self.__is_full():
+                if self.overflow_policy == 'drop_oldest':
+                    dropped = self.__drop_oldest()
+                    self.__admission_stats['dropped'] += 1
+                elif self.overflow_policy == 'block':
+                    self.__admission_stats['blocked'] += 1
+                    deadline = time.time() + self.block_timeout
+                    while self.__is_full() and time.time() < deadline:
+                        self.__not_full.wait(deadline - time.time())
+                if self.__is_full():
+                    self.__admission_stats['rejected'] += 1
+                    raise QueueFull('Workflow queue is full ({0} workflows queued)'.format(self.max_size))
+            self.__queued[workflow_json['execution_uid']] = priority
+            self.__shares[priority].put(share, (workflow_json, time.time()))
+            self.__classes.put(priority, share)
+            self.depth.set(self.__classes.size)
+            return dropped
+
+    def __is_full(self):
+        return bool(self.max_size) and self.__classes.size >= self.max_size
+
+    def __drop_oldest(self):
+        oldest = None
+        for priority, shares in self.__shares.items():
+            for share, flow in shares.flows.items():
+                if flow and (oldest is None or flow[0][1] < oldest[2]):
+                    oldest = (priority, share, flow[0][1])
+        priority, share, _ = oldest
+        workflow_json, _ = self.__shares[priority].drop(share)
+        self.__classes.drop(priority)
+        self.__queued.pop(workflow_json['execution_uid'], None)
+        self.depth.set(self.__classes.size)
+        return workflow_json
+
+    def get(self):
+        """Gets the next workflow to execute without blocking.
+
+        Returns:
+            (dict) The workflow JSON.
+
+        Raises:
+            Empty: If no workflow is queued.
+        """
+        with self.__lock:
+            priority, _ = self.__classes.get(self.__priority_weight)
+            _, (workflow_json, queued_at) = self.__shares[priority].get(self.__share_weight)
+            self.__queued.pop(workflow_json['execution_uid'], None)
+            wait = time.time() - queued_at
+            stats = self.__wait_stats[priority]
+            stats['count'] += 1
+            stats['total'] += wait
+            stats['max'] = max(stats['max'], wait)
+            self.wait_times.observe(wait)
+            self.depth.set(self.__classes.size)
+            self.__not_full.notify()
+            return workflow_json
+
+    def empty(self):
+        return not self.qsize()
+
+    def qsize(self):
+        return self.__classes.size
+
+    def position(self, execution_uid):
+        """Gets the position of a queued workflow, assuming that no other workflows are queued before it is
+        dispatched.
+
+        Args:
+            execution_uid (str): The execution UID of the workflow.
+
+        Returns:
+            (int) The number of workflows which will be dispatched before it, or None if it is not queued.
+        """
+        with self.__lock:
+            priority = self.__queued.get(execution_uid, None)
+            if priority is None:
+                return None
+            class_passes = dict(self.__classes.passes)
+            class_sizes = {key: len(flow) for key, flow in self.__classes.flows.items()}
+            shares = self.__shares[priority]
+            share_passes = dict(shares.passes)
+            share_sizes = {key: len(flow) for key, flow in shares.flows.items()}
+            share_index = dict.fromkeys(shares.flows, 0)
+            position = 0
+            while True:
+                next_priority = self.__classes.next_key(self.__priority_weight, class_passes, class_sizes)
+                class_passes[next_priority] += 1.0 / self.__priority_weight(next_priority)
+                class_sizes[next_priority] -= 1
+                if next_priority == priority:
+                    share = shares.next_key(self.__share_weight, share_passes, share_sizes)
+                    share_passes[share] += 1.0 / self.__share_weight(share)
+                    share_sizes[share] -= 1
+                    workflow_json, _ = shares.flows[share][share_index[share]]
+                    share_index[share] += 1
+                    if workflow_json['execution_uid'] == execution_uid:
+                        return position
+                position += 1
+
+    def get_stats(self):
+        """Gets the number of queued workflows and the time that dispatched workflows waited in each priority class.
+
+        Returns:
+            (dict{str: dict}) A dict of priority class to its weight, the number of queued workflows, the number of
+                dispatched workflows, and their average and maximum wait time in seconds.
+        """
+        with self.__lock:
+            stats = {}
+            for priority, weight in self.priority_weights.items():
+                wait_stats = self.__wait_stats[priority]
+                count = wait_stats['count']
+                stats[priority] = {'weight': weight,
+                                   'queued': self.__shares[priority].size,
+                                   'dispatched': count,
+                                   'avg_wait': wait_stats['total'] / count if count else 0.0,
+                                   'max_wait': wait_stats['max']}
+            return stats
+
+    def get_admission_stats(self):
+        """Gets the depth and limit of the queue and how often workflows were turned away because it was full.
+
+        Returns:
+            (dict) The number of queued workflows, the maximum number of queued workflows (0 for no limit), the overflow
+                policy, and the number of workflows which were rejected, dropped to make room for newer workflows, or
+                had to wait for room in the queue.
+        """
+        with self.__lock:
+            stats = {'queued': self.__classes.size, 'max_queued': self.max_size, 'policy': self.overflow_policy}
+            stats.update(self.__admission_stats)
+            return stats
@@ -9,16 +9,30 @@ events_page = Blueprint('events_page', __name__)
 
 __case_event_json = AsyncResult()
 __sync_signal = Event()
+__case_signals = []
+__clients = []
 
 
 def __case_event_generator():
-    while True:
-        try:
-            data = __case_event_json.get(timeout=60)
-            yield 'data: %s\n\n' % data
-            __sync_signal.wait()
-        except Timeout:
-            pass
+    # Only listen to the signals while a client is connected, so that workers do not send events nobody consumes
+    if not __clients:
+        for signal in __case_signals:
+            signal.connect(__push_to_case_stream)
+    client = object()
+    __clients.append(client)
+    try:
+        while True:
+            try:
+                data = __case_event_json.get(timeout=60)
+                yield 'data: %s\n\n' % data
+                __sync_signal.wait()
+            except Timeout:
+                pass
+    finally:
+        __clients.remove(client)
+        if not __clients:
+            for signal in __case_signals:
+                signal.disconnect(__push_to_case_stream)
 
 
 def __push_to_case_stream(sender, **kwargs):
@@ -38,9 +52,7 @@ def setup_case_stream():
     signals = [getattr(callbacks, field) for field in dir(callbacks) if (not field.startswith('__')
                                                                              and isinstance(getattr(callbacks, field),
                                                                                             NamedSignal))]
-    for signal in signals:
-        signal.connect(__push_to_case_stream)
-    pass
+    __case_signals[:] = signals
 
 
 @events_page.route('/', methods=['GET'])
@@ -25,6 +25,27 @@ def read_workflow_metrics():
     return __func()
 
 
+def read_worker_metrics():
+
+    @jwt_required
+    @roles_accepted_for_resources('metrics')
+    def __func():
+        return dict(metrics.worker_metrics), SUCCESS
+
+    return __func()
+
+
+def read_executor_metrics():
+    from server.context import running_context
+
+    @jwt_required
+    @roles_accepted_for_resources('metrics')
+    def __func():
+        return running_context.controller.get_dispatch_metrics(), SUCCESS
+
+    return __func()
+
+
 def _convert_action_time_averages():
     apps_json = []
     for app_name, app in metrics.app_metrics.items():
@@ -10,6 +10,7 @@ import core.config.paths
 from core import helpers
 from core.case.workflowresults import WorkflowResult
 from core.helpers import UnknownAppAction, UnknownApp, InvalidInput
+from core.workflowqueue import UnknownPriority, QueueFull
 from server.returncodes import *
 from server.security import roles_accepted_for_resources
 import server.workflowresults  # do not delete needed to register callbacks
@@ -360,7 +361,7 @@ def copy_workflow(playbook_name, workflow_name):
     return __func()
 
 
-def execute_workflow(playbook_name, workflow_name):
+def execute_workflow(playbook_name, workflow_name, priority=None):
     from server.context import running_context
     from server.flaskserver import write_playbook_to_file
 
@@ -369,7 +370,17 @@ def execute_workflow(playbook_name, workflow_name):
     def __func():
         if running_context.controller.is_workflow_registered(playbook_name, workflow_name):
             write_playbook_to_file(playbook_name)
-            uid = running_context.controller.execute_workflow(playbook_name, workflow_name)
+            try:
+                uid = running_context.controller.execute_workflow(playbook_name, workflow_name, priority=priority)
+            except UnknownPriority:
+                current_app.logger.error('Cannot execute workflow {0}-{1}. Unknown priority {2}'.format(
+                    playbook_name, workflow_name, priority))
+                return {'error': 'Unknown priority.'}, INVALID_INPUT_ERROR
+            except QueueFull as e:
+                current_app.logger.warning('Cannot execute workflow {0}-{1}. Workflow queue is full'.format(
+                    playbook_name, workflow_name))
+                return ({'error': 'Workflow queue is full.', 'retry_after': e.retry_after}, SERVICE_UNAVAILABLE,
+                        {'Retry-After': str(e.retry_after)})
             current_app.logger.info('Executed workflow {0}-{1}'.format(playbook_name, workflow_name))
             return {'id': uid}, SUCCESS_ASYNC
         else:
@@ -492,4 +503,32 @@ def read_result(uid):
             return workflow_result.as_json(), SUCCESS
         else:
             return {'error': 'No workflow found'}, OBJECT_DNE_ERROR
-    return __func()
\ No newline at end of file
+    return __func()
+
+
+def read_workflow_queue():
+    from server.context import running_context
+
+    @jwt_required
+    @roles_accepted_for_resources('playbooks')
+    def __func():
+        stats = running_context.controller.get_queue_stats()
+        return {'priorities': [dict(name=priority, **priority_stats)
+                               for priority, priority_stats in stats.items()],
+                'admission': running_context.controller.get_admission_stats()}, SUCCESS
+
+    return __func()
+
+
+def read_queued_workflow(execution_uid):
+    from server.context import running_context
+
+    @jwt_required
+    @roles_accepted_for_resources('playbooks')
+    def __func():
+        position = running_context.controller.get_queue_position(execution_uid)
+        if position is None:
+            return {'error': 'Workflow is not queued.'}, OBJECT_DNE_ERROR
+        return {'id': execution_uid, 'position': position}, SUCCESS
+
+    return __func()
@@ -47,6 +47,9 @@ def execute():
         if 'inputs' not in trigger_args:
             trigger_args['inputs'] = ''
         returned_json = running_context.Triggers.execute(**trigger_args)
+        if 'retry_after' in returned_json:
+            current_app.logger.warning('Could not execute all triggers. Workflow queue is full')
+            return returned_json, SERVICE_UNAVAILABLE, {'Retry-After': str(returned_json['retry_after'])}
         if not (returned_json["executed"] or returned_json["errors"]):
             return returned_json, SUCCESS_WITH_WARNING
         elif returned_json["errors"]:
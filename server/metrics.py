@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from core.case.callbacks import StepStarted, FunctionExecutionSuccess, StepExecutionError, \
-    WorkflowShutdown, WorkflowExecutionStart
+    WorkflowShutdown, WorkflowExecutionStart, WorkerSpawned, WorkerRetired, WorkerCrashed
 
 app_metrics = {}
 
@@ -19,6 +19,12 @@ workflow_metrics = {}
 form  of {<workflow-name>: {'count': <count>, 'avg_time': <average_execution_time>}}
 '''
 
+worker_metrics = {'spawned': 0, 'retired': 0, 'crashed': 0}
+
+'''
+form of {'spawned': <number of workers spawned>, 'retired': <number of workers retired>}
+'''
+
 __action_tmp = {}
 __workflow_tmp = {}
 
@@ -80,3 +86,18 @@ def __workflow_ended_callback(sender, **kwargs):
             workflow_metrics[sender.name]['count'] += 1
             workflow_metrics[sender.name]['avg_time'] = (workflow_metrics[sender.name]['avg_time'] + execution_time) / 2
         __workflow_tmp.pop(sender.workflow_execution_uid)
+
+
+@WorkerSpawned.connect
+def __worker_spawned_callback(sender, **kwargs):
+    worker_metrics['spawned'] += 1
+
+
+@WorkerRetired.connect
+def __worker_retired_callback(sender, **kwargs):
+    worker_metrics['retired'] += 1
+
+
+@WorkerCrashed.connect
+def __worker_crashed_callback(sender, **kwargs):
+    worker_metrics['crashed'] += 1
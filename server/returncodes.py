@@ -12,4 +12,5 @@ OBJECT_EXISTS_ERROR = 462
 INVALID_INPUT_ERROR = 463
 
 # Server Errors
+SERVICE_UNAVAILABLE = 503
 IO_ERROR = 515
\ No newline at end of file
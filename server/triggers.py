@@ -4,6 +4,7 @@ import logging
 from core.executionelements.filter import Filter
 from core.executionelements.flag import Flag
 from core.helpers import format_exception_message
+from core.workflowqueue import QueueFull
 from .database import db
 
 logger = logging.getLogger(__name__)
@@ -113,7 +114,8 @@ class Triggers(db.Model):
             tags (list[str], optional): A list of tags to find the specific triggers to execute
             
         Returns:
-            Dictionary of {"status": <status string>}
+            Dictionary of {"executed": <list of executed triggers>, "errors": <list of errors>}, which also contains
+            the "retry_after" seconds if any workflow was rejected because the workflow queue is full.
         """
         from server.flaskserver import running_context
         triggers_to_execute = set()
@@ -147,6 +149,9 @@ class Triggers(db.Model):
                                                                           workflow_name=trigger.workflow,
                                                                           start_input=inputs)
                         returned_json["executed"].append({'name': trigger.name, 'id': uid})
+                    except QueueFull as e:
+                        returned_json["errors"].append({trigger.name: "Workflow queue is full."})
+                        returned_json["retry_after"] = max(returned_json.get("retry_after", 0), e.retry_after)
                     except Exception as e:
                         returned_json["errors"].append(
                             {trigger.name: "Error executing workflow: {0}".format(format_exception_message(e))})
@@ -17,8 +17,12 @@ def __workflow_ended_callback(sender, **kwargs):
 
 @WorkflowExecutionStart.connect
 def __workflow_started_callback(sender, **kwargs):
-    workflow_result = WorkflowResult(sender.workflow_execution_uid, sender.name)
-    case_database.case_db.session.add(workflow_result)
+    # A workflow requeued after its worker crashed starts again under the same execution UID
+    workflow_result = case_database.case_db.session.query(WorkflowResult).filter(
+        WorkflowResult.uid == sender.workflow_execution_uid).first()
+    if workflow_result is None:
+        workflow_result = WorkflowResult(sender.workflow_execution_uid, sender.name)
+        case_database.case_db.session.add(workflow_result)
     case_database.case_db.session.commit()
 
 
@@ -0,0 +1,54 @@
+import argparse
+import logging
+import os
+import socket
+
+from core.config import config, paths
+
+logger = logging.getLogger('startworker')
+
+
+def cmd_line():
+    parser = argparse.ArgumentParser("Start Worker")
+    parser.add_argument('-s', '--server', type=str, required=False,
+                        help='Host of the WALKOFF server to connect to. Defaults to the host of the worker addresses in '
+                             'the config')
+    parser.add_argument('-c', '--config', type=str, required=False,
+                        help='Path to the WALKOFF config file. Defaults to {0}'.format(paths.config_path))
+    parser.add_argument('-i', '--id', type=str, required=False,
+                        help='ID of the worker, which must be unique among the workers of the server. Defaults to '
+                             '<hostname>-<pid>')
+    parser.add_argument('-n', '--concurrency', type=int, required=False,
+                        help='Number of workflows to execute at once. Defaults to worker_concurrency in the config')
+    parser.add_argument('-a', '--apps', type=str, required=False,
+                        help='Path to the apps. Defaults to apps_path in the config')
+    return parser.parse_args()
+
+
+def run(args):
+    """Starts a worker which connects to a WALKOFF server, possibly on another host, and executes workflows until it
+    receives a SIGTERM, after which it finishes its workflows and leaves. The worker authenticates with the client
+    certificate in the private keys directory.
+
+    Args:
+        args (Namespace): The command line arguments.
+    """
+    if args.config:
+        paths.config_path = args.config
+    config.load_config()
+    if args.apps:
+        paths.apps_path = args.apps
+    if args.concurrency:
+        config.worker_concurrency = args.concurrency
+    worker_id = args.id if args.id else '{0}-{1}'.format(socket.gethostname(), os.getpid())
+
+    from core.loadbalancer import Worker
+    logger.info('Starting worker {0}'.format(worker_id))
+    Worker(worker_id, worker_environment_setup=config.load_execution_environment, server_host=args.server,
+           standalone=True)
+    logger.info('Worker {0} has left'.format(worker_id))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    run(cmd_line())
@@ -6,6 +6,9 @@ __all__ = ['test_app_api_validation',
            'test_app_instance',
            'test_app_utilities',
            'test_authentication',
+           'test_autoscaler',
+           'test_callback_dispatcher',
+           'test_callback_interest',
            'test_case_config_db',
            'test_case_database',
            'test_case_server',
@@ -13,6 +16,7 @@ __all__ = ['test_app_api_validation',
            'test_controller',
            'test_decorators',
            'test_device_server',
+           'test_distributed_workers',
            'test_execution_element',
            'test_execution_events',
            'test_execution_modes',
@@ -22,6 +26,7 @@ __all__ = ['test_app_api_validation',
            'test_flag_filter_validation',
            'test_helper_functions',
            'test_input_validation',
+           'test_instrumentation',
            'test_json_element_creator',
            'test_json_element_reader',
            'test_json_playbook_loader',
@@ -45,6 +50,7 @@ __all__ = ['test_app_api_validation',
            'test_users_roles_database',
            'test_users_server',
            'test_workflow_manipulation',
+           'test_workflow_queue',
            'test_workflow_server',
            'test_workflow_results',
            'test_widget_signals',
@@ -23,11 +23,13 @@ __execution_tests = [test_execution_runtime, test_execution_element, test_execut
                      test_app_api_validation, test_flag_filter_validation, test_app_event, test_workflow_results,
                      test_roles_pages_database, test_users_roles_database, test_page_roles_cache, test_playbook,
                      test_json_element_creator, test_json_element_reader, test_json_playbook_loader, test_playbook_store,
-                     test_scheduler, test_app_cache, test_app_base]
+                     test_scheduler, test_app_cache, test_app_base, test_autoscaler,
+                     test_workflow_queue, test_instrumentation, test_callback_dispatcher]
 execution_suite = TestSuite()
 add_tests_to_suite(execution_suite, __execution_tests)
 
-__workflow_tests = [test_zmq_communication_server, test_zmq_communication, test_triggers, test_load_workflow, test_simple_workflow,
+__workflow_tests = [test_zmq_communication_server, test_zmq_communication, test_distributed_workers,
+                    test_callback_interest, test_triggers, test_load_workflow, test_simple_workflow,
                     test_workflow_manipulation]
 workflow_suite = TestSuite()
 add_tests_to_suite(workflow_suite, __workflow_tests)
@@ -0,0 +1,91 @@
+import unittest
+
+import core.config.config
+from core.autoscaler import Autoscaler
+
+
+class TestAutoscaler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.original_config = (core.config.config.min_processes, core.config.config.max_processes,
+                               core.config.config.autoscale_wait_threshold, core.config.config.worker_idle_timeout,
+                               core.config.config.worker_concurrency)
+
+    def setUp(self):
+        core.config.config.min_processes = 2
+        core.config.config.max_processes = 6
+        core.config.config.autoscale_wait_threshold = 1.0
+        core.config.config.worker_idle_timeout = 30
+        core.config.config.worker_concurrency = 2
+        self.autoscaler = Autoscaler(None)
+
+    @classmethod
+    def tearDownClass(cls):
+        (core.config.config.min_processes, core.config.config.max_processes,
+         core.config.config.autoscale_wait_threshold, core.config.config.worker_idle_timeout,
+         core.config.config.worker_concurrency) = cls.original_config
+
+    @staticmethod
+    def get_stats(queued=0, workers=2, total_slots=4, idle_workers=None, average_execution_time=None,
+                  standalone_workers=0):
+        return {'queued': queued,
+                'workers': workers,
+                'standalone_workers': standalone_workers,
+                'retiring': 0,
+                'free_slots': 0,
+                'total_slots': total_slots,
+                'idle_workers': idle_workers if idle_workers is not None else [],
+                'average_execution_time': average_execution_time}
+
+    def test_init_bounds(self):
+        core.config.config.min_processes = 0
+        core.config.config.max_processes = 0
+        autoscaler = Autoscaler(None)
+        self.assertEqual(autoscaler.min_processes, 1)
+        self.assertEqual(autoscaler.max_processes, 1)
+
+    def test_plan_steady(self):
+        self.assertTupleEqual(self.autoscaler.plan(self.get_stats(), 2), (0, 0))
+
+    def test_plan_below_min_processes(self):
+        self.assertTupleEqual(self.autoscaler.plan(self.get_stats(workers=0, total_slots=0), 0), (2, 0))
+
+    def test_plan_backlog_unknown_execution_time(self):
+        self.assertTupleEqual(self.autoscaler.plan(self.get_stats(queued=3), 2), (2, 0))
+
+    def test_plan_backlog_drains_quickly(self):
+        stats = self.get_stats(queued=3, average_execution_time=0.1)
+        self.assertTupleEqual(self.autoscaler.plan(stats, 2), (0, 0))
+
+    def test_plan_backlog_drains_slowly(self):
+        stats = self.get_stats(queued=4, average_execution_time=5)
+        self.assertTupleEqual(self.autoscaler.plan(stats, 2), (2, 0))
+
+    def test_plan_backlog_capped_at_max_processes(self):
+        stats = self.get_stats(queued=100, average_execution_time=5)
+        self.assertTupleEqual(self.autoscaler.plan(stats, 2), (4, 0))
+
+    def test_plan_backlog_at_max_processes(self):
+        stats = self.get_stats(queued=100, workers=6, total_slots=12, average_execution_time=5)
+        self.assertTupleEqual(self.autoscaler.plan(stats, 6), (0, 0))
+
+    def test_plan_backlog_waits_for_starting_workers(self):
+        stats = self.get_stats(queued=100, average_execution_time=5)
+        self.assertTupleEqual(self.autoscaler.plan(stats, 4), (0, 0))
+
+    def test_plan_backlog_with_standalone_workers(self):
+        stats = self.get_stats(queued=100, workers=4, total_slots=8, average_execution_time=5, standalone_workers=2)
+        self.assertTupleEqual(self.autoscaler.plan(stats, 2), (4, 0))
+
+    def test_plan_retire_idle_workers(self):
+        stats = self.get_stats(workers=4, total_slots=8, idle_workers=[40, 31, 10])
+        self.assertTupleEqual(self.autoscaler.plan(stats, 4), (0, 2))
+
+    def test_plan_retire_idle_workers_capped_at_min_processes(self):
+        stats = self.get_stats(workers=3, total_slots=6, idle_workers=[40, 31, 35])
+        self.assertTupleEqual(self.autoscaler.plan(stats, 3), (0, 1))
+
+    def test_plan_no_retire_with_backlog(self):
+        stats = self.get_stats(queued=1, workers=4, total_slots=8, idle_workers=[40, 31],
+                               average_execution_time=0.1)
+        self.assertTupleEqual(self.autoscaler.plan(stats, 4), (0, 0))
@@ -0,0 +1,164 @@
+import threading
+import time
+import unittest
+
+from blinker import Signal
+
+from core.callbackdispatcher import CallbackSink, CallbackDispatcher
+from core.case import callbacks
+
+
+class MockSender(object):
+    def __init__(self, uid):
+        self.uid = uid
+
+
+class TestCallbackSink(unittest.TestCase):
+    def setUp(self):
+        self.handled = []
+        self.sink = None
+
+    def tearDown(self):
+        if self.sink is not None:
+            self.sink.stop(timeout=1)
+
+    def receiver(self, sender, **kwargs):
+        self.handled.append((sender.uid, kwargs.get('data', None)))
+
+    def create_sink(self, max_size=0, overflow_policy='block', start=True):
+        self.sink = CallbackSink('test', max_size=max_size, overflow_policy=overflow_policy)
+        if start:
+            self.sink.start()
+        return self.sink
+
+    def test_init_unknown_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            CallbackSink('test', overflow_policy='invalid')
+
+    def test_handled_in_order(self):
+        sink = self.create_sink()
+        for i in range(100):
+            sink.put([self.receiver], MockSender('uid{}'.format(i % 3)), {'data': i})
+        sink.stop(timeout=5)
+        self.assertListEqual(self.handled, [('uid{}'.format(i % 3), i) for i in range(100)])
+        metrics = sink.get_metrics()
+        self.assertEqual(metrics['handled'], 100)
+        self.assertEqual(metrics['dropped'], 0)
+        self.assertEqual(metrics['lag']['count'], 100)
+        self.assertEqual(metrics['queued']['value'], 0)
+
+    def test_receiver_error_does_not_stop_sink(self):
+        def failing_receiver(sender, **kwargs):
+            raise ValueError()
+
+        sink = self.create_sink()
+        sink.put([failing_receiver, self.receiver], MockSender('uid'), {})
+        sink.put([self.receiver], MockSender('uid2'), {})
+        sink.stop(timeout=5)
+        self.assertListEqual(self.handled, [('uid', None), ('uid2', None)])
+
+    def test_drop_newest(self):
+        sink = self.create_sink(max_size=2, overflow_policy='drop_newest', start=False)
+        self.assertTrue(sink.put([self.receiver], MockSender('uid1'), {}))
+        self.assertTrue(sink.put([self.receiver], MockSender('uid2'), {}))
+        self.assertFalse(sink.put([self.receiver], MockSender('uid3'), {}))
+        sink.start()
+        sink.stop(timeout=5)
+        self.assertListEqual(self.handled, [('uid1', None), ('uid2', None)])
+        self.assertEqual(sink.get_metrics()['dropped'], 1)
+        self.assertDictEqual(sink.get_metrics()['queued'], {'value': 0, 'max': 2})
+
+    def test_drop_oldest(self):
+        sink = self.create_sink(max_size=2, overflow_policy='drop_oldest', start=False)
+        for i in range(3):
+            self.assertTrue(sink.put([self.receiver], MockSender('uid{}'.format(i)), {}))
+        sink.start()
+        sink.stop(timeout=5)
+        self.assertListEqual(self.handled, [('uid1', None), ('uid2', None)])
+        self.assertEqual(sink.get_metrics()['dropped'], 1)
+
+    def test_block_until_room(self):
+        sink = self.create_sink(max_size=1, overflow_policy='block', start=False)
+        sink.put([self.receiver], MockSender('uid1'), {})
+        queued = threading.Event()
+
+        def put():
+            sink.put([self.receiver], MockSender('uid2'), {})
+            queued.set()
+
+        thread = threading.Thread(target=put)
+        thread.start()
+        self.assertFalse(queued.wait(timeout=0.2))
+        sink.start()
+        self.assertTrue(queued.wait(timeout=5))
+        thread.join()
+        sink.stop(timeout=5)
+        self.assertListEqual(self.handled, [('uid1', None), ('uid2', None)])
+        self.assertEqual(sink.get_metrics()['dropped'], 0)
+
+    def test_slow_receiver_lag(self):
+        def slow_receiver(sender, **kwargs):
+            time.sleep(0.05)
+
+        sink = self.create_sink()
+        for _ in range(4):
+            sink.put([slow_receiver], MockSender('uid'), {})
+        sink.stop(timeout=5)
+        self.assertGreaterEqual(sink.get_metrics()['lag']['max'], 0.1)
+
+
+class TestCallbackDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.dispatcher = CallbackDispatcher(max_size=0, overflow_policies={})
+
+    def tearDown(self):
+        self.dispatcher.stop(timeout=1)
+
+    def test_get_sink(self):
+        signal = callbacks.StepStarted
+        self.assertEqual(CallbackDispatcher.get_sink(signal, callbacks.case_loggers[signal]), 'cases')
+
+        def receiver(sender, **kwargs):
+            pass
+
+        self.assertEqual(CallbackDispatcher.get_sink(signal, receiver), 'default')
+        receiver.__module__ = 'server.workflowresults'
+        self.assertEqual(CallbackDispatcher.get_sink(signal, receiver), 'results')
+        receiver.__module__ = 'server.metrics'
+        self.assertEqual(CallbackDispatcher.get_sink(signal, receiver), 'metrics')
+        receiver.__module__ = 'server.blueprints.events'
+        self.assertEqual(CallbackDispatcher.get_sink(signal, receiver), 'streams')
+
+    def test_slow_sink_does_not_block_others(self):
+        signal = Signal()
+        release = threading.Event()
+        handled = threading.Event()
+
+        def slow_receiver(sender, **kwargs):
+            release.wait(timeout=5)
+
+        slow_receiver.__module__ = 'server.workflowresults'
+
+        def receiver(sender, **kwargs):
+            if kwargs['data'] == 'last':
+                handled.set()
+
+        signal.connect(slow_receiver)
+        signal.connect(receiver)
+        self.dispatcher.start()
+        self.dispatcher.dispatch(signal, MockSender('uid'), 'first')
+        self.dispatcher.dispatch(signal, MockSender('uid'), 'last')
+        self.assertTrue(handled.wait(timeout=5))
+        metrics = self.dispatcher.get_metrics()
+        self.assertEqual(metrics['default']['handled'], 2)
+        self.assertLess(metrics['results']['handled'], 2)
+        release.set()
+        self.dispatcher.stop(timeout=5)
+        self.assertEqual(self.dispatcher.get_metrics()['results']['handled'], 2)
+
+    def test_dispatch_without_receivers(self):
+        self.dispatcher.start()
+        self.dispatcher.dispatch(Signal(), MockSender('uid'), {})
+        self.dispatcher.stop(timeout=5)
+        for metrics in self.dispatcher.get_metrics().values():
+            self.assertEqual(metrics['handled'], 0)
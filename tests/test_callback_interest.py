@@ -0,0 +1,122 @@
+import unittest
+
+import apps
+import core.config.config
+import core.controller
+from core.callbackdispatcher import CallbackDispatcher
+from core.case import callbacks
+from core.helpers import import_all_filters, import_all_flags
+from core.loadbalancer import get_callback_interest, REQUIRED_CALLBACKS
+from tests import config
+from tests.util.case_db_help import *
+from tests.util.thread_control import modified_setup_worker_env
+
+
+class TestCallbackInterest(unittest.TestCase):
+    def setUp(self):
+        case_database.initialize()
+
+    def tearDown(self):
+        case_database.case_db.tear_down()
+        case_subscription.clear_subscriptions()
+
+    def test_has_listeners(self):
+        self.assertFalse(callbacks.has_listeners(callbacks.FilterError))
+
+        def listener(sender, **kwargs):
+            pass
+
+        callbacks.FilterError.connect(listener)
+        self.assertTrue(callbacks.has_listeners(callbacks.FilterError))
+        callbacks.FilterError.disconnect(listener)
+        self.assertFalse(callbacks.has_listeners(callbacks.FilterError))
+
+    def test_get_message_name(self):
+        self.assertEqual(callbacks.get_message_name(callbacks.StepInputInvalid), 'Input Invalid')
+        self.assertIsNone(callbacks.get_message_name(callbacks.data_sent))
+
+    def test_required_callbacks(self):
+        self.assertTrue(REQUIRED_CALLBACKS.issubset(get_callback_interest()['all']))
+
+    def test_listener(self):
+        self.assertNotIn('Filter Error', get_callback_interest()['all'])
+
+        def listener(sender, **kwargs):
+            pass
+
+        callbacks.FilterError.connect(listener)
+        self.assertIn('Filter Error', get_callback_interest()['all'])
+        callbacks.FilterError.disconnect(listener)
+        self.assertNotIn('Filter Error', get_callback_interest()['all'])
+
+    def test_subscriptions(self):
+        setup_subscriptions_for_step('workflow_uid', ['step_uid'], step_events=['Filter Error', 'Input Invalid'],
+                                     workflow_events=['Next Step Found'])
+        interest = get_callback_interest()
+        self.assertNotIn('Filter Error', interest['all'])
+        self.assertListEqual(interest['originators']['step_uid'], ['Filter Error', 'Step Input Invalid'])
+        self.assertListEqual(interest['originators']['workflow_uid'], ['Next Step Found'])
+
+
+class TestCallbackSuppression(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        apps.cache_apps(config.test_apps_path)
+        core.config.config.load_app_apis(apps_path=config.test_apps_path)
+        core.config.config.flags = import_all_flags('tests.util.flagsfilters')
+        core.config.config.filters = import_all_filters('tests.util.flagsfilters')
+        core.config.config.load_flagfilter_apis(path=config.function_api_path)
+
+    def setUp(self):
+        self.controller = core.controller.controller
+        self.controller.workflows = {}
+        self.controller.load_playbooks(resource_collection=config.test_workflows_path)
+        self.workflow = self.controller.get_workflow('multiactionWorkflowTest', 'multiactionWorkflow')
+        case_database.initialize()
+
+        self.received = []
+        self.dispatch = CallbackDispatcher.dispatch
+
+        def record_callback(dispatcher, callback, sender, data):
+            self.received.append((callback, sender.uid))
+            self.dispatch(dispatcher, callback, sender, data)
+
+        CallbackDispatcher.dispatch = record_callback
+
+    def tearDown(self):
+        CallbackDispatcher.dispatch = self.dispatch
+        core.config.config.filter_unused_callbacks = True
+        self.controller.workflows = None
+        case_database.case_db.tear_down()
+        case_subscription.clear_subscriptions()
+
+    @classmethod
+    def tearDownClass(cls):
+        apps.clear_cache()
+
+    def execute_workflow(self):
+        self.controller.initialize_threading(worker_environment_setup=modified_setup_worker_env)
+        self.controller.execute_workflow('multiactionWorkflowTest', 'multiactionWorkflow')
+        self.controller.shutdown_pool(1)
+        return [callback for callback, _ in self.received]
+
+    def test_unused_callbacks_not_sent(self):
+        self.assertFalse(callbacks.has_listeners(callbacks.NextStepFound))
+        received = self.execute_workflow()
+        self.assertIn(callbacks.WorkflowShutdown, received)
+        self.assertNotIn(callbacks.NextStepFound, received)
+        self.assertNotIn(callbacks.AppInstanceCreated, received)
+
+    def test_subscribed_callbacks_sent(self):
+        setup_subscriptions_for_step(self.workflow.uid, [], workflow_events=['Next Step Found'])
+        received = self.execute_workflow()
+        self.assertIn((callbacks.NextStepFound, self.workflow.uid), self.received)
+        self.assertNotIn(callbacks.AppInstanceCreated, received)
+        self.assertEqual(len([event for event in executed_steps(self.workflow.uid, datetime.min, datetime.utcnow())
+                              if event['message'] == 'Next step found']), 2)
+
+    def test_filtering_disabled(self):
+        core.config.config.filter_unused_callbacks = False
+        received = self.execute_workflow()
+        self.assertIn(callbacks.NextStepFound, received)
+        self.assertIn(callbacks.AppInstanceCreated, received)
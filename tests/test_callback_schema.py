@@ -0,0 +1,85 @@
+import unittest
+
+from core.loadbalancer import (NameInterner, fill_protobuf_message, get_callback_name, restore_interned_names,
+                               CALLBACK_IDS, CALLBACK_NAMES, Receiver)
+from core.protobuf.build import data_pb2
+
+
+class MockStep(object):
+    def __init__(self):
+        self.name = 'step_one'
+        self.uid = 'step_uid'
+        self.app = 'HelloWorld'
+        self.action = 'repeatBackToMe'
+        self.inputs = {'call': 'hello'}
+
+    def get_execution_uid(self):
+        return 'step_execution_uid'
+
+
+class MockWorkflow(object):
+    def __init__(self):
+        self.name = 'workflow'
+        self.uid = 'workflow_uid'
+
+
+class TestCallbackSchema(unittest.TestCase):
+    def test_every_callback_has_id(self):
+        self.assertSetEqual(set(CALLBACK_IDS), set(Receiver.callback_lookup))
+        self.assertEqual(len(CALLBACK_NAMES), len(CALLBACK_IDS))
+
+    def test_intern_reuses_ids(self):
+        names = NameInterner()
+        first = names.intern('HelloWorld')
+        self.assertEqual(names.intern('HelloWorld'), first)
+        self.assertNotEqual(names.intern('repeatBackToMe'), first)
+
+    def test_names_declared_once(self):
+        names = NameInterner()
+        name_id = names.intern('HelloWorld')
+        batch = data_pb2.MessageBatch()
+        names.declare(batch)
+        self.assertEqual(batch.session, names.session)
+        self.assertDictEqual(dict(batch.names), {name_id: 'HelloWorld'})
+        names.intern('HelloWorld')
+        batch = data_pb2.MessageBatch()
+        names.declare(batch)
+        self.assertDictEqual(dict(batch.names), {})
+
+    def test_callback_sent_by_id(self):
+        packet = data_pb2.Message()
+        fill_protobuf_message(packet, MockWorkflow(), 'exec_uid', callback_name='Workflow Paused',
+                              object_type='Workflow')
+        self.assertFalse(packet.workflow_packet.HasField('callback_name'))
+        self.assertEqual(get_callback_name(packet.workflow_packet), 'Workflow Paused')
+
+    def test_unknown_callback_sent_by_name(self):
+        packet = data_pb2.Message()
+        fill_protobuf_message(packet, MockWorkflow(), 'exec_uid', callback_name='Custom', object_type='Workflow')
+        self.assertFalse(packet.workflow_packet.HasField('callback'))
+        self.assertEqual(get_callback_name(packet.workflow_packet), 'Custom')
+
+    def test_input_only_sent_when_used(self):
+        packet = data_pb2.Message()
+        fill_protobuf_message(packet, MockStep(), 'exec_uid', callback_name='Step Started', object_type='Step')
+        self.assertEqual(len(packet.step_packet.sender.input), 0)
+        packet = data_pb2.Message()
+        fill_protobuf_message(packet, MockStep(), 'exec_uid', callback_name='Function Execution Success',
+                              object_type='Step', data='{}')
+        self.assertDictEqual(dict(packet.step_packet_data.sender.input), {'call': 'hello'})
+
+    def test_interned_names_restored(self):
+        names = NameInterner()
+        batch = data_pb2.MessageBatch()
+        fill_protobuf_message(batch.messages.add(), MockStep(), 'exec_uid', names=names, callback_name='Step Started',
+                              object_type='Step')
+        names.declare(batch)
+        received = data_pb2.MessageBatch()
+        received.ParseFromString(batch.SerializeToString())
+        sender = received.messages[0].step_packet.sender
+        self.assertFalse(sender.HasField('name'))
+        restore_interned_names(sender, dict(received.names))
+        self.assertEqual(sender.name, 'step_one')
+        self.assertEqual(sender.app, 'HelloWorld')
+        self.assertEqual(sender.action, 'repeatBackToMe')
+        self.assertEqual(sender.uid, 'step_uid')
@@ -0,0 +1,147 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from os import path
+
+import apps
+import core.config.config
+import core.controller
+from core.case.callbacks import WorkflowExecutionStart, WorkflowShutdown, WorkerRetired
+from core.helpers import import_all_filters, import_all_flags
+from core.loadbalancer import get_connect_address
+from tests import config
+from tests.util.case_db_help import *
+from tests.util.thread_control import modified_setup_worker_env
+
+ADDRESSES = {'zmq_requests_address': 'tcp://*:5575',
+             'zmq_results_address': 'tcp://*:5576',
+             'zmq_communication_address': 'tcp://*:5577'}
+
+
+class TestGetConnectAddress(unittest.TestCase):
+    def test_bound_to_host(self):
+        self.assertEqual(get_connect_address('tcp://10.0.0.1:5555'), 'tcp://10.0.0.1:5555')
+
+    def test_bound_to_all_interfaces(self):
+        self.assertEqual(get_connect_address('tcp://*:5555'), 'tcp://127.0.0.1:5555')
+        self.assertEqual(get_connect_address('tcp://0.0.0.0:5555'), 'tcp://127.0.0.1:5555')
+
+    def test_server_host(self):
+        self.assertEqual(get_connect_address('tcp://*:5555', 'walkoff.local'), 'tcp://walkoff.local:5555')
+
+    def test_not_tcp(self):
+        self.assertEqual(get_connect_address('ipc:///tmp/walkoff-requests', 'walkoff.local'),
+                         'ipc:///tmp/walkoff-requests')
+
+
+class TestDistributedWorkers(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        apps.cache_apps(config.test_apps_path)
+        core.config.config.load_app_apis(apps_path=config.test_apps_path)
+        core.config.config.flags = import_all_flags('tests.util.flagsfilters')
+        core.config.config.filters = import_all_filters('tests.util.flagsfilters')
+        core.config.config.load_flagfilter_apis(path=config.function_api_path)
+        cls.original_addresses = {key: getattr(core.config.config, key) for key in ADDRESSES}
+        for key, address in ADDRESSES.items():
+            setattr(core.config.config, key, address)
+
+        # The standalone worker reads the addresses of the server from its own config file
+        config_file, cls.config_path = tempfile.mkstemp(suffix='.config')
+        with os.fdopen(config_file, 'w') as worker_config:
+            worker_config.write(json.dumps(ADDRESSES))
+
+    def setUp(self):
+        self.controller = core.controller.controller
+        self.controller.workflows = {}
+        self.controller.load_playbooks(resource_collection=config.test_workflows_path)
+        self.controller.initialize_threading(worker_environment_setup=modified_setup_worker_env)
+        case_database.initialize()
+        self.worker = None
+
+    def tearDown(self):
+        if self.worker is not None and self.worker.poll() is None:
+            self.worker.kill()
+            self.worker.wait()
+        self.controller.shutdown_pool()
+        self.controller.workflows = None
+        case_database.case_db.tear_down()
+        case_subscription.clear_subscriptions()
+
+    @classmethod
+    def tearDownClass(cls):
+        for key, address in cls.original_addresses.items():
+            setattr(core.config.config, key, address)
+        os.remove(cls.config_path)
+        apps.clear_cache()
+
+    def start_worker(self, worker_id, concurrency):
+        self.worker = subprocess.Popen([sys.executable, 'startWorker.py', '--config', self.config_path,
+                                        '--id', worker_id, '--concurrency', str(concurrency),
+                                        '--apps', config.test_apps_path])
+
+    def wait_for_pool(self, condition, timeout=30):
+        start = time.time()
+        while time.time() - start < timeout:
+            if condition(self.controller.executor.manager.get_pool_stats()):
+                return True
+            time.sleep(0.1)
+        return False
+
+    def test_standalone_worker_joins_executes_and_leaves(self):
+        self.controller.load_playbook(resource=path.join(config.test_workflows_path, 'pauseWorkflowTest.playbook'))
+        executor = self.controller.executor
+        num_workers = executor.count_workers()
+        self.assertTrue(self.wait_for_pool(lambda stats: stats['workers'] == num_workers))
+
+        # With more free slots than any worker of the pool, the standalone worker receives the first workflow
+        self.start_worker('standalone', 4)
+        self.assertTrue(self.wait_for_pool(lambda stats: stats['standalone_workers'] == 1))
+        self.assertEqual(executor.manager.get_pool_stats()['workers'], num_workers + 1)
+
+        executed_on = []
+        shutdown = threading.Event()
+        retired = threading.Event()
+
+        @WorkflowExecutionStart.connect
+        def workflow_started_listener(sender, **kwargs):
+            executed_on.append(executor.manager.workflow_comms.get(sender.workflow_execution_uid, None))
+
+        @WorkflowShutdown.connect
+        def workflow_shutdown_listener(sender, **kwargs):
+            shutdown.set()
+
+        @WorkerRetired.connect
+        def worker_retired_listener(sender, **kwargs):
+            if sender['uid'] == 'Worker-standalone':
+                retired.set()
+
+        self.controller.execute_workflow('pauseWorkflowTest', 'pauseWorkflow')
+        self.assertTrue(shutdown.wait(timeout=10))
+        self.assertListEqual(executed_on, [b'Worker-standalone'])
+
+        self.worker.send_signal(signal.SIGTERM)
+        self.assertTrue(retired.wait(timeout=10))
+        self.assertEqual(self.worker.wait(timeout=10), 0)
+        stats = executor.manager.get_pool_stats()
+        self.assertEqual(stats['standalone_workers'], 0)
+        self.assertEqual(stats['workers'], num_workers)
+
+    def test_standalone_worker_not_retired_by_pool(self):
+        executor = self.controller.executor
+        num_workers = executor.count_workers()
+        self.start_worker('standalone', 1)
+        self.assertTrue(self.wait_for_pool(lambda stats: stats['workers'] == num_workers + 1
+                                           and stats['standalone_workers'] == 1))
+
+        for _ in range(num_workers + 1):
+            executor.retire_worker()
+        self.assertTrue(self.wait_for_pool(lambda stats: stats['workers'] == 1 and not stats['retiring']))
+        self.assertEqual(executor.manager.get_pool_stats()['standalone_workers'], 1)
+        self.assertIsNone(self.worker.poll())
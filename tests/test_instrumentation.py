@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+from core.instrumentation import Histogram, Gauge
+
+
+class TestHistogram(unittest.TestCase):
+    def test_empty(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        self.assertDictEqual(histogram.as_json(), {'count': 0, 'sum': 0.0, 'min': None, 'max': None, 'mean': None,
+                                                   'p50': None, 'p95': None, 'p99': None,
+                                                   'buckets': [{'le': 0.1, 'count': 0}, {'le': 1.0, 'count': 0}],
+                                                   'overflow': 0})
+
+    def test_observe(self):
+        histogram = Histogram(buckets=(1.0, 0.1))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        histogram_json = histogram.as_json()
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram_json['count'], 4)
+        self.assertAlmostEqual(histogram_json['sum'], 2.65)
+        self.assertAlmostEqual(histogram_json['mean'], 0.6625)
+        self.assertEqual(histogram_json['min'], 0.05)
+        self.assertEqual(histogram_json['max'], 2.0)
+        self.assertListEqual(histogram_json['buckets'], [{'le': 0.1, 'count': 2}, {'le': 1.0, 'count': 1}])
+        self.assertEqual(histogram_json['overflow'], 1)
+
+    def test_percentile(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for _ in range(90):
+            histogram.observe(0.01)
+        for _ in range(9):
+            histogram.observe(0.5)
+        histogram.observe(5.0)
+        self.assertEqual(histogram.percentile(0.5), 0.1)
+        self.assertEqual(histogram.percentile(0.95), 1.0)
+        self.assertEqual(histogram.percentile(1.0), 5.0)
+
+    def test_percentile_capped_at_max(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        histogram.observe(0.02)
+        self.assertEqual(histogram.percentile(0.5), 0.02)
+
+    def test_observe_from_threads(self):
+        histogram = Histogram()
+
+        def observe():
+            for _ in range(1000):
+                histogram.observe(0.01)
+
+        threads = [threading.Thread(target=observe) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(histogram.count, 4000)
+
+
+class TestGauge(unittest.TestCase):
+    def test_init(self):
+        self.assertDictEqual(Gauge().as_json(), {'value': 0, 'max': 0})
+        self.assertDictEqual(Gauge(3).as_json(), {'value': 3, 'max': 3})
+
+    def test_set(self):
+        gauge = Gauge()
+        gauge.set(5)
+        gauge.set(2)
+        self.assertEqual(gauge.value, 2)
+        self.assertDictEqual(gauge.as_json(), {'value': 2, 'max': 5})
+
+    def test_inc_dec(self):
+        gauge = Gauge()
+        gauge.inc()
+        gauge.inc(3)
+        gauge.dec(2)
+        self.assertDictEqual(gauge.as_json(), {'value': 2, 'max': 4})
@@ -2,6 +2,7 @@ import json
 from datetime import timedelta
 
 import server.metrics as metrics
+from core.instrumentation import Histogram, Gauge
 from server import flaskserver as server
 from server.endpoints.metrics import _convert_action_time_averages, _convert_workflow_time_averages
 from tests import config
@@ -125,3 +126,21 @@ class MetricsServerTest(ServerTestCase):
         self.assertEqual(response.status_code, 200)
         response = json.loads(response.get_data(as_text=True))
         self.assertDictEqual(response, _convert_workflow_time_averages())
+
+    def test_executor_metrics(self):
+        server.running_context.controller.initialize_threading()
+        dispatch_metrics = {'queue_wait': Histogram().as_json(), 'dispatch_latency': Histogram().as_json(),
+                            'queue_depth': Gauge().as_json(),
+                            'workers': [{'id': 'Worker-1', 'workflows': 3, 'busy_time': 1.5, 'idle_time': 10.0}]}
+        server.running_context.controller.executor.manager.get_dispatch_metrics = lambda: dispatch_metrics
+        response = self.app.get('/metrics/executor', headers=self.headers)
+        server.running_context.controller.shutdown_pool()
+        self.assertEqual(response.status_code, 200)
+        self.assertDictEqual(json.loads(response.get_data(as_text=True)), dispatch_metrics)
+
+    def test_worker_metrics(self):
+        metrics.worker_metrics = {'spawned': 5, 'retired': 2, 'crashed': 1}
+        response = self.app.get('/metrics/workers', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        response = json.loads(response.get_data(as_text=True))
+        self.assertDictEqual(response, {'spawned': 5, 'retired': 2, 'crashed': 1})
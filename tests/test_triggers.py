@@ -4,6 +4,7 @@ import apps
 import core.config.config
 from core.case import callbacks
 from core.helpers import import_all_filters, import_all_flags
+from core.workflowqueue import QueueFull
 from server import flaskserver as server
 from server.returncodes import *
 from server.triggers import Triggers
@@ -251,6 +252,28 @@ class TestTriggers(ServerTestCase):
         self.assertEqual(response['executed'][0]['name'], 'testTrigger')
         self.assertListEqual(response['errors'], [])
 
+    def test_trigger_execute_queue_full(self):
+        server.running_context.controller.initialize_threading()
+        condition = {"action": 'regMatch', "args": [{'name': 'regex', 'value': '(.*)'}], "filters": []}
+        data = {"playbook": "test",
+                "workflow": self.test_trigger_workflow,
+                "conditions": [condition]}
+        self.put_with_status_check('/execution/listener/triggers/{0}'.format(self.test_trigger_name),
+                                   headers=self.headers, data=json.dumps(data), status_code=OBJECT_CREATED, content_type='application/json')
+
+        def reject_workflow(workflow_json, priority=None, playbook_name=None, failure_policy=None):
+            raise QueueFull('Workflow queue is full', retry_after=3)
+
+        server.running_context.controller.executor.manager.add_workflow = reject_workflow
+        response = self.app.post('/api/triggers/execute', headers=self.headers,
+                                 data=json.dumps({"data": "hellohellohello"}), content_type='application/json')
+        server.running_context.controller.shutdown_pool()
+        self.assertEqual(response.status_code, SERVICE_UNAVAILABLE)
+        self.assertEqual(response.headers['Retry-After'], '3')
+        response = json.loads(response.get_data(as_text=True))
+        self.assertListEqual(response['executed'], [])
+        self.assertListEqual(response['errors'], [{self.test_trigger_name: "Workflow queue is full."}])
+
     def test_trigger_execute_invalid_name(self):
         condition = {"action": 'regMatch', "args": [{'name': 'regex', 'value': '(.*)'}], "filters": []}
         data = {"playbook": "test",
@@ -0,0 +1,190 @@
+import threading
+import time
+import unittest
+
+from core.workflowqueue import WorkflowQueue, UnknownPriority, QueueFull
+
+try:
+    from Queue import Empty
+except ImportError:
+    from queue import Empty
+
+
+class TestWorkflowQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = self.create_queue()
+        self.num_queued = 0
+
+    @staticmethod
+    def create_queue(max_size=0, overflow_policy='reject', block_timeout=0.1):
+        return WorkflowQueue(priority_weights={'high': 16, 'normal': 4, 'low': 1}, share_weights={},
+                             default_priority='normal', max_size=max_size, overflow_policy=overflow_policy,
+                             block_timeout=block_timeout)
+
+    def put(self, priority=None, share=None):
+        uid = 'workflow{}'.format(self.num_queued)
+        self.num_queued += 1
+        self.queue.put({'execution_uid': uid}, priority=priority, share=share)
+        return uid
+
+    def get(self):
+        return self.queue.get()['execution_uid']
+
+    def test_init_unknown_default_priority(self):
+        with self.assertRaises(UnknownPriority):
+            WorkflowQueue(priority_weights={'high': 2}, share_weights={}, default_priority='normal')
+
+    def test_get_empty(self):
+        self.assertTrue(self.queue.empty())
+        with self.assertRaises(Empty):
+            self.queue.get()
+
+    def test_put_unknown_priority(self):
+        with self.assertRaises(UnknownPriority):
+            self.put(priority='urgent')
+        self.assertTrue(self.queue.empty())
+
+    def test_fifo_within_class_and_share(self):
+        uids = [self.put() for _ in range(5)]
+        self.assertEqual(self.queue.qsize(), 5)
+        self.assertListEqual([self.get() for _ in range(5)], uids)
+        self.assertTrue(self.queue.empty())
+
+    def test_priority_classes_weighted(self):
+        low = [self.put(priority='low') for _ in range(20)]
+        high = [self.put(priority='high') for _ in range(20)]
+        order = [self.get() for _ in range(17)]
+        self.assertEqual(len([uid for uid in order if uid in high]), 16)
+        self.assertEqual(len([uid for uid in order if uid in low]), 1)
+
+    def test_low_priority_not_starved(self):
+        low = self.put(priority='low')
+        for _ in range(100):
+            self.put(priority='high')
+        order = [self.get() for _ in range(101)]
+        self.assertLess(order.index(low), 18)
+
+    def test_fair_share_between_playbooks(self):
+        flood = [self.put(share='flood') for _ in range(10)]
+        other = [self.put(share='other') for _ in range(2)]
+        order = [self.get() for _ in range(12)]
+        self.assertLess(order.index(other[0]), 2)
+        self.assertLess(order.index(other[1]), 4)
+        self.assertListEqual([uid for uid in order if uid in flood], flood)
+
+    def test_playbook_weights(self):
+        queue = WorkflowQueue(priority_weights={'normal': 1}, share_weights={'heavy': 3}, default_priority='normal')
+        for i in range(8):
+            queue.put({'execution_uid': 'heavy{}'.format(i)}, share='heavy')
+            queue.put({'execution_uid': 'light{}'.format(i)}, share='light')
+        order = [queue.get()['execution_uid'] for _ in range(8)]
+        self.assertEqual(len([uid for uid in order if uid.startswith('heavy')]), 6)
+
+    def test_high_priority_wait_bounded_under_flood(self):
+        for _ in range(500):
+            self.put(priority='low', share='scheduled')
+        waits = []
+        for dispatch in range(200):
+            if dispatch % 10 == 0:
+                high = self.put(priority='high', share='interactive')
+                queued_at = dispatch
+            if self.get() == high:
+                waits.append(dispatch - queued_at)
+        self.assertEqual(len(waits), 20)
+        self.assertLessEqual(max(waits), 1)
+
+    def test_position(self):
+        low = [self.put(priority='low') for _ in range(3)]
+        high = [self.put(priority='high') for _ in range(3)]
+        uids = low + high
+        positions = {uid: self.queue.position(uid) for uid in uids}
+        self.assertListEqual(sorted(positions.values()), list(range(6)))
+        order = [self.get() for _ in range(6)]
+        for uid in uids:
+            self.assertEqual(order.index(uid), positions[uid])
+
+    def test_position_not_queued(self):
+        uid = self.put()
+        self.assertIsNone(self.queue.position('invalid'))
+        self.get()
+        self.assertIsNone(self.queue.position(uid))
+
+    def test_get_stats(self):
+        self.put(priority='high')
+        self.put(priority='high')
+        self.put(priority='low')
+        self.get()
+        stats = self.queue.get_stats()
+        self.assertSetEqual(set(stats.keys()), {'high', 'normal', 'low'})
+        self.assertEqual(stats['high']['weight'], 16)
+        self.assertEqual(stats['high']['queued'], 1)
+        self.assertEqual(stats['high']['dispatched'], 1)
+        self.assertGreaterEqual(stats['high']['max_wait'], stats['high']['avg_wait'])
+        self.assertEqual(stats['low']['queued'], 1)
+        self.assertEqual(stats['normal'], {'weight': 4, 'queued': 0, 'dispatched': 0, 'avg_wait': 0.0,
+                                           'max_wait': 0.0})
+
+    def test_wait_times_and_depth(self):
+        self.put()
+        self.put()
+        self.put()
+        self.get()
+        self.assertEqual(self.queue.wait_times.count, 1)
+        self.assertDictEqual(self.queue.depth.as_json(), {'value': 2, 'max': 3})
+        self.get()
+        self.get()
+        self.assertEqual(self.queue.wait_times.count, 3)
+        self.assertDictEqual(self.queue.depth.as_json(), {'value': 0, 'max': 3})
+
+    def test_init_unknown_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            self.create_queue(overflow_policy='ignore')
+
+    def test_put_full_reject(self):
+        self.queue = self.create_queue(max_size=2)
+        self.put()
+        self.put()
+        with self.assertRaises(QueueFull):
+            self.put(priority='high')
+        self.assertEqual(self.queue.qsize(), 2)
+        stats = self.queue.get_admission_stats()
+        self.assertDictEqual(stats, {'queued': 2, 'max_queued': 2, 'policy': 'reject', 'rejected': 1, 'dropped': 0,
+                                     'blocked': 0})
+
+    def test_put_full_drop_oldest(self):
+        self.queue = self.create_queue(max_size=2, overflow_policy='drop_oldest')
+        oldest = self.put(priority='low')
+        second = self.put(priority='high')
+        newest = self.put(priority='normal')
+        self.assertEqual(self.queue.qsize(), 2)
+        self.assertIsNone(self.queue.position(oldest))
+        self.assertSetEqual({self.get(), self.get()}, {second, newest})
+        self.assertTrue(self.queue.empty())
+        self.assertEqual(self.queue.get_admission_stats()['dropped'], 1)
+
+    def test_put_full_drop_oldest_returns_dropped(self):
+        self.queue = self.create_queue(max_size=1, overflow_policy='drop_oldest')
+        self.assertIsNone(self.queue.put({'execution_uid': 'first'}))
+        self.assertDictEqual(self.queue.put({'execution_uid': 'second'}), {'execution_uid': 'first'})
+
+    def test_put_full_block_timeout(self):
+        self.queue = self.create_queue(max_size=1, overflow_policy='block', block_timeout=0.1)
+        self.put()
+        start = time.time()
+        with self.assertRaises(QueueFull):
+            self.put()
+        self.assertGreaterEqual(time.time() - start, 0.1)
+        stats = self.queue.get_admission_stats()
+        self.assertEqual(stats['blocked'], 1)
+        self.assertEqual(stats['rejected'], 1)
+
+    def test_put_full_block_until_room(self):
+        self.queue = self.create_queue(max_size=1, overflow_policy='block', block_timeout=5)
+        first = self.put()
+        timer = threading.Timer(0.1, self.queue.get)
+        timer.start()
+        second = self.put()
+        timer.join()
+        self.assertIsNone(self.queue.position(first))
+        self.assertEqual(self.queue.position(second), 0)
+        self.assertEqual(self.queue.get_admission_stats()['rejected'], 0)
@@ -10,6 +10,7 @@ import core.config.paths
 from core import helpers
 from core.case.callbacks import WorkflowShutdown
 from core.executionelements.step import Step
+from core.workflowqueue import QueueFull
 from server import flaskserver as flask_server
 from server.returncodes import *
 from tests.util.assertwrappers import orderless_list_compare
@@ -548,6 +549,38 @@ class TestWorkflowServer(ServerTestCase):
                                     error='Playbook or workflow does not exist.',
                                     headers=self.headers, status_code=OBJECT_DNE_ERROR)
 
+    def test_execute_workflow_unknown_priority(self):
+        flask_server.running_context.controller.initialize_threading()
+        self.post_with_status_check('/api/playbooks/test/workflows/helloWorldWorkflow/execute?priority=urgent',
+                                    error='Unknown priority.',
+                                    headers=self.headers, status_code=INVALID_INPUT_ERROR)
+        self.assertDictEqual(flask_server.running_context.controller.executor.workflow_status, {})
+
+    def test_execute_workflow_queue_full(self):
+        flask_server.running_context.controller.initialize_threading()
+
+        def reject_workflow(workflow_json, priority=None, playbook_name=None, failure_policy=None):
+            raise QueueFull('Workflow queue is full', retry_after=7)
+
+        flask_server.running_context.controller.executor.manager.add_workflow = reject_workflow
+        response = self.app.post('/api/playbooks/test/workflows/helloWorldWorkflow/execute', headers=self.headers)
+        self.assertEqual(response.status_code, SERVICE_UNAVAILABLE)
+        self.assertEqual(response.headers['Retry-After'], '7')
+        self.assertDictEqual(json.loads(response.get_data(as_text=True)),
+                             {'error': 'Workflow queue is full.', 'retry_after': 7})
+        self.assertDictEqual(flask_server.running_context.controller.executor.workflow_status, {})
+
+    def test_read_workflow_queue(self):
+        flask_server.running_context.controller.initialize_threading()
+        response = self.get_with_status_check('/api/workflowqueue', headers=self.headers)
+        self.assertIn('priorities', response)
+        self.assertIn('admission', response)
+
+    def test_read_queued_workflow_not_queued(self):
+        flask_server.running_context.controller.initialize_threading()
+        self.get_with_status_check('/api/workflowqueue/junkuid', error='Workflow is not queued.',
+                                   headers=self.headers, status_code=OBJECT_DNE_ERROR)
+
     def test_execute_workflow(self):
         flask_server.running_context.controller.initialize_threading()
         sync = Event()
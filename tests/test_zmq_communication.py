@@ -1,3 +1,5 @@
+import os
+import signal
 import threading
 import time
 import unittest
@@ -6,8 +8,10 @@ from os import path
 import apps
 import core.config.config
 import core.controller
-from core.case.callbacks import WorkflowExecutionStart, WorkflowPaused, WorkflowResumed
+from core.case.callbacks import WorkflowExecutionStart, WorkflowPaused, WorkflowResumed, WorkflowShutdown, \
+    WorkerRetired, WorkerCrashed
 from core.helpers import import_all_filters, import_all_flags
+from core.loadbalancer import get_workflow_hash
 from tests import config
 from tests.util.case_db_help import *
 from tests.util.thread_control import modified_setup_worker_env
@@ -22,6 +26,7 @@ class TestZMQCommunication(unittest.TestCase):
         core.config.config.filters = import_all_filters('tests.util.flagsfilters')
         core.config.config.load_flagfilter_apis(path=config.function_api_path)
         core.config.config.num_processes = 2
+        core.config.config.worker_concurrency = 2
 
     def setUp(self):
         self.controller = core.controller.controller
@@ -41,6 +46,7 @@ class TestZMQCommunication(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
+        core.config.config.worker_concurrency = 1
         apps.clear_cache()
 
     '''Request and Result Socket Testing (Basic Workflow Execution)'''
@@ -118,6 +124,96 @@ class TestZMQCommunication(unittest.TestCase):
         for result in [step['data']['result'] for step in steps]:
             self.assertIn(result, expected_results)
 
+    def test_execute_with_priorities(self):
+        result = {'shutdown': 0}
+
+        @WorkflowShutdown.connect
+        def workflow_shutdown_listener(sender, **kwargs):
+            result['shutdown'] += 1
+
+        self.controller.execute_workflow('basicWorkflowTest', 'helloWorldWorkflow', priority='low')
+        self.controller.execute_workflow('basicWorkflowTest', 'helloWorldWorkflow', priority='high')
+        self.controller.shutdown_pool(2)
+        self.assertEqual(result['shutdown'], 2)
+
+    def execute_and_wait(self, playbook_name, workflow_name):
+        done = threading.Event()
+
+        def workflow_shutdown_listener(sender, **kwargs):
+            done.set()
+
+        WorkflowShutdown.connect(workflow_shutdown_listener)
+        self.controller.execute_workflow(playbook_name, workflow_name)
+        self.assertTrue(done.wait(timeout=10))
+        WorkflowShutdown.disconnect(workflow_shutdown_listener)
+        # The worker reports that its slot is free again just after the workflow shuts down
+        self.assertTrue(self.wait_for_free_slots())
+
+    def test_cached_workflow_execution(self):
+        workflow = self.controller.get_workflow('basicWorkflowTest', 'helloWorldWorkflow')
+        step_uids = [step.uid for step in workflow.steps.values() if step.name == 'start']
+        setup_subscriptions_for_step(workflow.uid, step_uids)
+        self.assertTrue(self.wait_for_workers(self.controller.executor.count_workers()))
+
+        for _ in range(3):
+            self.execute_and_wait('basicWorkflowTest', 'helloWorldWorkflow')
+        stats = self.controller.executor.manager.get_pool_stats()
+        self.controller.shutdown_pool()
+
+        # Idle workers are picked in the same order, so the workflow is only sent in full to the first one
+        self.assertEqual(stats['cache_misses'], 1)
+        self.assertEqual(stats['cache_hits'], 2)
+        steps = []
+        for uid in step_uids:
+            steps.extend(executed_steps(uid, self.start, datetime.utcnow()))
+        self.assertEqual(len(steps), 3)
+        for step in steps:
+            self.assertDictEqual(step['data']['result'], {'result': "REPEATING: Hello World", 'status': 'Success'})
+
+    def test_uncached_workflow_sent_on_miss(self):
+        workflow = self.controller.get_workflow('basicWorkflowTest', 'helloWorldWorkflow')
+        manager = self.controller.executor.manager
+        self.assertTrue(self.wait_for_workers(self.controller.executor.count_workers()))
+
+        # Make the manager believe that every worker has the workflow cached when none of them do
+        workflow_hash = get_workflow_hash(workflow.read())
+        for cache in manager.worker_caches.values():
+            cache[workflow_hash] = True
+
+        self.execute_and_wait('basicWorkflowTest', 'helloWorldWorkflow')
+        stats = manager.get_pool_stats()
+        self.controller.shutdown_pool()
+        self.assertEqual(stats['cache_hits'], 1)
+        self.assertEqual(stats['cache_misses'], 1)
+
+    def test_dispatch_metrics(self):
+        manager = self.controller.executor.manager
+        num_workers = self.controller.executor.count_workers()
+        self.assertTrue(self.wait_for_workers(num_workers))
+
+        for _ in range(3):
+            self.execute_and_wait('basicWorkflowTest', 'helloWorldWorkflow')
+        # Wait for the workers to report that they are done and how busy they have been
+        time.sleep(manager.heartbeat_interval * 2)
+        dispatch_metrics = self.controller.executor.get_dispatch_metrics()
+        self.controller.shutdown_pool()
+
+        self.assertEqual(dispatch_metrics['queue_wait']['count'], 3)
+        self.assertEqual(dispatch_metrics['dispatch_latency']['count'], 3)
+        self.assertGreater(dispatch_metrics['dispatch_latency']['sum'], 0)
+        self.assertEqual(dispatch_metrics['queue_depth']['value'], 0)
+        self.assertGreaterEqual(dispatch_metrics['queue_depth']['max'], 1)
+        self.assertEqual(len(dispatch_metrics['workers']), num_workers)
+        self.assertEqual(sum(worker['workflows'] for worker in dispatch_metrics['workers']), 3)
+        self.assertGreater(sum(worker['busy_time'] for worker in dispatch_metrics['workers']), 0)
+        for worker in dispatch_metrics['workers']:
+            self.assertGreater(worker['idle_time'], 0)
+        sinks = dispatch_metrics['callback_sinks']
+        self.assertSetEqual(set(sinks), {'cases', 'results', 'metrics', 'streams', 'default'})
+        # The executor and the load balancer listen to every Workflow Shutdown and Workflow Execution Start
+        self.assertGreaterEqual(sinks['default']['handled'], 6)
+        self.assertEqual(sinks['default']['lag']['count'], sinks['default']['handled'])
+
     '''Communication Socket Testing'''
 
     def test_pause_and_resume_workflow(self):
@@ -150,3 +246,127 @@ class TestZMQCommunication(unittest.TestCase):
         self.controller.shutdown_pool(1)
         self.assertTrue(result['paused'])
         self.assertTrue(result['resumed'])
+
+    def test_concurrent_workflows_in_worker(self):
+        self.controller.load_playbook(resource=path.join(config.test_workflows_path, 'pauseWorkflowTest.playbook'))
+
+        result = {'started_before_shutdown': 0, 'shutdown': False}
+        lock = threading.Lock()
+
+        @WorkflowExecutionStart.connect
+        def workflow_started_listener(sender, **kwargs):
+            with lock:
+                if not result['shutdown']:
+                    result['started_before_shutdown'] += 1
+
+        @WorkflowShutdown.connect
+        def workflow_shutdown_listener(sender, **kwargs):
+            with lock:
+                result['shutdown'] = True
+
+        # Two workers with two slots each should start all four workflows before any of them finishes
+        for _ in range(4):
+            self.controller.execute_workflow('pauseWorkflowTest', 'pauseWorkflow')
+        self.controller.shutdown_pool(4)
+        self.assertEqual(result['started_before_shutdown'], 4)
+
+    '''Worker Pool Testing'''
+
+    def wait_for_workers(self, num_workers, timeout=10):
+        start = time.time()
+        while time.time() - start < timeout:
+            if self.controller.executor.manager.get_pool_stats()['workers'] == num_workers:
+                return True
+            time.sleep(0.1)
+        return False
+
+    def wait_for_free_slots(self, timeout=10):
+        start = time.time()
+        while time.time() - start < timeout:
+            stats = self.controller.executor.manager.get_pool_stats()
+            if stats['free_slots'] == stats['total_slots']:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_spawn_and_retire_worker(self):
+        num_workers = self.controller.executor.count_workers()
+        self.assertTrue(self.wait_for_workers(num_workers))
+
+        self.controller.executor.spawn_worker()
+        self.assertTrue(self.wait_for_workers(num_workers + 1))
+
+        retired = threading.Event()
+
+        @WorkerRetired.connect
+        def worker_retired_listener(sender, **kwargs):
+            retired.set()
+
+        self.controller.executor.retire_worker()
+        self.assertTrue(retired.wait(timeout=10))
+        self.assertEqual(self.controller.executor.manager.get_pool_stats()['workers'], num_workers)
+
+        # The retired worker process exits by itself
+        start = time.time()
+        while self.controller.executor.count_workers() > num_workers and time.time() - start < 10:
+            time.sleep(0.1)
+        self.assertEqual(self.controller.executor.count_workers(), num_workers)
+        self.controller.shutdown_pool()
+
+    def execute_and_stop_worker(self, stop_signal, failure_policy=None):
+        self.controller.load_playbook(resource=path.join(config.test_workflows_path, 'pauseWorkflowTest.playbook'))
+        executor = self.controller.executor
+        self.assertTrue(self.wait_for_workers(executor.count_workers()))
+        result = {'started': 0, 'shutdown': []}
+        started = threading.Event()
+        shutdown = threading.Event()
+        crashed = threading.Event()
+
+        @WorkflowExecutionStart.connect
+        def workflow_started_listener(sender, **kwargs):
+            result['started'] += 1
+            started.set()
+
+        @WorkflowShutdown.connect
+        def workflow_shutdown_listener(sender, **kwargs):
+            result['shutdown'].append(kwargs.get('data', None))
+            shutdown.set()
+
+        @WorkerCrashed.connect
+        def worker_crashed_listener(sender, **kwargs):
+            crashed.set()
+
+        uid = self.controller.execute_workflow('pauseWorkflowTest', 'pauseWorkflow', failure_policy=failure_policy)
+        self.assertTrue(started.wait(timeout=10))
+        worker = executor.manager.workflow_comms[uid].decode('ascii')
+        pid = next(pid for pid in executor.pids if pid.name == worker)
+        os.kill(pid.pid, stop_signal)
+
+        self.assertTrue(crashed.wait(timeout=10))
+        self.assertTrue(shutdown.wait(timeout=10))
+        stats = executor.manager.get_pool_stats()
+        self.assertTrue(self.wait_for_workers(executor.count_workers()))
+        self.assertNotIn(pid, executor.pids)
+        self.assertNotIn(uid, executor.workflow_status)
+        self.controller.shutdown_pool()
+        return result, stats
+
+    def test_crashed_worker_workflow_requeued(self):
+        result, stats = self.execute_and_stop_worker(signal.SIGKILL, failure_policy='requeue')
+        self.assertEqual(result['started'], 2)
+        self.assertEqual(len(result['shutdown']), 1)
+        self.assertNotIn('error', result['shutdown'][0])
+        self.assertEqual(stats['requeued'], 1)
+
+    def test_crashed_worker_workflow_failed(self):
+        result, stats = self.execute_and_stop_worker(signal.SIGKILL, failure_policy='fail')
+        self.assertEqual(result['started'], 1)
+        self.assertEqual(len(result['shutdown']), 1)
+        self.assertIn('exited unexpectedly', result['shutdown'][0]['error'])
+        self.assertEqual(stats['failed'], 1)
+
+    def test_unresponsive_worker_replaced(self):
+        self.controller.executor.manager.heartbeat_timeout = 2
+        result, stats = self.execute_and_stop_worker(signal.SIGSTOP)
+        self.assertEqual(result['started'], 2)
+        self.assertEqual(stats['requeued'], 1)
@@ -4,9 +4,11 @@ import time
 
 from zmq.utils.strtypes import cast_unicode
 
+import core.config.config
 from core import loadbalancer
 from core.case.callbacks import data_sent
 from core.protobuf.build import data_pb2
+from core.workflowqueue import UnknownPriority
 
 try:
     from Queue import Queue
@@ -80,9 +82,25 @@ class MockLoadBalancer(object):
         sender = message.sender
         self.results_queue.send(sender, kwargs)
 
-    def add_workflow(self, workflow_json):
+    def add_workflow(self, workflow_json, priority=None, playbook_name=None, failure_policy=None):
+        if priority is not None and priority not in core.config.config.workflow_priority_weights:
+            raise UnknownPriority('Unknown workflow priority {0}'.format(priority))
+        if failure_policy is not None and failure_policy not in loadbalancer.WORKER_FAILURE_POLICIES:
+            raise ValueError('Unknown worker failure policy {0}'.format(failure_policy))
         self.pending_workflows.put(workflow_json)
 
+    def get_queue_position(self, execution_uid):
+        return None
+
+    def get_queue_stats(self):
+        return {}
+
+    def get_admission_stats(self):
+        return {}
+
+    def get_dispatch_metrics(self):
+        return {}
+
     def manage_workflows(self):
         while True:
             workflow_json = self.pending_workflows.recv()